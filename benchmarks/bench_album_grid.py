@@ -0,0 +1,95 @@
+"""Benchmark: frame times and thumbnail memory while scrolling the album grid."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt6.QtGui import QColor, QImage, QLinearGradient, QPainter
+from PyQt6.QtWidgets import QApplication
+
+from app.front_end.album_grid_view import AlbumGridView
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _cover_jpeg(size: int) -> bytes:
+    image = QImage(size, size, QImage.Format.Format_RGB32)
+    gradient = QLinearGradient(0, 0, size, size)
+    gradient.setColorAt(0, QColor("#1d3557"))
+    gradient.setColorAt(1, QColor("#e63946"))
+    painter = QPainter(image)
+    painter.fillRect(image.rect(), gradient)
+    painter.end()
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "JPEG", 90)
+    return bytes(data)
+
+
+class _SyntheticLibrary:
+    def __init__(self, album_count: int) -> None:
+        self._album_count = album_count
+
+    def list_album_covers(self):
+        return [(f"Artist {index // 8}", f"Album {index}", 12, f"/music/{index}/01.flac") for index in range(self._album_count)]
+
+
+def run(album_count: int, cover_size: int, step_px: int) -> None:
+    app = QApplication.instance() or QApplication([])
+    cover = _cover_jpeg(cover_size)
+    reads = 0
+
+    def read_artwork(path: str, cancel_flag=None) -> bytes:
+        nonlocal reads
+        reads += 1
+        return cover
+
+    view = AlbumGridView(_SyntheticLibrary(album_count), read_artwork)
+    view.resize(1000, 700)
+    view.show()
+    view.reload()
+    app.processEvents()
+
+    scroll_bar = view.list_view.verticalScrollBar()
+    frames_ms = []
+    peak_bytes = 0
+    for value in range(0, scroll_bar.maximum() + step_px, step_px):
+        started = time.perf_counter()
+        scroll_bar.setValue(value)
+        view.list_view.viewport().repaint()
+        app.processEvents()
+        frames_ms.append((time.perf_counter() - started) * 1000)
+        peak_bytes = max(peak_bytes, view.thumbnail_loader.cache.total_bytes)
+
+    frames_ms.sort()
+    print(f"albums: {album_count:,} ({cover_size} px covers, {step_px} px per frame)")
+    print(f"  frames       {len(frames_ms):,}")
+    print(f"  median       {statistics.median(frames_ms):8.2f} ms")
+    print(f"  p95          {frames_ms[int(len(frames_ms) * 0.95)]:8.2f} ms")
+    print(f"  max          {frames_ms[-1]:8.2f} ms")
+    print(f"  artwork reads {reads:,}")
+    print(f"  cache peak   {peak_bytes / 1024 / 1024:8.1f} MiB (limit {AlbumGridView.THUMBNAIL_CACHE_BYTES / 1024 / 1024:.0f} MiB)")
+    view.thumbnail_loader.shutdown()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--albums", type=int, default=5_000)
+    parser.add_argument("--cover-size", type=int, default=1_000)
+    parser.add_argument("--step-px", type=int, default=120)
+    args = parser.parse_args()
+    run(args.albums, args.cover_size, args.step_px)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
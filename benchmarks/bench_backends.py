@@ -0,0 +1,134 @@
+"""Benchmark: native vs pure-Python backend, sequential vs async vs batched reads, and backend resolution cost."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.back_end.services import python_backend, rust_bridge
+from app.back_end.services.library_importer import LibraryImporter
+
+INGEST_BATCH_SIZE = LibraryImporter.DEFAULT_BATCH_SIZE
+
+
+def _build_library(root: Path, track_count: int) -> list[str]:
+    tracks = []
+    for index in range(track_count):
+        album = root / f"Artist {index // 200:03d}" / f"Album {index // 20:04d}"
+        album.mkdir(parents=True, exist_ok=True)
+        track = album / f"{index % 20 + 1:02d} - Track {index}.flac"
+        track.write_bytes(b"")
+        (album / f"{track.name}.musicmeta.json").write_text(
+            json.dumps({"title": f"Track {index}", "artist": album.parent.name, "album": album.name})
+        )
+        if index % 20 == 0:
+            (album / "cover.jpg").write_bytes(b"\xff\xd8" + bytes(32_768))
+        tracks.append(str(track))
+    return tracks
+
+
+def _time(function, *args) -> float:
+    started = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - started) * 1000
+
+
+def _run_operations(label: str, root: Path, tracks: list[str]) -> None:
+    def read_all() -> None:
+        for track in tracks:
+            rust_bridge.read_metadata(track)
+
+    def artwork_all() -> None:
+        for track in tracks:
+            rust_bridge.extract_artwork(track)
+
+    def per_file_ingest() -> None:
+        # What an import pass needed before ingest: a stat, a metadata read
+        # and an artwork read per file.
+        for track in tracks:
+            os.stat(track)
+            rust_bridge.read_metadata(track)
+            rust_bridge.extract_artwork(track)
+
+    def batched_ingest() -> None:
+        for start in range(0, len(tracks), INGEST_BATCH_SIZE):
+            rust_bridge.ingest(tracks[start : start + INGEST_BATCH_SIZE])
+
+    def read_all_async() -> None:
+        async def gather() -> None:
+            async with rust_bridge.AsyncBridge() as bridge:
+                await asyncio.gather(*(bridge.read_metadata(track) for track in tracks))
+
+        asyncio.run(gather())
+
+    print(f"  {label}")
+    print(f"    scan_library     {_time(rust_bridge.scan_library, [str(root)]):9.1f} ms")
+    print(f"    read_metadata    {_time(read_all):9.1f} ms")
+    print(f"      async x{rust_bridge.AsyncBridge.DEFAULT_MAX_CONCURRENCY}       {_time(read_all_async):9.1f} ms")
+    print(f"    extract_artwork  {_time(artwork_all):9.1f} ms")
+    print(f"    per-file ingest  {_time(per_file_ingest):9.1f} ms")
+    print(f"    ingest x{INGEST_BATCH_SIZE}      {_time(batched_ingest):9.1f} ms")
+
+
+def _resolution_overhead(calls: int) -> None:
+    # Before the backend was cached, every bridge call ran import_module; when
+    # the native build is missing that means a full sys.path search each time.
+    def per_call_import() -> None:
+        for _ in range(calls):
+            try:
+                rust_bridge._load_rust_backend_module()
+            except RuntimeError:
+                pass
+
+    def cached() -> None:
+        for _ in range(calls):
+            rust_bridge._load_backend()
+
+    per_call_ms = _time(per_call_import)
+    cached_ms = _time(cached)
+    print(f"backend resolution x{calls:,}")
+    print(f"  import per call  {per_call_ms:9.1f} ms ({per_call_ms * 1000 / calls:7.2f} us/call)")
+    print(f"  resolved once    {cached_ms:9.1f} ms ({cached_ms * 1000 / calls:7.2f} us/call)")
+
+
+def run(track_count: int, calls: int) -> None:
+    try:
+        native = rust_bridge._load_rust_backend_module()
+    except RuntimeError:
+        native = None
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        tracks = _build_library(root, track_count)
+        print(f"tracks: {track_count:,}")
+        if native is not None:
+            rust_bridge.use_backend(native)
+            _run_operations("native", root, tracks)
+        else:
+            print("  native           not installed")
+        rust_bridge.use_backend(python_backend)
+        _run_operations("python", root, tracks)
+        rust_bridge.use_backend(None)
+
+    _resolution_overhead(calls)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=5_000)
+    parser.add_argument("--calls", type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.tracks, args.calls)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""Benchmark: CPU spent on playback position UI updates, before and after coalescing."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt6.QtCore import QElapsedTimer, QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from app.front_end.now_playing_bar import NowPlayingBar
+from app.front_end.position_coalescer import PositionUpdateCoalescer
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+TRACK_DURATION_MS = 240_000
+
+
+def _direct_update(bar: NowPlayingBar):
+    # The pre-coalescing path: every tick re-renders slider and label.
+    def update(position_ms: int) -> None:
+        bar.seek_slider.setValue(position_ms)
+        bar.current_time_label.setText(bar._format_ms(position_ms))
+
+    return update
+
+
+def _simulate_playback(on_tick, seconds: float, tick_ms: int) -> tuple[float, int]:
+    clock = QElapsedTimer()
+    ticker = QTimer()
+    ticker.setInterval(tick_ms)
+    ticks = 0
+
+    def tick() -> None:
+        nonlocal ticks
+        ticks += 1
+        on_tick(clock.elapsed() % TRACK_DURATION_MS)
+
+    ticker.timeout.connect(tick)
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+
+    clock.start()
+    cpu_started = time.process_time()
+    ticker.start()
+    loop.exec()
+    ticker.stop()
+    return (time.process_time() - cpu_started) * 1000, ticks
+
+
+def run(seconds: float, tick_ms: int) -> None:
+    app = QApplication.instance() or QApplication([])
+    bar = NowPlayingBar()
+    bar.resize(900, 116)
+    bar.set_track_duration_ms(TRACK_DURATION_MS)
+    bar.show()
+    app.processEvents()
+
+    coalescer = PositionUpdateCoalescer(bar.set_playback_position_ms)
+    scenarios = [
+        ("direct (before)", _direct_update(bar), False),
+        ("coalesced, visible", coalescer.submit, False),
+        ("coalesced, hidden", coalescer.submit, True),
+    ]
+
+    print(f"{seconds:.0f} s of playback, position tick every {tick_ms} ms")
+    for label, on_tick, hidden in scenarios:
+        coalescer.set_suspended(hidden)
+        cpu_ms, ticks = _simulate_playback(on_tick, seconds, tick_ms)
+        print(f"  {label:<20} {cpu_ms:8.1f} ms CPU for {ticks:,} ticks ({cpu_ms / seconds / 10:5.2f}% of one core)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--tick-ms", type=int, default=10)
+    args = parser.parse_args()
+    run(args.seconds, args.tick_ms)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
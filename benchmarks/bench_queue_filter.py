@@ -0,0 +1,118 @@
+"""Benchmark: per-keystroke latency of the queue filter: trigram search, then narrowing the table model."""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt6.QtCore import QCoreApplication
+
+from app.back_end.services.trigram_index import TrigramIndex
+from app.front_end.track_list_model import TrackListModel
+
+
+def _vocabulary(rng: random.Random, size: int) -> list[str]:
+    consonants = "bcdfghjklmnprstvwz"
+    vowels = "aeiou"
+    words = set()
+    while len(words) < size:
+        syllables = rng.randint(1, 4)
+        words.add("".join(rng.choice(consonants) + rng.choice(vowels) for _ in range(syllables)))
+    return sorted(words)
+
+
+def _library(rng: random.Random, track_count: int) -> list[tuple[str, tuple[str, str, str, str]]]:
+    words = _vocabulary(rng, 20_000)
+    # Rank must not follow spelling, or the common words all share prefixes.
+    rng.shuffle(words)
+    # Zipf-like word frequencies: a few words are everywhere, most are rare.
+    cumulative_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+
+    def phrase(low: int, high: int) -> str:
+        return " ".join(rng.choices(words, cum_weights=cumulative_weights, k=rng.randint(low, high))).title()
+
+    artists = [phrase(1, 3) for _ in range(max(track_count // 20, 1))]
+    albums = [phrase(1, 4) for _ in range(max(track_count // 10, 1))]
+    tracks = []
+    for index in range(track_count):
+        artist = rng.choice(artists)
+        album = rng.choice(albums)
+        title = phrase(1, 5)
+        file_name = f"{index % 20 + 1:02d} - {title}.flac"
+        tracks.append((f"/music/{artist}/{album}/{file_name}", (title, artist, album, file_name)))
+    return tracks
+
+
+def _with_typo(rng: random.Random, text: str) -> str:
+    position = rng.randrange(1, max(len(text) - 1, 2))
+    return text[:position] + rng.choice(string.ascii_lowercase) + text[position + 1 :]
+
+
+def run(track_count: int, queries: int, seed: int) -> None:
+    rng = random.Random(seed)
+    tracks = _library(rng, track_count)
+
+    index: TrigramIndex[str] = TrigramIndex()
+    started = time.perf_counter()
+    for path, fields in tracks:
+        index.add(path, fields)
+    build_s = time.perf_counter() - started
+
+    typed = []
+    for _ in range(queries):
+        _path, (title, artist, _album, _file_name) = rng.choice(tracks)
+        target = rng.choice((title, artist, f"{artist} {title}")).lower()[:24]
+        typed.append(_with_typo(rng, target) if rng.random() < 0.25 else target)
+
+    model = TrackListModel()
+    model.set_tracks([path for path, _fields in tracks])
+
+    search_ms = []
+    filter_ms = []
+    for text in typed:
+        # Every prefix is one keystroke.
+        for end in range(1, len(text) + 1):
+            started = time.perf_counter()
+            match = index.search(text[:end])
+            searched = time.perf_counter()
+            model.set_filter(match)
+            filter_ms.append((time.perf_counter() - searched) * 1000)
+            search_ms.append((searched - started) * 1000)
+        model.set_filter(None)
+
+    print(f"tracks: {track_count:,} (index build {build_s:.2f} s)")
+    print(f"  keystrokes  {len(search_ms):,}")
+    print(f"  {'':10} {'search':>11} {'set_filter':>11} {'total':>11}")
+    totals_ms = sorted(map(sum, zip(search_ms, filter_ms)))
+    search_ms.sort()
+    filter_ms.sort()
+    for label, rank in (("median", 0.5), ("p95", 0.95), ("p99", 0.99)):
+        position = int(len(search_ms) * rank)
+        print(
+            f"  {label:10} {search_ms[position]:8.3f} ms {filter_ms[position]:8.3f} ms {totals_ms[position]:8.3f} ms"
+        )
+    print(f"  {'max':10} {search_ms[-1]:8.3f} ms {filter_ms[-1]:8.3f} ms {totals_ms[-1]:8.3f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    _app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    for size in args.sizes:
+        run(size, args.queries, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+"""Microbenchmark: indexed queue engine versus the previous list-scan queue, plus shuffle modes."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.back_end.services.queue_service import QueueService
+
+
+class _ListScanQueue:
+    def __init__(self, track_ids: list[str]) -> None:
+        self._active_order = list(track_ids)
+
+    def next_track(self, current_track_id: str) -> str | None:
+        if current_track_id not in self._active_order:
+            return None
+        neighbor_index = self._active_order.index(current_track_id) + 1
+        if neighbor_index < len(self._active_order):
+            return self._active_order[neighbor_index]
+        return None
+
+
+def _time_per_call(callable_, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        callable_()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def run(queue_size: int, iterations: int) -> None:
+    track_ids = [f"t{index}" for index in range(queue_size)]
+    probe_id = track_ids[queue_size // 2]
+
+    started = time.perf_counter()
+    service = QueueService(track_ids)
+    build_ms = (time.perf_counter() - started) * 1000
+    legacy = _ListScanQueue(track_ids)
+
+    print(f"queue size: {queue_size:,} (QueueService build {build_ms:.0f} ms)")
+    print(f"  list scan next_track   {_time_per_call(lambda: legacy.next_track(probe_id), iterations):10.2f} us/call")
+    print(f"  QueueService.next_track {_time_per_call(lambda: service.next_track(probe_id), iterations):9.2f} us/call")
+    print(f"  QueueService.play_next  {_time_per_call(lambda: service.play_next('t0', probe_id), iterations):9.2f} us/call")
+    print(f"  QueueService.move_track {_time_per_call(lambda: service.move_track('t1', queue_size // 3), iterations):9.2f} us/call")
+    print(f"  set_shuffle full        {_time_per_call(lambda: service.set_shuffle(True, seed=1), 3):9.2f} us/call")
+    print(f"  set_shuffle lazy        {_time_per_call(lambda: service.set_shuffle(True, seed=1, mode='lazy'), iterations):9.2f} us/call")
+    print(f"  lazy next_track         {_time_per_call(lambda: service.next_track(probe_id), iterations):9.2f} us/call")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    for queue_size in args.sizes:
+        run(queue_size, args.iterations)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+"""Benchmark: per-call cost of PlaybackService and QueueService methods with slotted vs validated responses."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.back_end.services.playback_service import PlaybackService
+from app.back_end.services.queue_service import QueueService
+from app.back_end.utils import class_method_response_models
+
+
+class _NullPlayer:
+    def play(self) -> None:
+        pass
+
+    def pause(self) -> None:
+        pass
+
+    def setPosition(self, position_ms: int) -> None:
+        pass
+
+    def setPlaybackRate(self, rate: float) -> None:
+        pass
+
+
+def _cases(queue_size: int) -> list[tuple[str, object]]:
+    playback = PlaybackService(_NullPlayer())
+    track_ids = [f"track-{index}" for index in range(queue_size)]
+    queue = QueueService(track_ids)
+    middle = track_ids[queue_size // 2]
+    extra = "track-extra"
+
+    def play_next_round_trip() -> None:
+        queue.play_next(track_ids[-1], middle)
+        queue.move_track(track_ids[-1], queue_size - 1)
+
+    def enqueue_round_trip() -> None:
+        queue.enqueue([extra])
+        queue.remove_track(extra)
+
+    return [
+        ("playback.play", playback.play),
+        ("playback.pause", playback.pause),
+        ("playback.seek", lambda: playback.seek(42_000)),
+        ("playback.seek (invalid)", lambda: playback.seek(-1)),
+        ("playback.set_playback_speed", lambda: playback.set_playback_speed(1.5)),
+        ("queue.set_repeat_mode", lambda: queue.set_repeat_mode("repeat_all")),
+        ("queue.next_track", lambda: queue.next_track(middle)),
+        ("queue.previous_track", lambda: queue.previous_track(middle)),
+        ("queue.next_track (unknown)", lambda: queue.next_track("missing")),
+        ("queue.upcoming_tracks", lambda: queue.upcoming_tracks(middle)),
+        ("queue.play_next + move_track", play_next_round_trip),
+        ("queue.enqueue + remove_track", enqueue_round_trip),
+    ]
+
+
+def _per_call_us(function, calls: int, repeats: int) -> float:
+    return min(timeit.repeat(function, number=calls, repeat=repeats)) / calls * 1_000_000
+
+
+def run(calls: int, repeats: int, queue_size: int) -> None:
+    cases = _cases(queue_size)
+    print(f"calls: {calls:,} x {repeats} repeats, queue of {queue_size:,}")
+    print(f"  {'method':32} {'validated':>10} {'slotted':>10} {'speedup':>8}")
+    for label, function in cases:
+        class_method_response_models.VALIDATE_RESPONSES = True
+        validated_us = _per_call_us(function, calls, repeats)
+        class_method_response_models.VALIDATE_RESPONSES = False
+        slotted_us = _per_call_us(function, calls, repeats)
+        print(f"  {label:32} {validated_us:8.2f}us {slotted_us:8.2f}us {validated_us / slotted_us:7.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.calls, args.repeats, args.queue_size)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
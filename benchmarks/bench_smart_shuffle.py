@@ -0,0 +1,85 @@
+"""Benchmark: spread shuffle versus random.shuffle on a large queue."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.back_end.controllers.library_controller import LibraryController
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.services.queue_service import QueueService
+from app.back_end.services.smart_shuffle import spread_shuffle
+
+
+def _adjacent_same_artist(order: list[str], groups: dict[str, tuple[str, str]]) -> int:
+    return sum(1 for left, right in zip(order, order[1:]) if groups[left][0] == groups[right][0])
+
+
+def _populate_library(db_handler: DatabaseHandler, track_count: int, artist_count: int) -> list[str]:
+    rng = random.Random(0)
+    connection = db_handler.connect()
+    rows = []
+    for index in range(track_count):
+        # Skewed toward a few prolific artists, like real libraries.
+        artist = int(artist_count * rng.random() ** 3)
+        rows.append((f"/bench/{index}.mp3", f"Track {index}", f"Artist {artist}", f"Album {artist}-{index % 4}", 180_000))
+    connection.executemany(
+        "INSERT INTO tracks (path, title, artist, album, duration_ms) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    connection.commit()
+    return [row[0] for row in connection.execute("SELECT path FROM tracks ORDER BY id")]
+
+
+def run(track_count: int, artist_count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_handler = DatabaseHandler(db_path=Path(tmp_dir) / "bench.db")
+        db_handler.initialize_schema()
+        track_paths = _populate_library(db_handler, track_count, artist_count)
+
+        started = time.perf_counter()
+        groups = LibraryController(Repository(db_handler)).get_track_groupings(track_paths)
+        fetch_ms = (time.perf_counter() - started) * 1000
+        db_handler.close()
+
+    queue_ids = list(groups)
+
+    plain = list(queue_ids)
+    started = time.perf_counter()
+    random.Random(1).shuffle(plain)
+    plain_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    spread = spread_shuffle(queue_ids, groups, seed=1)
+    spread_ms = (time.perf_counter() - started) * 1000
+
+    service = QueueService(queue_ids, track_groups=groups)
+    started = time.perf_counter()
+    service.set_shuffle(True, seed=1, mode="spread")
+    service_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{track_count:,} tracks / {artist_count:,} artists")
+    print(f"  bulk artist/album fetch    {fetch_ms:8.1f} ms")
+    print(f"  random.shuffle             {plain_ms:8.1f} ms, {_adjacent_same_artist(plain, groups):,} same-artist neighbours")
+    print(f"  spread_shuffle             {spread_ms:8.1f} ms, {_adjacent_same_artist(spread, groups):,} same-artist neighbours")
+    print(f"  QueueService spread mode   {service_ms:8.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=100_000)
+    parser.add_argument("--artists", type=int, default=2_000)
+    args = parser.parse_args()
+    run(args.tracks, args.artists)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
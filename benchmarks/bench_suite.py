@@ -0,0 +1,265 @@
+"""Benchmark suite: bridge, controller and queue timings on synthetic libraries, written as JSON.
+
+Each scale generates (or reuses, with --library-root) a library of small
+WAV files with sidecars and covers, then times the metadata bridge, an
+import into a fresh database, the playlist and favorites controllers and
+QueueService against it, keeping each metric's fastest of --repeat passes.
+Pass --compare with an earlier result file to print the change per metric;
+the exit status is 1 when any metric got slower than --threshold allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.back_end.controllers.favorites_controller import FavoritesController
+from app.back_end.controllers.playlist_controller import PlaylistController
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.services import python_backend, rust_bridge
+from app.back_end.services.library_importer import LibraryImporter
+from app.back_end.services.queue_service import QueueService
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_library import ensure_library
+
+SCHEMA_VERSION = 1
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / "results" / "latest.json"
+
+Metrics = dict[str, dict[str, float]]
+
+
+def _measure(metrics: Metrics, name: str, items: int, function: Callable[[], object]) -> object:
+    started = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - started
+    metrics[name] = {
+        "items": items,
+        "total_ms": round(elapsed * 1000, 3),
+        "per_item_us": round(elapsed * 1_000_000 / max(items, 1), 3),
+    }
+    return result
+
+
+def _bridge_metrics(metrics: Metrics, root: Path, tracks: list[str]) -> None:
+    _measure(metrics, "scan_library", len(tracks), lambda: rust_bridge.scan_library([str(root)]))
+    _measure(metrics, "read_metadata", len(tracks), lambda: [rust_bridge.read_metadata(track) for track in tracks])
+    _measure(metrics, "extract_artwork", len(tracks), lambda: [rust_bridge.extract_artwork(track) for track in tracks])
+    batch_size = LibraryImporter.DEFAULT_BATCH_SIZE
+    _measure(
+        metrics,
+        "ingest",
+        len(tracks),
+        lambda: [rust_bridge.ingest(tracks[start : start + batch_size]) for start in range(0, len(tracks), batch_size)],
+    )
+
+
+def _controller_metrics(metrics: Metrics, db_path: Path, track_ids: list[int], playlist_size: int, sample: int) -> None:
+    db_handler = DatabaseHandler(db_path=db_path)
+    repository = Repository(db_handler)
+    rng = random.Random(0)
+    try:
+        playlist_controller = PlaylistController(repository)
+        playlist_id = playlist_controller.create_playlist("Benchmark").data["playlist_id"]
+        members = track_ids[:playlist_size]
+        _measure(
+            metrics,
+            "playlist.add_track_to_playlist",
+            len(members),
+            lambda: [playlist_controller.add_track_to_playlist(playlist_id, track_id) for track_id in members],
+        )
+
+        def page_through() -> int:
+            pages, after = 0, -1
+            while True:
+                page = playlist_controller.get_playlist_page(playlist_id, after_position=after).data
+                if not page:
+                    return pages
+                pages += 1
+                after = page[-1]["position"]
+
+        page_count = -(-len(members) // 200)
+        _measure(metrics, "playlist.get_playlist_page", page_count, page_through)
+        windows = [rng.randrange(len(members)) for _ in range(sample)]
+        _measure(
+            metrics,
+            "playlist.get_playlist_window",
+            len(windows),
+            lambda: [playlist_controller.get_playlist_window(playlist_id, index) for index in windows],
+        )
+        _measure(
+            metrics,
+            "playlist.reorder_tracks",
+            len(members),
+            lambda: playlist_controller.reorder_tracks(playlist_id, members[::-1]),
+        )
+        # Every removal renumbers the whole playlist, so a few are enough.
+        removed = rng.sample(members, min(3, len(members)))
+        _measure(
+            metrics,
+            "playlist.remove_track_from_playlist",
+            len(removed),
+            lambda: [playlist_controller.remove_track_from_playlist(playlist_id, track_id) for track_id in removed],
+        )
+
+        favorites = rng.sample(track_ids, min(sample, len(track_ids)))
+        favorites_controller = FavoritesController(repository)
+        _measure(
+            metrics,
+            "favorites.mark_favorite",
+            len(favorites),
+            lambda: [favorites_controller.mark_favorite(track_id) for track_id in favorites],
+        )
+        _measure(
+            metrics,
+            "favorites.is_in_favorites",
+            len(favorites),
+            lambda: [favorites_controller.is_in_favorites(track_id) for track_id in favorites],
+        )
+    finally:
+        db_handler.close()
+
+
+def _queue_metrics(metrics: Metrics, tracks: list[str], groups: dict[str, tuple[str, str]], sample: int) -> None:
+    queue = _measure(metrics, "queue.build", len(tracks), lambda: QueueService(tracks, groups))
+
+    def walk() -> None:
+        track_id = tracks[0]
+        for _ in range(len(tracks) - 1):
+            track_id = queue.next_track(track_id).data["track_id"]
+
+    _measure(metrics, "queue.next_track", len(tracks) - 1, walk)
+    rng = random.Random(0)
+    probes = [rng.choice(tracks) for _ in range(sample)]
+    _measure(metrics, "queue.upcoming_tracks", len(probes), lambda: [queue.upcoming_tracks(track) for track in probes])
+    _measure(
+        metrics,
+        "queue.play_next",
+        len(probes),
+        lambda: [queue.play_next(track, tracks[0]) for track in probes if track != tracks[0]],
+    )
+    for mode in ("full", "lazy", "spread"):
+        _measure(metrics, f"queue.set_shuffle.{mode}", len(tracks), lambda: queue.set_shuffle(True, seed=1, mode=mode))
+        _measure(metrics, f"queue.next_track.{mode}", len(probes), lambda: [queue.next_track(track) for track in probes])
+
+
+def run_scale(track_count: int, library_root: Path | None, playlist_size: int, sample: int, repeat: int) -> Metrics:
+    """Time every metric `repeat` times against one library, keeping each metric's fastest pass."""
+    best: Metrics = {}
+    with tempfile.TemporaryDirectory(prefix="bench-suite-") as scratch:
+        root = (library_root or Path(scratch)) / f"library-{track_count}"
+        tracks = _measure(best, "generate_library", track_count, lambda: ensure_library(root, track_count))
+        for attempt in range(repeat):
+            metrics = _run_pass(root, tracks, Path(scratch) / f"app-{attempt}.db", playlist_size, sample)
+            for name, values in metrics.items():
+                if name not in best or values["per_item_us"] < best[name]["per_item_us"]:
+                    best[name] = values
+    return best
+
+
+def _run_pass(root: Path, tracks: list[str], db_path: Path, playlist_size: int, sample: int) -> Metrics:
+    metrics: Metrics = {}
+    _bridge_metrics(metrics, root, tracks)
+
+    db_handler = DatabaseHandler(db_path=db_path)
+    db_handler.initialize_schema()
+    db_handler.close()
+    _measure(metrics, "library_import", len(tracks), lambda: LibraryImporter(db_path).run([str(root)]))
+
+    db_handler = DatabaseHandler(db_path=db_path)
+    rows = db_handler.connect().execute("SELECT id, path, artist, album FROM tracks ORDER BY path").fetchall()
+    db_handler.close()
+    track_ids = [row[0] for row in rows]
+    _controller_metrics(metrics, db_path, track_ids, min(playlist_size, len(track_ids)), sample)
+    _queue_metrics(metrics, [row[1] for row in rows], {row[1]: (row[2], row[3]) for row in rows}, sample)
+    return metrics
+
+
+def _environment() -> dict[str, object]:
+    try:
+        rust_bridge._load_rust_backend_module()
+        backend = "native"
+    except RuntimeError:
+        backend = "python"
+    if os.environ.get(rust_bridge.BACKEND_ENV_VAR, "").strip().lower() == "python":
+        backend = "python"
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "backend": backend,
+        "python_backend_version": python_backend.BACKEND_VERSION,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> int:
+    """Print each metric's change against `baseline`; return how many regressed past `threshold`."""
+    regressions = 0
+    for scale, metrics in current["scales"].items():
+        previous = baseline.get("scales", {}).get(scale)
+        if previous is None:
+            continue
+        print(f"scale {int(scale):,}")
+        for name, values in metrics.items():
+            if name == "generate_library" or name not in previous:
+                continue
+            before, after = previous[name]["per_item_us"], values["per_item_us"]
+            ratio = after / before if before else 1.0
+            regressed = ratio > 1 + threshold
+            regressions += regressed
+            marker = "  SLOWER" if regressed else ""
+            print(f"  {name:38} {before:12.2f} -> {after:12.2f} us/item ({ratio:5.2f}x){marker}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--library-root", type=Path, help="keep generated libraries here and reuse them")
+    parser.add_argument("--playlist-size", type=int, default=10_000)
+    parser.add_argument("--sample", type=int, default=1_000, help="calls for per-call controller and queue metrics")
+    parser.add_argument("--repeat", type=int, default=3, help="passes per scale; each metric keeps its fastest")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", type=Path, help="earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20, help="allowed slowdown before a metric counts as regressed")
+    args = parser.parse_args()
+
+    result = {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": _environment(),
+        "repeat": args.repeat,
+        "scales": {},
+    }
+    for track_count in args.scales:
+        started = time.perf_counter()
+        result["scales"][str(track_count)] = run_scale(
+            track_count, args.library_root, args.playlist_size, args.sample, args.repeat
+        )
+        print(f"scale {track_count:,} done in {time.perf_counter() - started:.1f} s")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"wrote {args.output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        return 1 if compare(result, baseline, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,55 @@
+"""Benchmark: cost of a traced call with tracing disabled and enabled, against the bare function."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.back_end.utils.tracing import traced, tracer
+
+
+def _lookup(key: int) -> int:
+    return key + 1
+
+
+def _time(function, calls: int) -> float:
+    started = time.perf_counter()
+    for key in range(calls):
+        function(key)
+    return (time.perf_counter() - started) * 1_000_000_000 / calls
+
+
+def run(calls: int) -> None:
+    wrapped = traced("bench")(_lookup)
+    described = traced("bench", detail=lambda key: f"key={key}")(_lookup)
+
+    bare_ns = _time(_lookup, calls)
+    tracer.disable()
+    disabled_ns = _time(wrapped, calls)
+    tracer.enable()
+    enabled_ns = _time(wrapped, calls)
+    detail_ns = _time(described, calls)
+    tracer.disable()
+    tracer.clear()
+
+    print(f"calls: {calls:,}")
+    print(f"  bare function      {bare_ns:8.1f} ns/call")
+    print(f"  tracing disabled   {disabled_ns:8.1f} ns/call (+{disabled_ns - bare_ns:.1f})")
+    print(f"  tracing enabled    {enabled_ns:8.1f} ns/call")
+    print(f"    with detail      {detail_ns:8.1f} ns/call")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+    run(args.calls)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+"""Benchmark: TrackStore vs list[Path] + path index + per-track metadata dicts, for memory, sort and filter."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.back_end.services.track_store import TrackStore
+
+GENRES = ("Rock", "Jazz", "Pop", "Classical", "Electronic", "Folk", "Hip-Hop", "Metal", "Blues", "Soul", "Ambient", "")
+TRACKS_PER_ALBUM = 12
+ALBUMS_PER_ARTIST = 5
+
+Row = tuple[str, str, str, str, str, int]
+
+
+def _rows(track_count: int, seed: int = 0) -> Iterator[Row]:
+    # Every string is built per track, as each bridge response carries its own copies.
+    rng = random.Random(seed)
+    for index in range(track_count):
+        album_number = index // TRACKS_PER_ALBUM
+        artist = f"Artist {album_number // ALBUMS_PER_ARTIST:05d}"
+        album = f"Album {album_number:06d}"
+        title = f"Track {rng.randrange(10**9):09d}"
+        path = f"/home/listener/Music/{artist}/{album}/{index % TRACKS_PER_ALBUM + 1:02d} - {title}.flac"
+        yield path, title, artist, album, GENRES[album_number % len(GENRES)], rng.randrange(60_000, 600_000)
+
+
+class ListRepresentation:
+    """What the front end held before TrackStore: Paths, a path index and read_metadata dicts."""
+
+    def __init__(self, rows: Iterator[Row]) -> None:
+        self.paths: list[Path] = []
+        self.index: dict[str, int] = {}
+        self.metadata: dict[str, dict[str, str]] = {}
+        for path, title, artist, album, genre, duration_ms in rows:
+            self.index[path] = len(self.paths)
+            self.paths.append(Path(path))
+            self.metadata[path] = {
+                "path": path,
+                "title": title,
+                "artist": artist,
+                "album": album,
+                "genre": genre,
+                "duration_ms": str(duration_ms),
+            }
+
+    def sort(self, fields: tuple[str, ...]) -> list[Path]:
+        metadata = self.metadata
+        return sorted(self.paths, key=lambda path: tuple(metadata[str(path)][field].casefold() for field in fields))
+
+    def sort_by_duration(self) -> list[Path]:
+        metadata = self.metadata
+        return sorted(self.paths, key=lambda path: int(metadata[str(path)]["duration_ms"]), reverse=True)
+
+    def filter(self, genre: str, min_duration_ms: int) -> list[Path]:
+        metadata = self.metadata
+        return [
+            path
+            for path in self.paths
+            if metadata[str(path)]["genre"] == genre and int(metadata[str(path)]["duration_ms"]) >= min_duration_ms
+        ]
+
+
+def _build_store(rows: Iterator[Row]) -> TrackStore:
+    store = TrackStore()
+    for path, title, artist, album, genre, duration_ms in rows:
+        store.append(path, title, artist, album, genre, duration_ms)
+    return store
+
+
+def _memory(build: Callable[[], object]) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    gc.collect()
+    used, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, used
+
+
+def _best_ms(function: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def run(track_count: int, repeat: int) -> None:
+    old, old_bytes = _memory(lambda: ListRepresentation(_rows(track_count)))
+    store, store_bytes = _memory(lambda: _build_store(_rows(track_count)))
+    old_build_ms = _best_ms(lambda: ListRepresentation(_rows(track_count)), 1)
+    store_build_ms = _best_ms(lambda: _build_store(_rows(track_count)), 1)
+
+    print(f"tracks: {track_count:,}")
+    print(f"  memory             {'list + dicts':>14} {'TrackStore':>14}")
+    ratio = old_bytes / store_bytes
+    print(f"    total            {old_bytes / 2**20:11.1f} MB {store_bytes / 2**20:11.1f} MB ({ratio:.1f}x)")
+    print(f"    per track        {old_bytes / track_count:11.0f} B  {store_bytes / track_count:11.0f} B")
+    print(f"    build            {old_build_ms:11.1f} ms {store_build_ms:11.1f} ms")
+
+    cases = (
+        (
+            "sort artist/album/title",
+            lambda: old.sort(("artist", "album", "title")),
+            lambda: store.sort(("artist", "album", "title")),
+        ),
+        ("sort title", lambda: old.sort(("title",)), lambda: store.sort(("title",))),
+        ("sort -duration", old.sort_by_duration, lambda: store.sort(("-duration_ms",))),
+        (
+            "filter genre+duration",
+            lambda: old.filter("Jazz", 300_000),
+            lambda: store.filter(genre="Jazz", min_duration_ms=300_000),
+        ),
+    )
+    for label, old_call, store_call in cases:
+        old_ms = _best_ms(old_call, repeat)
+        store_ms = _best_ms(store_call, repeat)
+        print(f"  {label:24} {old_ms:9.1f} ms {store_ms:11.1f} ms ({old_ms / store_ms:.1f}x)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tracks", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.tracks, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
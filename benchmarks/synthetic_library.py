@@ -0,0 +1,102 @@
+"""Generate a synthetic music library: folders of small valid WAV files with tag sidecars and covers.
+
+Layout: <root>/Artist NNNN/Album NNNNN/NN - Track N.wav, each with a
+`.musicmeta.json` sidecar (the tags both backends read) and, in nine of
+every ten album folders, a cover.png. Output is deterministic for a given
+size and seed, so two runs time the same bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import struct
+import time
+import wave
+import zlib
+from pathlib import Path
+
+SAMPLE_RATE = 8_000
+ALBUMS_PER_ARTIST = 4
+COVER_SIZE = 16
+# Marks a finished library, so an interrupted generation is never reused.
+COMPLETE_MARKER = ".synthetic-library.json"
+
+
+def _png(color: tuple[int, int, int], size: int) -> bytes:
+    def chunk(kind: bytes, payload: bytes) -> bytes:
+        return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+    row = b"\x00" + bytes(color) * size
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(row * size)) + chunk(b"IEND", b"")
+
+
+def _write_wav(path: Path, duration_ms: int) -> None:
+    with wave.open(str(path), "wb") as audio:
+        audio.setnchannels(1)
+        audio.setsampwidth(2)
+        audio.setframerate(SAMPLE_RATE)
+        audio.writeframes(bytes(SAMPLE_RATE * duration_ms // 1000 * 2))
+
+
+def generate_library(root: Path, directories: int, files_per_directory: int, seed: int = 0) -> list[str]:
+    """Write the library under `root` and return its track paths in scan order."""
+    rng = random.Random(seed)
+    tracks: list[str] = []
+    for directory in range(directories):
+        artist = f"Artist {directory // ALBUMS_PER_ARTIST:04d}"
+        album = f"Album {directory:05d}"
+        album_path = root / artist / album
+        album_path.mkdir(parents=True, exist_ok=True)
+        if directory % 10 != 9:
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            (album_path / "cover.png").write_bytes(_png(color, COVER_SIZE))
+
+        for number in range(1, files_per_directory + 1):
+            index = directory * files_per_directory + number - 1
+            track = album_path / f"{number:02d} - Track {index}.wav"
+            duration_ms = rng.randrange(50, 250)
+            _write_wav(track, duration_ms)
+            tags = {
+                "title": f"Track {index}",
+                "artist": artist,
+                "album": album,
+                "track_number": str(number),
+                "duration_ms": str(duration_ms),
+            }
+            (album_path / f"{track.name}.musicmeta.json").write_text(json.dumps(tags), encoding="utf-8")
+            tracks.append(str(track))
+    return sorted(tracks)
+
+
+def ensure_library(root: Path, track_count: int, files_per_directory: int = 20, seed: int = 0) -> list[str]:
+    """Generate a library of `track_count` tracks under `root`, reusing one a previous run completed."""
+    directories = max(1, -(-track_count // files_per_directory))
+    spec = {"directories": directories, "files_per_directory": files_per_directory, "seed": seed}
+    marker = root / COMPLETE_MARKER
+    if marker.is_file() and json.loads(marker.read_text(encoding="utf-8")) == spec:
+        return sorted(str(path) for path in root.rglob("*.wav"))
+
+    tracks = generate_library(root, directories, files_per_directory, seed)
+    marker.write_text(json.dumps(spec), encoding="utf-8")
+    return tracks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", type=Path)
+    parser.add_argument("--tracks", type=int, default=1_000)
+    parser.add_argument("--files-per-directory", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    tracks = ensure_library(args.root, args.tracks, args.files_per_directory, args.seed)
+    print(f"{len(tracks):,} tracks in {args.root} ({time.perf_counter() - started:.1f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
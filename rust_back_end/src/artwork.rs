@@ -1,6 +1,9 @@
 use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::atomic::AtomicBool;
+
+use crate::cancel;
 
 fn metadata_sidecar_path(audio_path: &Path) -> PathBuf {
     let file_name = audio_path
@@ -34,13 +37,21 @@ fn candidate_artwork_paths(audio_path: &Path) -> Vec<PathBuf> {
     paths
 }
 
-pub fn extract_artwork(path: String) -> Result<Option<Vec<u8>>, String> {
+pub fn artwork_path(audio_path: &Path) -> Option<PathBuf> {
+    candidate_artwork_paths(audio_path)
+        .into_iter()
+        .find(|candidate| candidate.is_file())
+}
+
+pub fn extract_artwork(path: String, cancel: Option<&AtomicBool>) -> Result<Option<Vec<u8>>, String> {
+    cancel::check(cancel)?;
     let audio_path = Path::new(&path);
     if !audio_path.exists() {
         return Err(format!("Track does not exist: {}", path));
     }
 
     for candidate in candidate_artwork_paths(audio_path) {
+        cancel::check(cancel)?;
         if candidate.exists() && candidate.is_file() {
             match fs::read(candidate) {
                 Ok(bytes) => return Ok(Some(bytes)),
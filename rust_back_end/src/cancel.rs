@@ -0,0 +1,41 @@
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Arc;
+
+use pyo3::prelude::*;
+
+pub const CANCELLED_MESSAGE: &str = "Operation cancelled.";
+
+#[pyclass(frozen)]
+#[derive(Clone, Default)]
+pub struct CancelFlag {
+    flag: Arc<AtomicBool>,
+}
+
+#[pymethods]
+impl CancelFlag {
+    #[new]
+    fn new() -> Self {
+        Self::default()
+    }
+
+    fn cancel(&self) {
+        self.flag.store(true, Ordering::Release);
+    }
+
+    fn is_cancelled(&self) -> bool {
+        self.flag.load(Ordering::Acquire)
+    }
+}
+
+impl CancelFlag {
+    pub fn handle(&self) -> Arc<AtomicBool> {
+        Arc::clone(&self.flag)
+    }
+}
+
+pub fn check(cancel: Option<&AtomicBool>) -> Result<(), String> {
+    match cancel {
+        Some(flag) if flag.load(Ordering::Acquire) => Err(CANCELLED_MESSAGE.to_string()),
+        _ => Ok(()),
+    }
+}
@@ -0,0 +1,162 @@
+use std::collections::HashMap;
+use std::fs;
+use std::path::{Path, PathBuf};
+use std::sync::atomic::AtomicBool;
+use std::sync::Mutex;
+use std::thread;
+use std::time::UNIX_EPOCH;
+
+use pyo3::IntoPyObject;
+
+use crate::artwork;
+use crate::cancel;
+use crate::metadata;
+
+// One list per `tracks` column, in input order; converts to a dict of lists.
+#[derive(Default, IntoPyObject)]
+pub struct IngestColumns {
+    pub path: Vec<String>,
+    pub title: Vec<String>,
+    pub artist: Vec<String>,
+    pub album: Vec<String>,
+    pub duration_ms: Vec<i64>,
+    pub file_size: Vec<Option<u64>>,
+    pub file_mtime_ns: Vec<Option<i64>>,
+    pub file_inode: Vec<Option<u64>>,
+    pub artwork_hash: Vec<Option<String>>,
+}
+
+struct IngestRecord {
+    path: String,
+    title: String,
+    artist: String,
+    album: String,
+    duration_ms: i64,
+    file_size: Option<u64>,
+    file_mtime_ns: Option<i64>,
+    file_inode: Option<u64>,
+    artwork_hash: Option<String>,
+}
+
+// Tracks of one album usually share a cover file, so each batch hashes it once.
+type ArtworkHashes = Mutex<HashMap<PathBuf, Option<String>>>;
+
+const CRC32_POLYNOMIAL: u32 = 0xEDB8_8320;
+
+fn crc32_table() -> [u32; 256] {
+    let mut table = [0u32; 256];
+    for (index, slot) in table.iter_mut().enumerate() {
+        let mut value = index as u32;
+        for _ in 0..8 {
+            value = if value & 1 == 1 { (value >> 1) ^ CRC32_POLYNOMIAL } else { value >> 1 };
+        }
+        *slot = value;
+    }
+    table
+}
+
+// Same value as Python's zlib.crc32, so both backends store identical hashes.
+pub fn artwork_hash(bytes: &[u8]) -> String {
+    let table = crc32_table();
+    let mut crc = 0xFFFF_FFFFu32;
+    for byte in bytes {
+        crc = table[((crc ^ *byte as u32) & 0xFF) as usize] ^ (crc >> 8);
+    }
+    format!("{:08x}-{}", !crc, bytes.len())
+}
+
+#[cfg(unix)]
+fn inode(stat: &fs::Metadata) -> Option<u64> {
+    use std::os::unix::fs::MetadataExt;
+    Some(stat.ino())
+}
+
+#[cfg(not(unix))]
+fn inode(_stat: &fs::Metadata) -> Option<u64> {
+    None
+}
+
+fn hash_artwork(audio_path: &Path, hashes: &ArtworkHashes) -> Option<String> {
+    let artwork_path = artwork::artwork_path(audio_path)?;
+    if let Some(known) = hashes.lock().unwrap().get(&artwork_path) {
+        return known.clone();
+    }
+    let hash = fs::read(&artwork_path).ok().map(|bytes| artwork_hash(&bytes));
+    hashes.lock().unwrap().insert(artwork_path, hash.clone());
+    hash
+}
+
+fn ingest_one(path: &str, hashes: &ArtworkHashes) -> IngestRecord {
+    let audio_path = Path::new(path);
+    let stat = fs::metadata(audio_path).ok();
+    // A file that vanished since the scan still gets a row, titled by its name.
+    let tags = match stat {
+        Some(_) => metadata::read_metadata(path.to_string(), None).unwrap_or_default(),
+        None => HashMap::new(),
+    };
+    let tag = |key: &str| tags.get(key).cloned().unwrap_or_default();
+
+    let mut title = tag("title");
+    if title.is_empty() {
+        title = audio_path.file_stem().and_then(|stem| stem.to_str()).unwrap_or_default().to_string();
+    }
+
+    IngestRecord {
+        path: path.to_string(),
+        title,
+        artist: tag("artist"),
+        album: tag("album"),
+        duration_ms: tag("duration_ms").trim().parse().unwrap_or(0),
+        file_size: stat.as_ref().map(|value| value.len()),
+        file_mtime_ns: stat
+            .as_ref()
+            .and_then(|value| value.modified().ok())
+            .and_then(|modified| modified.duration_since(UNIX_EPOCH).ok())
+            .map(|elapsed| elapsed.as_nanos() as i64),
+        file_inode: stat.as_ref().and_then(inode),
+        artwork_hash: stat.as_ref().and_then(|_| hash_artwork(audio_path, hashes)),
+    }
+}
+
+fn ingest_chunk(paths: &[String], hashes: &ArtworkHashes, cancel: Option<&AtomicBool>) -> Result<Vec<IngestRecord>, String> {
+    let mut records = Vec::with_capacity(paths.len());
+    for path in paths {
+        cancel::check(cancel)?;
+        records.push(ingest_one(path, hashes));
+    }
+    Ok(records)
+}
+
+pub fn ingest(paths: Vec<String>, cancel: Option<&AtomicBool>) -> Result<IngestColumns, String> {
+    let workers = thread::available_parallelism().map(|count| count.get()).unwrap_or(1);
+    let chunk_size = paths.len().div_ceil(workers).max(1);
+    let hashes: ArtworkHashes = Mutex::new(HashMap::new());
+    let hashes = &hashes;
+
+    let chunks: Vec<Result<Vec<IngestRecord>, String>> = thread::scope(|scope| {
+        let handles: Vec<_> = paths
+            .chunks(chunk_size)
+            .map(|chunk| scope.spawn(move || ingest_chunk(chunk, hashes, cancel)))
+            .collect();
+        handles
+            .into_iter()
+            .map(|handle| handle.join().unwrap_or_else(|_| Err("Ingest worker panicked.".to_string())))
+            .collect()
+    });
+
+    let mut columns = IngestColumns::default();
+    for chunk in chunks {
+        for record in chunk? {
+            columns.path.push(record.path);
+            columns.title.push(record.title);
+            columns.artist.push(record.artist);
+            columns.album.push(record.album);
+            columns.duration_ms.push(record.duration_ms);
+            columns.file_size.push(record.file_size);
+            columns.file_mtime_ns.push(record.file_mtime_ns);
+            columns.file_inode.push(record.file_inode);
+            columns.artwork_hash.push(record.artwork_hash);
+        }
+    }
+    Ok(columns)
+}
@@ -3,7 +3,11 @@ use std::collections::HashMap;
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
 
+use cancel::CancelFlag;
+
 mod artwork;
+mod cancel;
+mod ingest;
 mod metadata;
 mod scanner;
 
@@ -12,32 +16,52 @@ fn backend_version() -> &'static str {
     "0.1.0"
 }
 
+// Every entry point detaches from the interpreter for the file I/O, so other
+// Python threads (the UI, other workers) keep running while it blocks. Only
+// owned, Send data crosses into the closure: a cancel flag's PyRef is traded
+// for its Arc<AtomicBool> handle first.
+
+#[pyfunction]
+fn scan_library(py: Python<'_>, paths: Vec<String>) -> PyResult<Vec<String>> {
+    py.detach(|| scanner::scan_library(paths)).map_err(PyRuntimeError::new_err)
+}
+
 #[pyfunction]
-fn scan_library(paths: Vec<String>) -> PyResult<Vec<String>> {
-    scanner::scan_library(paths).map_err(PyRuntimeError::new_err)
+#[pyo3(signature = (path, cancel_flag=None))]
+fn read_metadata(py: Python<'_>, path: String, cancel_flag: Option<PyRef<'_, CancelFlag>>) -> PyResult<HashMap<String, String>> {
+    let cancel = cancel_flag.map(|flag| flag.handle());
+    py.detach(|| metadata::read_metadata(path, cancel.as_deref())).map_err(PyRuntimeError::new_err)
 }
 
 #[pyfunction]
-fn read_metadata(path: String) -> PyResult<HashMap<String, String>> {
-    metadata::read_metadata(path).map_err(PyRuntimeError::new_err)
+fn write_metadata(py: Python<'_>, path: String, changes: HashMap<String, String>) -> PyResult<Vec<String>> {
+    py.detach(|| metadata::write_metadata(path, changes)).map_err(PyRuntimeError::new_err)
 }
 
 #[pyfunction]
-fn write_metadata(path: String, changes: HashMap<String, String>) -> PyResult<Vec<String>> {
-    metadata::write_metadata(path, changes).map_err(PyRuntimeError::new_err)
+#[pyo3(signature = (path, cancel_flag=None))]
+fn extract_artwork(py: Python<'_>, path: String, cancel_flag: Option<PyRef<'_, CancelFlag>>) -> PyResult<Option<Vec<u8>>> {
+    let cancel = cancel_flag.map(|flag| flag.handle());
+    py.detach(|| artwork::extract_artwork(path, cancel.as_deref())).map_err(PyRuntimeError::new_err)
 }
 
+// Stats, tags and artwork hash for a whole batch in one call, read on
+// parallel threads; returns a dict of equal-length column lists.
 #[pyfunction]
-fn extract_artwork(path: String) -> PyResult<Option<Vec<u8>>> {
-    artwork::extract_artwork(path).map_err(PyRuntimeError::new_err)
+#[pyo3(signature = (paths, cancel_flag=None))]
+fn ingest(py: Python<'_>, paths: Vec<String>, cancel_flag: Option<PyRef<'_, CancelFlag>>) -> PyResult<ingest::IngestColumns> {
+    let cancel = cancel_flag.map(|flag| flag.handle());
+    py.detach(|| ingest::ingest(paths, cancel.as_deref())).map_err(PyRuntimeError::new_err)
 }
 
 #[pymodule]
 fn rust_back_end_native(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<CancelFlag>()?;
     m.add_function(wrap_pyfunction!(backend_version, m)?)?;
     m.add_function(wrap_pyfunction!(scan_library, m)?)?;
     m.add_function(wrap_pyfunction!(read_metadata, m)?)?;
     m.add_function(wrap_pyfunction!(write_metadata, m)?)?;
     m.add_function(wrap_pyfunction!(extract_artwork, m)?)?;
+    m.add_function(wrap_pyfunction!(ingest, m)?)?;
     Ok(())
 }
@@ -1,6 +1,9 @@
 use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::atomic::AtomicBool;
+
+use crate::cancel;
 
 fn metadata_sidecar_path(audio_path: &Path) -> PathBuf {
     let file_name = audio_path
@@ -25,7 +28,8 @@ fn write_sidecar_map(audio_path: &Path, metadata: &HashMap<String, String>) -> R
     fs::write(metadata_sidecar_path(audio_path), serialized).map_err(|err| err.to_string())
 }
 
-pub fn read_metadata(path: String) -> Result<HashMap<String, String>, String> {
+pub fn read_metadata(path: String, cancel: Option<&AtomicBool>) -> Result<HashMap<String, String>, String> {
+    cancel::check(cancel)?;
     let audio_path = Path::new(&path);
     if !audio_path.exists() {
         return Err(format!("Track does not exist: {}", path));
@@ -45,7 +49,9 @@ pub fn read_metadata(path: String) -> Result<HashMap<String, String>, String> {
     metadata.insert("album".to_string(), String::new());
     metadata.insert("duration_ms".to_string(), "0".to_string());
 
+    cancel::check(cancel)?;
     let sidecar = load_sidecar_map(audio_path);
+    cancel::check(cancel)?;
     for (key, value) in sidecar {
         metadata.insert(key, value);
     }
@@ -2,8 +2,10 @@ from app.back_end.data.repositories.repository import Repository
 from app.back_end.utils.class_method_response_models import ErrorResponse, MethodResponse, SuccessResponse
 from app.back_end.utils.error_messages import ErrorMessage
 from app.back_end.utils.success_messages import SuccessMessage
+from app.back_end.utils.tracing import traced_methods
 
 
+@traced_methods("controller")
 class FavoritesController:
     FAVORITES_PLAYLIST_NAME = "Favorites"
     FAVORITES_PLAYLIST_KIND = "smart"
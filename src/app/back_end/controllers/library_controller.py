@@ -0,0 +1,82 @@
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.services.rust_bridge import INGEST_COLUMNS
+from app.back_end.utils.tracing import traced_methods
+
+# (artist, album count, track count, total duration ms)
+ArtistSummary = tuple[str | None, int, int, int]
+# (album, track count, total duration ms)
+AlbumSummary = tuple[str | None, int, int]
+# (track id, path, title, duration ms)
+TrackSummary = tuple[int, str, str, int]
+# (artist, album, track count, path of the track whose artwork stands for the album)
+AlbumCover = tuple[str | None, str | None, int, str]
+
+
+@traced_methods("controller")
+class LibraryController:
+    def __init__(self, repository: Repository) -> None:
+        self._repository = repository
+
+    def get_track_groupings(self, track_paths: Sequence[str]) -> dict[str, tuple[str, str]]:
+        """(artist, album) per path, keyed like QueueService track ids; paths not in the library are left out."""
+        if not track_paths:
+            return {}
+
+        # One bound JSON array keeps this a single query regardless of how many
+        # paths are requested (SQLite caps the number of bound parameters).
+        rows = self._repository.fetch_all(
+            "SELECT path, COALESCE(artist, ''), COALESCE(album, '') FROM tracks "
+            "WHERE path IN (SELECT value FROM json_each(?))",
+            (json.dumps([str(track_path) for track_path in track_paths]),),
+        )
+        return {path: (artist, album) for path, artist, album in rows}
+
+    def list_artists(self, after: str | None = None, limit: int = 500) -> list[ArtistSummary]:
+        # Keyset paging walks idx_tracks_artist_album in order, so every page
+        # costs the same no matter how deep into the library it starts. NULL
+        # artists sort first and therefore only appear on the first page.
+        aggregates = "SELECT artist, COUNT(DISTINCT album), COUNT(*), COALESCE(SUM(duration_ms), 0) FROM tracks "
+        grouping = "GROUP BY artist ORDER BY artist LIMIT ?"
+        if after is None:
+            rows = self._repository.fetch_all(aggregates + grouping, (limit,))
+        else:
+            rows = self._repository.fetch_all(aggregates + "WHERE artist > ? " + grouping, (after, limit))
+        return [(artist, int(albums), int(tracks), int(duration)) for artist, albums, tracks, duration in rows]
+
+    def list_albums(self, artist: str | None) -> list[AlbumSummary]:
+        rows = self._repository.fetch_all(
+            "SELECT album, COUNT(*), COALESCE(SUM(duration_ms), 0) FROM tracks "
+            "WHERE artist IS ? GROUP BY album ORDER BY album",
+            (artist,),
+        )
+        return [(album, int(tracks), int(duration)) for album, tracks, duration in rows]
+
+    def list_album_tracks(self, artist: str | None, album: str | None) -> list[TrackSummary]:
+        rows = self._repository.fetch_all(
+            "SELECT id, path, COALESCE(title, ''), COALESCE(duration_ms, 0) FROM tracks "
+            "WHERE artist IS ? AND album IS ? ORDER BY title, path",
+            (artist, album),
+        )
+        return [(int(track_id), path, title, int(duration)) for track_id, path, title, duration in rows]
+
+    def list_album_covers(self) -> list[AlbumCover]:
+        rows = self._repository.fetch_all(
+            "SELECT artist, album, COUNT(*), MIN(path) FROM tracks GROUP BY artist, album ORDER BY artist, album"
+        )
+        return [(artist, album, int(tracks), path) for artist, album, tracks, path in rows]
+
+    def ingest_columns(self, columns: Mapping[str, Sequence[Any]]) -> int:
+        """Insert rows given column-wise, as rust_bridge.ingest returns them."""
+        rows = list(zip(*(columns[name] for name in INGEST_COLUMNS)))
+        if not rows:
+            return 0
+
+        return self._repository.execute_many(
+            f"INSERT INTO tracks ({', '.join(INGEST_COLUMNS)}) VALUES ({', '.join('?' * len(INGEST_COLUMNS))}) "
+            "ON CONFLICT(path) DO NOTHING",
+            rows,
+        )
@@ -5,14 +5,17 @@ from collections.abc import Callable
 from pydantic import ValidationError
 
 from app.back_end.services import rust_bridge
+from app.back_end.services.rust_bridge import CancelFlagProtocol
 from app.back_end.utils.class_method_request_models import MetadataValue, MetadataWriteRequest, TrackPathRequest
 from app.back_end.utils.class_method_response_models import ErrorResponse, MethodResponse
 from app.back_end.utils.error_messages import ErrorMessage
+from app.back_end.utils.tracing import traced_methods
 
-MetadataReader = Callable[[str], MethodResponse[dict[str, str]]]
+MetadataReader = Callable[..., MethodResponse[dict[str, str]]]
 MetadataWriter = Callable[[str, dict[str, MetadataValue]], MethodResponse[dict[str, str | list[str]]]]
 
 
+@traced_methods("controller")
 class MetadataController:
     def __init__(
         self,
@@ -22,13 +25,19 @@ class MetadataController:
         self._metadata_reader = metadata_reader or rust_bridge.read_metadata
         self._metadata_writer = metadata_writer or rust_bridge.write_metadata
 
-    def read_metadata(self, path: str) -> MethodResponse[dict[str, str]]:
+    def read_metadata(
+        self,
+        path: str,
+        cancel_flag: CancelFlagProtocol | None = None,
+    ) -> MethodResponse[dict[str, str]]:
         try:
             request = TrackPathRequest(path=path)
         except ValidationError:
             return ErrorResponse(message=ErrorMessage.TRACK_NOT_FOUND)
 
-        return self._metadata_reader(request.path)
+        if cancel_flag is None:
+            return self._metadata_reader(request.path)
+        return self._metadata_reader(request.path, cancel_flag=cancel_flag)
 
     def update_metadata(
         self,
@@ -2,10 +2,18 @@ from app.back_end.data.repositories.repository import Repository
 from app.back_end.utils.class_method_response_models import ErrorResponse, MethodResponse, SuccessResponse
 from app.back_end.utils.error_messages import ErrorMessage
 from app.back_end.utils.success_messages import SuccessMessage
+from app.back_end.utils.tracing import traced_methods
 
 
+@traced_methods("controller")
 class PlaylistController:
     USER_PLAYLIST_KIND = "user"
+    MAX_PAGE_SIZE = 1000
+    _PAGE_QUERY = (
+        "SELECT pt.position, pt.track_id, t.path, t.title, t.artist, t.album, t.duration_ms "
+        "FROM playlist_tracks AS pt JOIN tracks AS t ON t.id = pt.track_id "
+        "WHERE pt.playlist_id = ? "
+    )
 
     def __init__(self, repository: Repository) -> None:
         self._repository = repository
@@ -127,6 +135,80 @@ class PlaylistController:
         )
         return [int(row[0]) for row in rows]
 
+    def get_playlist_track_count(self, playlist_id: int) -> int:
+        row = self._repository.fetch_one(
+            "SELECT COUNT(*) FROM playlist_tracks WHERE playlist_id = ?",
+            (playlist_id,),
+        )
+        return int(row[0]) if row is not None else 0
+
+    def get_track_position(self, playlist_id: int, track_id: int) -> int | None:
+        row = self._repository.fetch_one(
+            "SELECT position FROM playlist_tracks WHERE playlist_id = ? AND track_id = ?",
+            (playlist_id, track_id),
+        )
+        return int(row[0]) if row is not None else None
+
+    def get_playlist_page(
+        self,
+        playlist_id: int,
+        after_position: int = -1,
+        limit: int = 200,
+    ) -> MethodResponse[dict[str, int | str | None]]:
+        if not self._playlist_exists(playlist_id):
+            return ErrorResponse(message=ErrorMessage.PLAYLIST_NOT_FOUND)
+        if not self._is_valid_int(after_position) or not self._is_valid_page_size(limit):
+            return ErrorResponse(message=ErrorMessage.INVALID_PLAYLIST_PAGE)
+
+        rows = self._repository.fetch_all(
+            self._PAGE_QUERY + "AND pt.position > ? ORDER BY pt.position ASC LIMIT ?",
+            (playlist_id, after_position, limit),
+        )
+        return SuccessResponse[dict[str, int | str | None]](
+            message=SuccessMessage.PLAYLIST_PAGE_FETCHED,
+            data=[self._page_row(row) for row in rows],
+        )
+
+    def get_playlist_window(
+        self,
+        playlist_id: int,
+        index: int,
+        radius: int = 50,
+    ) -> MethodResponse[dict[str, int | str | None]]:
+        if not self._playlist_exists(playlist_id):
+            return ErrorResponse(message=ErrorMessage.PLAYLIST_NOT_FOUND)
+        if not self._is_valid_int(index) or index < 0 or not self._is_valid_page_size(radius * 2 + 1):
+            return ErrorResponse(message=ErrorMessage.INVALID_PLAYLIST_PAGE)
+
+        rows = self._repository.fetch_all(
+            self._PAGE_QUERY + "AND pt.position BETWEEN ? AND ? ORDER BY pt.position ASC",
+            (playlist_id, max(0, index - radius), index + radius),
+        )
+        return SuccessResponse[dict[str, int | str | None]](
+            message=SuccessMessage.PLAYLIST_PAGE_FETCHED,
+            data=[self._page_row(row) for row in rows],
+        )
+
+    @staticmethod
+    def _page_row(row: tuple) -> dict[str, int | str | None]:
+        position, track_id, path, title, artist, album, duration_ms = row
+        return {
+            "position": int(position),
+            "track_id": int(track_id),
+            "path": path,
+            "title": title,
+            "artist": artist,
+            "album": album,
+            "duration_ms": duration_ms,
+        }
+
+    @staticmethod
+    def _is_valid_int(value: int) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool)
+
+    def _is_valid_page_size(self, limit: int) -> bool:
+        return self._is_valid_int(limit) and 0 < limit <= self.MAX_PAGE_SIZE
+
     def _playlist_exists(self, playlist_id: int) -> bool:
         row = self._repository.fetch_one("SELECT 1 FROM playlists WHERE id = ? LIMIT 1", (playlist_id,))
         return row is not None
@@ -0,0 +1,171 @@
+import json
+import zlib
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.utils.class_method_response_models import ErrorResponse, MethodResponse, SuccessResponse
+from app.back_end.utils.error_messages import ErrorMessage
+from app.back_end.utils.success_messages import SuccessMessage
+from app.back_end.utils.tracing import traced_methods
+
+
+@dataclass(slots=True)
+class SessionState:
+    track_paths: list[str] = field(default_factory=list)
+    queue_order: list[int] | None = None
+    current_index: int | None = None
+    position_ms: int = 0
+    repeat_mode: str = "off"
+    shuffle_enabled: bool = False
+
+
+@traced_methods("controller")
+class SessionController:
+    """Persists the playback session as a snapshot plus an edit journal.
+
+    The snapshot is a zlib-compressed JSON blob in a single row; edits since
+    the last snapshot are appended to session_journal and replayed on restore.
+    The playback cursor changes constantly, so it is updated in place on the
+    snapshot row instead of being journaled.
+    """
+
+    MAX_JOURNAL_ENTRIES = 256
+    JOURNAL_OPERATIONS = ("enqueue", "move", "repeat_mode", "shuffle")
+
+    def __init__(self, repository: Repository) -> None:
+        self._repository = repository
+
+    def save_snapshot(self, state: SessionState) -> MethodResponse[dict[str, int]]:
+        self._repository.execute_transaction(
+            [
+                (
+                    "INSERT INTO session_snapshot (id, payload, current_index, position_ms) VALUES (1, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET payload = excluded.payload, "
+                    "current_index = excluded.current_index, position_ms = excluded.position_ms, "
+                    "updated_at = CURRENT_TIMESTAMP",
+                    (self._encode_payload(state), state.current_index, max(0, int(state.position_ms))),
+                ),
+                ("DELETE FROM session_journal", ()),
+            ]
+        )
+
+        return SuccessResponse[dict[str, int]](
+            message=SuccessMessage.SESSION_SAVED,
+            data={"track_count": len(state.track_paths)},
+        )
+
+    def record_playback_cursor(self, current_index: int | None, position_ms: int) -> None:
+        self._repository.execute(
+            "INSERT INTO session_snapshot (id, payload, current_index, position_ms) VALUES (1, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET current_index = excluded.current_index, "
+            "position_ms = excluded.position_ms, updated_at = CURRENT_TIMESTAMP",
+            (self._encode_payload(SessionState()), current_index, max(0, int(position_ms))),
+        )
+
+    def append_journal(self, operation: str, payload: dict[str, Any]) -> MethodResponse[dict[str, str]]:
+        if operation not in self.JOURNAL_OPERATIONS or not isinstance(payload, dict):
+            return ErrorResponse(message=ErrorMessage.INVALID_SESSION_OPERATION)
+
+        self._repository.execute(
+            "INSERT INTO session_journal (operation, payload) VALUES (?, ?)",
+            (operation, json.dumps(payload, separators=(",", ":"))),
+        )
+
+        row = self._repository.fetch_one("SELECT COUNT(*) FROM session_journal")
+        if row is not None and int(row[0]) > self.MAX_JOURNAL_ENTRIES:
+            self.compact()
+
+        return SuccessResponse[dict[str, str]](
+            message=SuccessMessage.SESSION_SAVED,
+            data={"operation": operation},
+        )
+
+    def compact(self) -> MethodResponse[dict[str, int]]:
+        restored = self.restore()
+        if not restored.status:
+            return restored
+        return self.save_snapshot(restored.data)
+
+    def restore(self) -> MethodResponse[SessionState]:
+        snapshot_row = self._repository.fetch_one(
+            "SELECT payload, current_index, position_ms FROM session_snapshot WHERE id = 1"
+        )
+        journal_rows = self._repository.fetch_all("SELECT operation, payload FROM session_journal ORDER BY id ASC")
+
+        try:
+            state = SessionState()
+            if snapshot_row is not None:
+                payload, current_index, position_ms = snapshot_row
+                state = SessionState(**json.loads(zlib.decompress(payload)))
+                state.current_index = current_index
+                state.position_ms = int(position_ms)
+            for operation, payload in journal_rows:
+                self._apply(state, operation, json.loads(payload))
+        except (KeyError, TypeError, ValueError, zlib.error):
+            return ErrorResponse(message=ErrorMessage.SESSION_RESTORE_FAILED)
+        if not isinstance(state.track_paths, list) or not all(isinstance(path, str) for path in state.track_paths):
+            return ErrorResponse(message=ErrorMessage.SESSION_RESTORE_FAILED)
+        if len(set(state.track_paths)) != len(state.track_paths):
+            # The queue holds each track once; a session that does not is corrupt.
+            return ErrorResponse(message=ErrorMessage.SESSION_RESTORE_FAILED)
+
+        if state.queue_order is not None and not self._is_permutation(state.queue_order, len(state.track_paths)):
+            # The shuffled order is not worth failing the whole restore over.
+            state.queue_order = None
+
+        if state.current_index is not None and not 0 <= state.current_index < len(state.track_paths):
+            state.current_index = None
+            state.position_ms = 0
+
+        # Skip model validation: the payload is our own and can be very large.
+        return SuccessResponse[SessionState].model_construct(
+            message=SuccessMessage.SESSION_RESTORED,
+            data=state,
+        )
+
+    @staticmethod
+    def _apply(state: SessionState, operation: str, payload: dict[str, Any]) -> None:
+        if operation == "enqueue":
+            start = len(state.track_paths)
+            state.track_paths.extend(payload["paths"])
+            if state.queue_order is not None:
+                state.queue_order.extend(range(start, len(state.track_paths)))
+        elif operation == "move":
+            moved = payload["paths"]
+            position = payload["position"]
+            index_of = {path: index for index, path in enumerate(state.track_paths)}
+            if len(set(moved)) != len(moved) or any(path not in index_of for path in moved):
+                raise ValueError("Moved tracks must be unique and queued.")
+            if not 0 <= position <= len(state.track_paths) - len(moved):
+                raise ValueError("Move position is out of range.")
+            moved_set = set(moved)
+            reordered = [path for path in state.track_paths if path not in moved_set]
+            reordered[position:position] = moved
+            if state.queue_order is not None:
+                # queue_order indexes track_paths, so it follows the moved paths.
+                new_index = {path: index for index, path in enumerate(reordered)}
+                state.queue_order = [new_index[state.track_paths[index]] for index in state.queue_order]
+            state.track_paths = reordered
+        elif operation == "repeat_mode":
+            state.repeat_mode = payload["mode"]
+        elif operation == "shuffle":
+            state.shuffle_enabled = bool(payload["enabled"])
+            state.queue_order = payload.get("order")
+        else:
+            raise ValueError(f"Unknown session operation '{operation}'.")
+
+    @staticmethod
+    def _is_permutation(order: Any, length: int) -> bool:
+        if not isinstance(order, list) or len(order) != length:
+            return False
+        if not all(type(index) is int for index in order):
+            return False
+        return sorted(order) == list(range(length))
+
+    @staticmethod
+    def _encode_payload(state: SessionState) -> bytes:
+        snapshot = asdict(state)
+        del snapshot["current_index"]
+        del snapshot["position_ms"]
+        return zlib.compress(json.dumps(snapshot, separators=(",", ":")).encode("utf-8"))
@@ -5,6 +5,14 @@ from pathlib import Path
 
 
 class DatabaseHandler:
+    # Columns added to `tracks` after its first release; databases created
+    # before then gain them when the schema is initialized.
+    TRACK_COLUMN_MIGRATIONS = (
+        ("file_size", "INTEGER"),
+        ("file_mtime_ns", "INTEGER"),
+        ("file_inode", "INTEGER"),
+    )
+
     def __init__(self, db_path: str | Path | None = None) -> None:
         self.db_path = self._resolve_db_path(db_path)
         self._connection: sqlite3.Connection | None = None
@@ -36,6 +44,10 @@ class DatabaseHandler:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             self._connection = sqlite3.connect(self.db_path)
             self._connection.execute("PRAGMA foreign_keys = ON;")
+            # WAL lets background writers (library import) commit without
+            # blocking the GUI thread's own short writes behind a rollback journal.
+            self._connection.execute("PRAGMA journal_mode = WAL;")
+            self._connection.execute("PRAGMA synchronous = NORMAL;")
         return self._connection
 
     def close(self) -> None:
@@ -58,11 +70,18 @@ class DatabaseHandler:
                 duration_ms INTEGER,
                 is_favorite INTEGER NOT NULL DEFAULT 0,
                 artwork_hash TEXT,
+                file_size INTEGER,
+                file_mtime_ns INTEGER,
+                file_inode INTEGER,
                 created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
                 updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
             );
             """
         )
+        self._add_missing_columns(cursor, "tracks", self.TRACK_COLUMN_MIGRATIONS)
+        # Covers the library browser's grouped artist/album queries, including
+        # their duration sums, without touching the table rows.
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_artist_album ON tracks (artist, album, duration_ms);")
         cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS playlists (
@@ -89,8 +108,35 @@ class DatabaseHandler:
             );
             """
         )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS session_snapshot (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                payload BLOB NOT NULL,
+                current_index INTEGER,
+                position_ms INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS session_journal (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                operation TEXT NOT NULL,
+                payload TEXT NOT NULL
+            );
+            """
+        )
         connection.commit()
 
+    @staticmethod
+    def _add_missing_columns(cursor: sqlite3.Cursor, table_name: str, columns: tuple[tuple[str, str], ...]) -> None:
+        existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table_name});")}
+        for column_name, column_type in columns:
+            if column_name not in existing:
+                cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type};")
+
     def table_exists(self, table_name: str) -> bool:
         connection = self.connect()
         cursor = connection.execute(
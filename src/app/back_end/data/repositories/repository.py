@@ -2,22 +2,48 @@ from collections.abc import Sequence
 from typing import Any
 
 from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.utils.tracing import traced
+
+
+def _query(repository: "Repository", query: str, *args: Any, **kwargs: Any) -> str:
+    return query
+
+
+def _statement_count(repository: "Repository", statements: Sequence[tuple[str, Sequence[Any]]]) -> str:
+    return f"{len(statements)} statements"
 
 
 class Repository:
     def __init__(self, db_handler: DatabaseHandler) -> None:
         self.db_handler = db_handler
 
+    @traced("sqlite", detail=_query)
     def execute(self, query: str, params: Sequence[Any] = ()) -> None:
         connection = self.db_handler.connect()
         connection.execute(query, params)
         connection.commit()
 
+    @traced("sqlite", detail=_query)
+    def execute_many(self, query: str, rows: Sequence[Sequence[Any]]) -> int:
+        connection = self.db_handler.connect()
+        with connection:
+            cursor = connection.executemany(query, rows)
+        return cursor.rowcount
+
+    @traced("sqlite", detail=_statement_count)
+    def execute_transaction(self, statements: Sequence[tuple[str, Sequence[Any]]]) -> None:
+        connection = self.db_handler.connect()
+        with connection:
+            for query, params in statements:
+                connection.execute(query, params)
+
+    @traced("sqlite", detail=_query)
     def fetch_one(self, query: str, params: Sequence[Any] = ()) -> tuple[Any, ...] | None:
         connection = self.db_handler.connect()
         cursor = connection.execute(query, params)
         return cursor.fetchone()
 
+    @traced("sqlite", detail=_query)
     def fetch_all(self, query: str, params: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
         connection = self.db_handler.connect()
         cursor = connection.execute(query, params)
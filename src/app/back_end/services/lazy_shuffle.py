@@ -0,0 +1,143 @@
+import random
+from collections import deque
+from collections.abc import Mapping
+from typing import Protocol
+
+
+class SequenceSourceProtocol(Protocol):
+    def sequence_bound(self) -> int: ...
+
+    def sequence_of(self, track_id: str) -> int: ...
+
+    def track_for_sequence(self, sequence: int) -> str | None: ...
+
+
+class LazyShuffle:
+    """Shuffle that draws tracks on demand instead of permuting the queue.
+
+    Draws run an incremental Fisher-Yates over the source's sequence numbers:
+    only swapped slots are stored, so enabling the shuffle is O(1) and memory
+    grows with the number of tracks played rather than the queue length.
+    Sequences added after enabling join the pool; removed ones are skipped.
+    """
+
+    DEFAULT_HISTORY_LIMIT = 500
+
+    def __init__(
+        self,
+        source: SequenceSourceProtocol,
+        seed: int | None = None,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> None:
+        self._source = source
+        self._rng = random.Random(seed)
+        self._drawn_count = 0
+        self._value_at_slot: dict[int, int] = {}
+        self._slot_of_value: dict[int, int] = {}
+        self._history: deque[str] = deque(maxlen=history_limit)
+        self._cursor = -1
+        self._pending: deque[str] = deque()
+
+    def next_track(self, current_track_id: str) -> str | None:
+        if self._is_at_cursor(current_track_id) and self._cursor + 1 < len(self._history):
+            self._cursor += 1
+            return self._history[self._cursor]
+
+        self._anchor(current_track_id)
+        track_id = self._pending.popleft() if self._pending else self._draw()
+        if track_id is not None:
+            self._record(track_id)
+        return track_id
+
+    def previous_track(self, current_track_id: str) -> str | None:
+        self._anchor(current_track_id)
+        if self._cursor <= 0:
+            return None
+        self._cursor -= 1
+        return self._history[self._cursor]
+
+    def upcoming(self, current_track_id: str, count: int) -> list[str]:
+        # Only already decided tracks are reported; peeking must not draw.
+        decided = list(self._pending)
+        if self._is_at_cursor(current_track_id):
+            decided = [*list(self._history)[self._cursor + 1 :], *decided]
+        return decided[:count]
+
+    def push_next(self, track_id: str) -> None:
+        self._claim(self._source.sequence_of(track_id))
+        self._pending.appendleft(track_id)
+
+    def forget(self, track_id: str) -> None:
+        if track_id in self._pending:
+            self._pending.remove(track_id)
+        if track_id not in self._history:
+            return
+
+        current = self._history[self._cursor] if self._cursor >= 0 else None
+        remaining = [entry for entry in self._history if entry != track_id]
+        self._history = deque(remaining, maxlen=self._history.maxlen)
+        if current in self._history:
+            self._cursor = self._history.index(current)
+        else:
+            self._cursor = min(self._cursor, len(self._history) - 1)
+
+    def renumber(self, sequences: Mapping[int, int]) -> None:
+        """Follow the source renumbering its sequences; missing ones were removed."""
+        drawn = [
+            sequences[value]
+            for value, slot in self._slot_of_value.items()
+            if slot < 0 and value in sequences
+        ]
+        # Draws are uniform over the undrawn slots whatever their order, so
+        # replaying the claims onto a fresh permutation keeps the round intact.
+        self.start_new_round()
+        for value in drawn:
+            self._claim(value)
+
+    def start_new_round(self) -> None:
+        self._drawn_count = 0
+        self._value_at_slot.clear()
+        self._slot_of_value.clear()
+
+    def _is_at_cursor(self, track_id: str) -> bool:
+        return 0 <= self._cursor < len(self._history) and self._history[self._cursor] == track_id
+
+    def _anchor(self, current_track_id: str) -> None:
+        if self._is_at_cursor(current_track_id):
+            return
+
+        # The listener jumped outside of the shuffle history; continue from the
+        # chosen track and make sure the pool never hands it out again.
+        self._claim(self._source.sequence_of(current_track_id))
+        self._record(current_track_id)
+
+    def _record(self, track_id: str) -> None:
+        while len(self._history) > self._cursor + 1:
+            self._history.pop()
+        self._history.append(track_id)
+        self._cursor = len(self._history) - 1
+
+    def _draw(self) -> str | None:
+        bound = self._source.sequence_bound()
+        while self._drawn_count < bound:
+            slot = self._rng.randrange(self._drawn_count, bound)
+            track_id = self._source.track_for_sequence(self._take(slot))
+            if track_id is not None:
+                return track_id
+        return None
+
+    def _claim(self, value: int) -> None:
+        slot = self._slot_of_value.get(value, value)
+        if slot >= self._drawn_count:
+            self._take(slot)
+
+    def _take(self, slot: int) -> int:
+        front_slot = self._drawn_count
+        value = self._value_at_slot.pop(slot, slot)
+        if slot != front_slot:
+            front_value = self._value_at_slot.pop(front_slot, front_slot)
+            self._value_at_slot[slot] = front_value
+            self._slot_of_value[front_value] = slot
+        self._slot_of_value[value] = -1
+        self._drawn_count += 1
+        return value
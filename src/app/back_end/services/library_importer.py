@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Mapping, Sequence
+from pathlib import Path, PurePath
+from typing import Any
+
+from app.back_end.controllers.library_controller import LibraryController
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.services import rust_bridge
+from app.back_end.services.rust_bridge import INGEST_COLUMNS, CancelFlagProtocol
+from app.back_end.utils.class_method_response_models import ErrorResponse, MethodResponse, SuccessResponse
+from app.back_end.utils.error_messages import ErrorMessage
+from app.back_end.utils.success_messages import SuccessMessage
+
+Scanner = Callable[[list[str]], MethodResponse[dict[str, str]]]
+MetadataReader = Callable[[str], MethodResponse[dict[str, str]]]
+# Called as ingester(paths, cancel_flag=...), like rust_bridge.ingest.
+Ingester = Callable[..., MethodResponse[dict[str, list[str | int | None]]]]
+BatchCallback = Callable[[list[str]], None]
+ProgressCallback = Callable[[int, int], None]
+
+
+class LibraryImporter:
+    """Scans folders and ingests new audio files into the library in batches.
+
+    Intended to run on a worker thread, so it opens its own connection to the
+    database instead of sharing the GUI thread's one. Each batch is read with
+    one `rust_bridge.ingest` call and written with one executemany; passing a
+    `metadata_reader` reads file by file through it instead.
+    """
+
+    DEFAULT_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        scanner: Scanner | None = None,
+        metadata_reader: MetadataReader | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        ingester: Ingester | None = None,
+    ) -> None:
+        self._db_path = db_path
+        self._scanner = scanner or rust_bridge.scan_library
+        if ingester is None:
+            ingester = rust_bridge.ingest if metadata_reader is None else _per_file_ingester(metadata_reader)
+        self._ingester = ingester
+        self._batch_size = batch_size
+
+    def run(
+        self,
+        folders: list[str],
+        known_paths: Collection[str] = (),
+        on_batch: BatchCallback | None = None,
+        on_progress: ProgressCallback | None = None,
+        cancel_flag: CancelFlagProtocol | None = None,
+    ) -> MethodResponse[dict[str, int]]:
+        scan_response = self._scanner(folders)
+        if not scan_response.status:
+            return scan_response
+        if cancel_flag is not None and cancel_flag.is_cancelled():
+            return ErrorResponse(message=ErrorMessage.LIBRARY_IMPORT_CANCELLED)
+
+        scanned_paths = [entry["path"] for entry in scan_response.data]
+        total = len(scanned_paths)
+        if on_progress is not None:
+            on_progress(0, total)
+
+        seen = set(known_paths)
+        imported = 0
+        batch: list[str] = []
+        db_handler = DatabaseHandler(db_path=self._db_path)
+        library_controller = LibraryController(Repository(db_handler))
+        try:
+            for position, path in enumerate(scanned_paths, start=1):
+                if cancel_flag is not None and cancel_flag.is_cancelled():
+                    return ErrorResponse(message=ErrorMessage.LIBRARY_IMPORT_CANCELLED)
+                if path in seen:
+                    continue
+                seen.add(path)
+                batch.append(path)
+
+                if len(batch) >= self._batch_size:
+                    stored = self._import_batch(library_controller, batch, on_batch, cancel_flag)
+                    if stored is None:
+                        return ErrorResponse(message=ErrorMessage.LIBRARY_IMPORT_CANCELLED)
+                    imported += stored
+                    batch = []
+                    if on_progress is not None:
+                        on_progress(position, total)
+
+            stored = self._import_batch(library_controller, batch, on_batch, cancel_flag)
+            if stored is None:
+                return ErrorResponse(message=ErrorMessage.LIBRARY_IMPORT_CANCELLED)
+            imported += stored
+        finally:
+            db_handler.close()
+
+        if on_progress is not None:
+            on_progress(total, total)
+        return SuccessResponse[dict[str, int]](
+            message=SuccessMessage.LIBRARY_IMPORT_COMPLETED,
+            data={"scanned": total, "imported": imported},
+        )
+
+    def _import_batch(
+        self,
+        library_controller: LibraryController,
+        paths: list[str],
+        on_batch: BatchCallback | None,
+        cancel_flag: CancelFlagProtocol | None,
+    ) -> int | None:
+        """Read and store one batch and return how many tracks were new; None when cancelled during the read."""
+        if not paths:
+            return 0
+        response = self._ingester(paths, cancel_flag=cancel_flag)
+        if response.status:
+            columns = response.data
+        elif cancel_flag is not None and cancel_flag.is_cancelled():
+            return None
+        else:
+            # The backend failed the batch as a whole; the files are still
+            # imported, titled by their names, as unreadable ones always were.
+            columns = _columns_from_metadata(paths, [{} for _ in paths])
+
+        # Paths another import stored meanwhile are skipped by the insert
+        # and not counted.
+        stored = library_controller.ingest_columns(columns)
+        if on_batch is not None:
+            on_batch(list(columns["path"]))
+        return stored
+
+
+def _per_file_ingester(metadata_reader: MetadataReader) -> Ingester:
+    def ingest(paths: list[str], cancel_flag: CancelFlagProtocol | None = None) -> MethodResponse:
+        metadata = []
+        for path in paths:
+            response = metadata_reader(path)
+            metadata.append(response.data if response.status else {})
+        return SuccessResponse[dict[str, list[str | int | None]]](
+            message=SuccessMessage.LIBRARY_INGEST_COMPLETED,
+            data=_columns_from_metadata(paths, metadata),
+        )
+
+    return ingest
+
+
+def _columns_from_metadata(paths: Sequence[str], metadata: Sequence[Mapping[str, str]]) -> dict[str, list[Any]]:
+    columns: dict[str, list[Any]] = {name: [None] * len(paths) for name in INGEST_COLUMNS}
+    columns["path"] = list(paths)
+    columns["title"] = [tags.get("title") or PurePath(path).stem for path, tags in zip(paths, metadata)]
+    columns["artist"] = [tags.get("artist", "") for tags in metadata]
+    columns["album"] = [tags.get("album", "") for tags in metadata]
+    columns["duration_ms"] = [_duration_ms(tags) for tags in metadata]
+    return columns
+
+
+def _duration_ms(metadata: Mapping[str, str]) -> int:
+    try:
+        return int(metadata.get("duration_ms") or 0)
+    except ValueError:
+        return 0
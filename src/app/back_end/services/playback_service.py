@@ -4,6 +4,10 @@ from app.back_end.utils.class_method_response_models import ErrorResponse, Metho
 from app.back_end.utils.error_messages import ErrorMessage
 from app.back_end.utils.success_messages import SuccessMessage
 
+_StrMapResponse = SuccessResponse[dict[str, str]]
+_IntMapResponse = SuccessResponse[dict[str, int]]
+_FloatMapResponse = SuccessResponse[dict[str, float]]
+
 
 class PlaybackBackendProtocol(Protocol):
     def play(self) -> None: ...
@@ -26,8 +30,8 @@ class PlaybackService:
         try:
             self._player_backend.play()
         except Exception:
-            return ErrorResponse(message=ErrorMessage.PLAYBACK_OPERATION_FAILED)
-        return SuccessResponse[dict[str, str]](
+            return ErrorResponse.trusted(message=ErrorMessage.PLAYBACK_OPERATION_FAILED)
+        return _StrMapResponse.trusted(
             message=SuccessMessage.PLAYBACK_STARTED,
             data={"action": "play"},
         )
@@ -36,40 +40,40 @@ class PlaybackService:
         try:
             self._player_backend.pause()
         except Exception:
-            return ErrorResponse(message=ErrorMessage.PLAYBACK_OPERATION_FAILED)
-        return SuccessResponse[dict[str, str]](
+            return ErrorResponse.trusted(message=ErrorMessage.PLAYBACK_OPERATION_FAILED)
+        return _StrMapResponse.trusted(
             message=SuccessMessage.PLAYBACK_PAUSED,
             data={"action": "pause"},
         )
 
     def seek(self, position_ms: int) -> MethodResponse[dict[str, int]]:
         if not isinstance(position_ms, int) or position_ms < 0:
-            return ErrorResponse(message=ErrorMessage.INVALID_SEEK_POSITION)
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_SEEK_POSITION)
 
         try:
             self._player_backend.setPosition(position_ms)
         except Exception:
-            return ErrorResponse(message=ErrorMessage.PLAYBACK_OPERATION_FAILED)
+            return ErrorResponse.trusted(message=ErrorMessage.PLAYBACK_OPERATION_FAILED)
 
-        return SuccessResponse[dict[str, int]](
+        return _IntMapResponse.trusted(
             message=SuccessMessage.SEEK_COMPLETED,
             data={"position_ms": position_ms},
         )
 
     def set_playback_speed(self, rate: float) -> MethodResponse[dict[str, float]]:
         if isinstance(rate, bool) or not isinstance(rate, int | float):
-            return ErrorResponse(message=ErrorMessage.INVALID_PLAYBACK_SPEED)
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_PLAYBACK_SPEED)
 
         speed = float(rate)
         if speed < self.MIN_PLAYBACK_SPEED or speed > self.MAX_PLAYBACK_SPEED:
-            return ErrorResponse(message=ErrorMessage.INVALID_PLAYBACK_SPEED)
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_PLAYBACK_SPEED)
 
         try:
             self._player_backend.setPlaybackRate(speed)
         except Exception:
-            return ErrorResponse(message=ErrorMessage.PLAYBACK_OPERATION_FAILED)
+            return ErrorResponse.trusted(message=ErrorMessage.PLAYBACK_OPERATION_FAILED)
 
-        return SuccessResponse[dict[str, float]](
+        return _FloatMapResponse.trusted(
             message=SuccessMessage.PLAYBACK_SPEED_UPDATED,
             data={"playback_speed": speed},
         )
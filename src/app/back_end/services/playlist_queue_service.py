@@ -0,0 +1,155 @@
+from app.back_end.controllers.playlist_controller import PlaylistController
+from app.back_end.services.lazy_shuffle import LazyShuffle
+from app.back_end.services.queue_service import RepeatMode, ShuffleMode
+from app.back_end.utils.class_method_response_models import ErrorResponse, MethodResponse, SuccessResponse
+from app.back_end.utils.error_messages import ErrorMessage
+from app.back_end.utils.success_messages import SuccessMessage
+
+
+class PlaylistQueueService:
+    """Queue over a stored playlist that never loads the whole playlist.
+
+    Only a window of ``2 * window_radius + 1`` rows around the last resolved
+    position is cached; anything outside it is paged in from playlist_tracks
+    by position, so memory stays flat regardless of playlist length.
+    """
+
+    DEFAULT_WINDOW_RADIUS = 32
+
+    def __init__(
+        self,
+        playlist_controller: PlaylistController,
+        playlist_id: int,
+        window_radius: int = DEFAULT_WINDOW_RADIUS,
+    ) -> None:
+        self._playlist_controller = playlist_controller
+        self._playlist_id = playlist_id
+        self._window_radius = window_radius
+        self._track_ids_by_position: dict[int, str] = {}
+        self._positions_by_track_id: dict[str, int] = {}
+        self._track_count = playlist_controller.get_playlist_track_count(playlist_id)
+        self._repeat_mode = RepeatMode.OFF
+        self._lazy_shuffle: LazyShuffle | None = None
+
+    def refresh(self) -> None:
+        self._track_ids_by_position.clear()
+        self._positions_by_track_id.clear()
+        self._track_count = self._playlist_controller.get_playlist_track_count(self._playlist_id)
+
+    def set_repeat_mode(self, mode: str) -> MethodResponse[dict[str, str]]:
+        try:
+            resolved_mode = RepeatMode(mode)
+        except ValueError:
+            return ErrorResponse(message=ErrorMessage.INVALID_REPEAT_MODE)
+
+        self._repeat_mode = resolved_mode
+        return SuccessResponse[dict[str, str]](
+            message=SuccessMessage.QUEUE_MODE_UPDATED,
+            data={"repeat_mode": self._repeat_mode.value},
+        )
+
+    def set_shuffle(
+        self,
+        enabled: bool,
+        seed: int | None = None,
+        mode: str = ShuffleMode.LAZY.value,
+    ) -> MethodResponse[dict[str, bool]]:
+        if not isinstance(enabled, bool):
+            return ErrorResponse(message=ErrorMessage.INVALID_SHUFFLE_FLAG)
+        # Materializing shuffles would defeat the paging, so only lazy is offered.
+        if mode != ShuffleMode.LAZY.value:
+            return ErrorResponse(message=ErrorMessage.INVALID_SHUFFLE_MODE)
+
+        self._lazy_shuffle = LazyShuffle(self, seed=seed) if enabled else None
+        return SuccessResponse[dict[str, bool]](
+            message=SuccessMessage.QUEUE_MODE_UPDATED,
+            data={"shuffle_enabled": enabled},
+        )
+
+    def next_track(self, current_track_id: str) -> MethodResponse[dict[str, str | None]]:
+        return self._resolve_neighbor(current_track_id=current_track_id, direction=1)
+
+    def previous_track(self, current_track_id: str) -> MethodResponse[dict[str, str | None]]:
+        return self._resolve_neighbor(current_track_id=current_track_id, direction=-1)
+
+    def sequence_bound(self) -> int:
+        return self._track_count
+
+    def sequence_of(self, track_id: str) -> int:
+        position = self._position_of(track_id)
+        if position is None:
+            raise KeyError(track_id)
+        return position
+
+    def track_for_sequence(self, sequence: int) -> str | None:
+        if sequence in self._track_ids_by_position:
+            return self._track_ids_by_position[sequence]
+
+        response = self._playlist_controller.get_playlist_window(self._playlist_id, sequence, radius=0)
+        if not response.status or not response.data:
+            return None
+        return str(response.data[0]["track_id"])
+
+    def _resolve_neighbor(self, current_track_id: str, direction: int) -> MethodResponse[dict[str, str | None]]:
+        position = self._position_of(current_track_id)
+        if position is None:
+            return ErrorResponse(message=ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE)
+
+        if self._repeat_mode == RepeatMode.REPEAT_ONE:
+            return SuccessResponse[dict[str, str | None]](
+                message=SuccessMessage.QUEUE_TRACK_RESOLVED,
+                data={"track_id": current_track_id},
+            )
+
+        if self._lazy_shuffle is not None:
+            track_id = self._resolve_lazy_neighbor(current_track_id, direction)
+        else:
+            track_id = self._track_at(position + direction)
+            if track_id is None and self._repeat_mode == RepeatMode.REPEAT_ALL and self._track_count:
+                track_id = self._track_at(0 if direction > 0 else self._track_count - 1)
+
+        return SuccessResponse[dict[str, str | None]](
+            message=SuccessMessage.QUEUE_TRACK_RESOLVED,
+            data={"track_id": track_id},
+        )
+
+    def _resolve_lazy_neighbor(self, current_track_id: str, direction: int) -> str | None:
+        if direction < 0:
+            return self._lazy_shuffle.previous_track(current_track_id)
+
+        track_id = self._lazy_shuffle.next_track(current_track_id)
+        if track_id is None and self._repeat_mode == RepeatMode.REPEAT_ALL:
+            self._lazy_shuffle.start_new_round()
+            track_id = self._lazy_shuffle.next_track(current_track_id)
+        return track_id
+
+    def _position_of(self, track_id: str) -> int | None:
+        if track_id in self._positions_by_track_id:
+            return self._positions_by_track_id[track_id]
+        try:
+            return self._playlist_controller.get_track_position(self._playlist_id, int(track_id))
+        except (TypeError, ValueError):
+            return None
+
+    def _track_at(self, position: int) -> str | None:
+        if position < 0 or position >= self._track_count:
+            return None
+        if position not in self._track_ids_by_position:
+            self._load_window(position)
+        return self._track_ids_by_position.get(position)
+
+    def _load_window(self, position: int) -> None:
+        response = self._playlist_controller.get_playlist_window(
+            self._playlist_id,
+            position,
+            radius=self._window_radius,
+        )
+        self._track_ids_by_position.clear()
+        self._positions_by_track_id.clear()
+        if not response.status:
+            return
+
+        for row in response.data:
+            track_id = str(row["track_id"])
+            self._track_ids_by_position[row["position"]] = track_id
+            self._positions_by_track_id[track_id] = row["position"]
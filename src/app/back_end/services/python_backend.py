@@ -0,0 +1,268 @@
+"""Pure-Python twin of the `rust_back_end_native` extension module.
+
+Used by rust_bridge when the native build is not installed (or when
+MUSIC_PLAYER_BACKEND=python). Every function mirrors its Rust counterpart:
+the same signature, the same sidecar and cover-file conventions and the same
+results, so switching backends never changes what the app shows.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+
+BACKEND_VERSION = "0.1.0+python"
+AUDIO_EXTENSIONS = frozenset({".mp3", ".m4a", ".flac", ".wav", ".ogg", ".aac", ".opus", ".aiff", ".wma"})
+CANCELLED_MESSAGE = "Operation cancelled."
+INGEST_COLUMNS = (
+    "path",
+    "title",
+    "artist",
+    "album",
+    "duration_ms",
+    "file_size",
+    "file_mtime_ns",
+    "file_inode",
+    "artwork_hash",
+)
+
+
+class CancelFlag:
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+def _check_cancelled(cancel_flag: CancelFlag | None) -> None:
+    if cancel_flag is not None and cancel_flag.is_cancelled():
+        raise RuntimeError(CANCELLED_MESSAGE)
+
+
+def _sidecar_path(audio_path: Path) -> Path:
+    return audio_path.with_name(f"{audio_path.name or 'track'}.musicmeta.json")
+
+
+def _load_sidecar(audio_path: Path) -> dict[str, str]:
+    try:
+        with open(_sidecar_path(audio_path), encoding="utf-8") as sidecar:
+            parsed = json.load(sidecar)
+    except (OSError, ValueError):
+        return {}
+    # Like serde's HashMap<String, String>, anything but a flat string map is
+    # treated as no sidecar at all.
+    if not isinstance(parsed, dict) or not all(isinstance(value, str) for value in parsed.values()):
+        return {}
+    return parsed
+
+
+def backend_version() -> str:
+    return BACKEND_VERSION
+
+
+def scan_library(paths: list[str]) -> list[str]:
+    if not paths:
+        raise RuntimeError("At least one scan path is required.")
+
+    collected: list[str] = []
+    for raw_path in paths:
+        if os.path.isfile(raw_path):
+            if os.path.splitext(raw_path)[1].lower() in AUDIO_EXTENSIONS:
+                collected.append(raw_path)
+            continue
+        if os.path.isdir(raw_path):
+            _scan_directory(raw_path, collected)
+
+    return sorted(set(collected))
+
+
+def _scan_directory(root: str, collected: list[str]) -> None:
+    # os.scandir reuses the d_type from the directory listing, so only
+    # symlinks cost an extra stat. Like walkdir, a followed link is skipped
+    # only when it points back at one of its own ancestors.
+    pending: list[tuple[str, frozenset[tuple[int, int]]]] = [(root, frozenset())]
+    while pending:
+        directory, ancestors = pending.pop()
+        try:
+            directory_stat = os.stat(directory)
+            identity = (directory_stat.st_dev, directory_stat.st_ino)
+            if identity in ancestors:
+                continue
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        lineage = ancestors | {identity}
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        pending.append((entry.path, lineage))
+                    elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS:
+                        collected.append(entry.path)
+                except OSError:
+                    continue
+
+
+def read_metadata(path: str, cancel_flag: CancelFlag | None = None) -> dict[str, str]:
+    _check_cancelled(cancel_flag)
+    audio_path = Path(path)
+    if not audio_path.exists():
+        raise RuntimeError(f"Track does not exist: {path}")
+
+    metadata = {"path": path, "title": audio_path.stem, "artist": "", "album": "", "duration_ms": "0"}
+    _check_cancelled(cancel_flag)
+    sidecar = _load_sidecar(audio_path)
+    _check_cancelled(cancel_flag)
+    metadata.update(sidecar)
+    return metadata
+
+
+def write_metadata(path: str, changes: dict[str, str]) -> list[str]:
+    audio_path = Path(path)
+    if not audio_path.exists():
+        raise RuntimeError(f"Track does not exist: {path}")
+    if not changes:
+        raise RuntimeError("Metadata changes cannot be empty.")
+
+    merged = _load_sidecar(audio_path)
+    for key, value in changes.items():
+        if value.strip():
+            merged[key] = value
+        else:
+            merged.pop(key, None)
+
+    with open(_sidecar_path(audio_path), "w", encoding="utf-8") as sidecar:
+        json.dump(merged, sidecar, indent=2, ensure_ascii=False)
+    return sorted(changes)
+
+
+def extract_artwork(path: str, cancel_flag: CancelFlag | None = None) -> bytes | None:
+    _check_cancelled(cancel_flag)
+    audio_path = Path(path)
+    if not audio_path.exists():
+        raise RuntimeError(f"Track does not exist: {path}")
+
+    for candidate in _artwork_candidates(audio_path):
+        _check_cancelled(cancel_flag)
+        if candidate.is_file():
+            return candidate.read_bytes()
+    return None
+
+
+def _artwork_path(audio_path: Path) -> Path | None:
+    for candidate in _artwork_candidates(audio_path):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _artwork_candidates(audio_path: Path) -> list[Path]:
+    parent = audio_path.parent
+    stem = audio_path.stem
+    candidates = [
+        parent / f"{stem}.jpg",
+        parent / f"{stem}.jpeg",
+        parent / f"{stem}.png",
+        parent / "cover.jpg",
+        parent / "cover.jpeg",
+        parent / "cover.png",
+    ]
+    explicit_artwork_path = _load_sidecar(audio_path).get("artwork_path")
+    if explicit_artwork_path:
+        candidates.insert(0, Path(explicit_artwork_path))
+    return candidates
+
+
+def artwork_hash(data: bytes) -> str:
+    return f"{zlib.crc32(data):08x}-{len(data)}"
+
+
+def ingest(paths: list[str], cancel_flag: CancelFlag | None = None) -> dict[str, list]:
+    # The native build splits the batch across threads; here tag parsing holds
+    # the GIL, so one pass in order is as fast.
+    columns: dict[str, list] = {name: [] for name in INGEST_COLUMNS}
+    artwork_hashes: dict[Path, str | None] = {}
+    for path in paths:
+        _check_cancelled(cancel_flag)
+        for name, value in zip(INGEST_COLUMNS, _ingest_one(path, artwork_hashes)):
+            columns[name].append(value)
+    return columns
+
+
+def _ingest_one(path: str, artwork_hashes: dict[Path, str | None]) -> tuple:
+    audio_path = Path(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # A file that vanished since the scan still gets a row, titled by its name.
+        return (path, audio_path.stem, "", "", 0, None, None, None, None)
+
+    tags = _load_sidecar(audio_path)
+    try:
+        duration_ms = int(tags.get("duration_ms", "").strip() or 0)
+    except ValueError:
+        duration_ms = 0
+    return (
+        path,
+        tags.get("title") or audio_path.stem,
+        tags.get("artist", ""),
+        tags.get("album", ""),
+        duration_ms,
+        stat.st_size,
+        stat.st_mtime_ns,
+        stat.st_ino if os.name == "posix" else None,
+        _hash_artwork(audio_path, artwork_hashes),
+    )
+
+
+def _hash_artwork(audio_path: Path, artwork_hashes: dict[Path, str | None]) -> str | None:
+    # Tracks of one album usually share a cover file, so each batch hashes it once.
+    artwork_path = _artwork_path(audio_path)
+    if artwork_path is None:
+        return None
+    if artwork_path not in artwork_hashes:
+        try:
+            artwork_hashes[artwork_path] = artwork_hash(artwork_path.read_bytes())
+        except OSError:
+            artwork_hashes[artwork_path] = None
+    return artwork_hashes[artwork_path]
+
+
+def read_embedded_artwork(path: str) -> bytes | None:
+    """Return the first picture embedded in the file's tags, if any.
+
+    Neither backend looks inside the audio file, so callers use this after
+    `extract_artwork` finds no cover file.
+    """
+    from mutagen import File as MutagenFile
+
+    try:
+        audio = MutagenFile(path)
+        if audio is None:
+            return None
+
+        tags = getattr(audio, "tags", None)
+        if tags:
+            if "covr" in tags and tags["covr"]:
+                return bytes(tags["covr"][0])
+
+            for key in tags.keys():
+                frame = tags[key]
+                frame_data = getattr(frame, "data", None)
+                if frame_data:
+                    return bytes(frame_data)
+
+        pictures = getattr(audio, "pictures", None)
+        if pictures:
+            return bytes(pictures[0].data)
+    except Exception:
+        return None
+
+    return None
@@ -0,0 +1,294 @@
+import random
+from collections.abc import Iterable, Iterator
+
+
+class _QueueNode:
+    __slots__ = ("track_id", "sequence", "priority", "size", "left", "right", "parent", "prev", "next")
+
+    def __init__(self, track_id: str, sequence: int, priority: float) -> None:
+        self.track_id = track_id
+        self.sequence = sequence
+        self.priority = priority
+        self.size = 1
+        self.left: _QueueNode | None = None
+        self.right: _QueueNode | None = None
+        self.parent: _QueueNode | None = None
+        self.prev: _QueueNode | None = None
+        self.next: _QueueNode | None = None
+
+
+def _size(node: _QueueNode | None) -> int:
+    return node.size if node is not None else 0
+
+
+class IndexedQueue:
+    """Ordered, duplicate-free track ids with an id -> node index.
+
+    Nodes live in a size-augmented treap so positional lookups and edits are
+    O(log n); they are also threaded into a doubly linked list so neighbor
+    resolution for next/previous is O(1). Every node also receives a sequence
+    number, giving lazy consumers such as shuffles an id domain that only grows
+    on insert. Removals leave tombstones in it until they outnumber the queued
+    tracks; `remove` then renumbers the survivors and returns the mapping.
+    """
+
+    def __init__(self, track_ids: Iterable[str] = (), seed: int | None = None) -> None:
+        self._rng = random.Random(seed)
+        self._nodes: dict[str, _QueueNode] = {}
+        self._sequence_nodes: list[_QueueNode | None] = []
+        self._root: _QueueNode | None = None
+        self._head: _QueueNode | None = None
+        self._tail: _QueueNode | None = None
+        self._build(list(track_ids))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        node = self._head
+        while node is not None:
+            yield node.track_id
+            node = node.next
+
+    def first(self) -> str | None:
+        return self._head.track_id if self._head is not None else None
+
+    def last(self) -> str | None:
+        return self._tail.track_id if self._tail is not None else None
+
+    def next_of(self, track_id: str) -> str | None:
+        neighbor = self._nodes[track_id].next
+        return neighbor.track_id if neighbor is not None else None
+
+    def previous_of(self, track_id: str) -> str | None:
+        neighbor = self._nodes[track_id].prev
+        return neighbor.track_id if neighbor is not None else None
+
+    def sequence_bound(self) -> int:
+        return len(self._sequence_nodes)
+
+    def sequence_of(self, track_id: str) -> int:
+        return self._nodes[track_id].sequence
+
+    def track_for_sequence(self, sequence: int) -> str | None:
+        node = self._sequence_nodes[sequence]
+        return node.track_id if node is not None else None
+
+    def track_at(self, index: int) -> str:
+        if index < 0 or index >= len(self._nodes):
+            raise IndexError("Queue index out of range.")
+
+        node = self._root
+        while node is not None:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.track_id
+            else:
+                index -= left_size + 1
+                node = node.right
+        raise IndexError("Queue index out of range.")
+
+    def position_of(self, track_id: str) -> int:
+        node = self._nodes[track_id]
+        position = _size(node.left)
+        while node.parent is not None:
+            if node is node.parent.right:
+                position += _size(node.parent.left) + 1
+            node = node.parent
+        return position
+
+    def append(self, track_id: str) -> None:
+        self.insert(len(self._nodes), track_id)
+
+    def insert_after(self, anchor_track_id: str, track_id: str) -> None:
+        self.insert(self.position_of(anchor_track_id) + 1, track_id)
+
+    def insert(self, index: int, track_id: str) -> None:
+        if track_id in self._nodes:
+            raise ValueError(f"Track '{track_id}' is already queued.")
+        if index < 0 or index > len(self._nodes):
+            raise IndexError("Queue index out of range.")
+
+        node = _QueueNode(track_id, len(self._sequence_nodes), self._rng.random())
+        self._attach(node, index)
+        self._nodes[track_id] = node
+        self._sequence_nodes.append(node)
+
+    def remove(self, track_id: str) -> dict[int, int] | None:
+        """Unqueue a track; returns old -> new sequence numbers if this compacted them."""
+        node = self._nodes.pop(track_id)
+        self._sequence_nodes[node.sequence] = None
+        self._detach(node)
+        if len(self._sequence_nodes) - len(self._nodes) > max(len(self._nodes), 1_024):
+            return self._compact_sequences()
+        return None
+
+    def move(self, track_id: str, index: int) -> None:
+        if index < 0 or index >= len(self._nodes):
+            raise IndexError("Queue index out of range.")
+
+        node = self._nodes[track_id]
+        self._detach(node)
+        node.size = 1
+        node.left = node.right = node.parent = node.prev = node.next = None
+        self._attach(node, index)
+
+    def _build(self, track_ids: list[str]) -> None:
+        nodes = [_QueueNode(track_id, sequence, 0.0) for sequence, track_id in enumerate(track_ids)]
+        self._nodes = dict(zip(track_ids, nodes))
+        if len(self._nodes) != len(nodes):
+            raise ValueError("Queued track ids must be unique.")
+        self._sequence_nodes = nodes
+
+        for left, right in zip(nodes, nodes[1:]):
+            left.next = right
+            right.prev = left
+        if nodes:
+            self._head = nodes[0]
+            self._tail = nodes[-1]
+
+        self._root = self._link_balanced(nodes, 0, len(nodes), None, 0, len(nodes).bit_length())
+
+    def _compact_sequences(self) -> dict[int, int]:
+        # Survivors keep their relative order, so sequence order still follows
+        # insertion order.
+        live = [node for node in self._sequence_nodes if node is not None]
+        renumbered: dict[int, int] = {}
+        for sequence, node in enumerate(live):
+            renumbered[node.sequence] = sequence
+            node.sequence = sequence
+        self._sequence_nodes = live
+        return renumbered
+
+    def _link_balanced(
+        self,
+        nodes: list[_QueueNode],
+        start: int,
+        stop: int,
+        parent: _QueueNode | None,
+        depth: int,
+        max_depth: int,
+    ) -> _QueueNode | None:
+        if start >= stop:
+            return None
+
+        middle = (start + stop) // 2
+        node = nodes[middle]
+        node.parent = parent
+        # Each depth owns a disjoint band of [0, 1) that shrinks toward the
+        # leaves, so the balanced build already satisfies the heap property.
+        node.priority = (max_depth - depth + self._rng.random()) / (max_depth + 1)
+        node.left = self._link_balanced(nodes, start, middle, node, depth + 1, max_depth)
+        node.right = self._link_balanced(nodes, middle + 1, stop, node, depth + 1, max_depth)
+        node.size = stop - start
+        return node
+
+    def _attach(self, node: _QueueNode, index: int) -> None:
+        if self._root is None:
+            self._root = self._head = self._tail = node
+            return
+
+        current = self._root
+        while True:
+            left_size = _size(current.left)
+            if index <= left_size:
+                if current.left is None:
+                    current.left = node
+                    self._link_before(node, current)
+                    break
+                current = current.left
+            else:
+                index -= left_size + 1
+                if current.right is None:
+                    current.right = node
+                    self._link_after(node, current)
+                    break
+                current = current.right
+
+        node.parent = current
+        ancestor: _QueueNode | None = current
+        while ancestor is not None:
+            ancestor.size += 1
+            ancestor = ancestor.parent
+
+        while node.parent is not None and node.priority > node.parent.priority:
+            self._rotate_up(node)
+
+    def _detach(self, node: _QueueNode) -> None:
+        while node.left is not None or node.right is not None:
+            if node.right is None or (node.left is not None and node.left.priority > node.right.priority):
+                self._rotate_up(node.left)
+            else:
+                self._rotate_up(node.right)
+
+        parent = node.parent
+        if parent is None:
+            self._root = None
+        elif parent.left is node:
+            parent.left = None
+        else:
+            parent.right = None
+
+        ancestor = parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+
+    def _link_before(self, node: _QueueNode, successor: _QueueNode) -> None:
+        node.next = successor
+        node.prev = successor.prev
+        if successor.prev is not None:
+            successor.prev.next = node
+        else:
+            self._head = node
+        successor.prev = node
+
+    def _link_after(self, node: _QueueNode, predecessor: _QueueNode) -> None:
+        node.prev = predecessor
+        node.next = predecessor.next
+        if predecessor.next is not None:
+            predecessor.next.prev = node
+        else:
+            self._tail = node
+        predecessor.next = node
+
+    def _rotate_up(self, node: _QueueNode) -> None:
+        parent = node.parent
+        grandparent = parent.parent
+
+        if parent.left is node:
+            parent.left = node.right
+            if node.right is not None:
+                node.right.parent = parent
+            node.right = parent
+        else:
+            parent.right = node.left
+            if node.left is not None:
+                node.left.parent = parent
+            node.left = parent
+
+        parent.parent = node
+        node.parent = grandparent
+        if grandparent is None:
+            self._root = node
+        elif grandparent.left is parent:
+            grandparent.left = node
+        else:
+            grandparent.right = node
+
+        parent.size = _size(parent.left) + _size(parent.right) + 1
+        node.size = _size(node.left) + _size(node.right) + 1
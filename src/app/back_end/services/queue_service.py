@@ -1,11 +1,21 @@
 import random
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from enum import Enum
 
+from app.back_end.services.lazy_shuffle import LazyShuffle
+from app.back_end.services.queue_engine import IndexedQueue
+from app.back_end.services.smart_shuffle import TrackGroup, spread_shuffle
 from app.back_end.utils.class_method_response_models import ErrorResponse, MethodResponse, SuccessResponse
 from app.back_end.utils.error_messages import ErrorMessage
 from app.back_end.utils.success_messages import SuccessMessage
 
+_StrMapResponse = SuccessResponse[dict[str, str]]
+_BoolMapResponse = SuccessResponse[dict[str, bool]]
+_StrListMapResponse = SuccessResponse[dict[str, list[str]]]
+_IntMapResponse = SuccessResponse[dict[str, int]]
+_StrOrIntMapResponse = SuccessResponse[dict[str, str | int]]
+_OptionalStrMapResponse = SuccessResponse[dict[str, str | None]]
+
 
 class RepeatMode(str, Enum):
     OFF = "off"
@@ -13,76 +23,250 @@ class RepeatMode(str, Enum):
     REPEAT_ALL = "repeat_all"
 
 
+class ShuffleMode(str, Enum):
+    FULL = "full"
+    LAZY = "lazy"
+    SPREAD = "spread"
+
+
 class QueueService:
-    def __init__(self, track_ids: Sequence[str]) -> None:
-        self._original_order = list(track_ids)
-        self._active_order = list(track_ids)
+    def __init__(
+        self,
+        track_ids: Sequence[str],
+        track_groups: Mapping[str, TrackGroup] | None = None,
+    ) -> None:
+        self._original_order = IndexedQueue(track_ids)
+        self._track_groups: Mapping[str, TrackGroup] = track_groups or {}
+        self._active_order = self._original_order
         self._repeat_mode = RepeatMode.OFF
         self._shuffle_enabled = False
+        self._lazy_shuffle: LazyShuffle | None = None
 
     def set_repeat_mode(self, mode: str) -> MethodResponse[dict[str, str]]:
         try:
             resolved_mode = RepeatMode(mode)
         except ValueError:
-            return ErrorResponse(message=ErrorMessage.INVALID_REPEAT_MODE)
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_REPEAT_MODE)
 
         self._repeat_mode = resolved_mode
-        return SuccessResponse[dict[str, str]](
+        return _StrMapResponse.trusted(
             message=SuccessMessage.QUEUE_MODE_UPDATED,
             data={"repeat_mode": self._repeat_mode.value},
         )
 
-    def set_shuffle(self, enabled: bool, seed: int | None = None) -> MethodResponse[dict[str, bool]]:
+    def set_track_groups(self, track_groups: Mapping[str, TrackGroup]) -> None:
+        self._track_groups = track_groups
+
+    def set_shuffle(
+        self,
+        enabled: bool,
+        seed: int | None = None,
+        mode: str = ShuffleMode.FULL.value,
+    ) -> MethodResponse[dict[str, bool]]:
         if not isinstance(enabled, bool):
-            return ErrorResponse(message=ErrorMessage.INVALID_SHUFFLE_FLAG)
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_SHUFFLE_FLAG)
+        try:
+            resolved_mode = ShuffleMode(mode)
+        except ValueError:
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_SHUFFLE_MODE)
 
         self._shuffle_enabled = enabled
-        if enabled:
+        self._lazy_shuffle = None
+        if enabled and resolved_mode == ShuffleMode.LAZY:
+            self._active_order = self._original_order
+            self._lazy_shuffle = LazyShuffle(self._original_order, seed=seed)
+        elif enabled and resolved_mode == ShuffleMode.SPREAD:
+            spread_order = spread_shuffle(list(self._original_order), self._track_groups, seed=seed)
+            self._active_order = IndexedQueue(spread_order, seed=seed)
+        elif enabled:
             rng = random.Random(seed)
-            self._active_order = list(self._original_order)
-            rng.shuffle(self._active_order)
+            shuffled_order = list(self._original_order)
+            rng.shuffle(shuffled_order)
+            self._active_order = IndexedQueue(shuffled_order, seed=seed)
         else:
-            self._active_order = list(self._original_order)
+            self._active_order = self._original_order
+
+        return _BoolMapResponse.trusted(
+            message=SuccessMessage.QUEUE_MODE_UPDATED,
+            data={"shuffle_enabled": self._shuffle_enabled},
+        )
+
+    def restore_shuffled_order(self, track_ids: Sequence[str]) -> MethodResponse[dict[str, bool]]:
+        if len(track_ids) != len(self._original_order) or any(
+            track_id not in self._original_order for track_id in track_ids
+        ):
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_QUEUE_ORDER)
+        try:
+            restored_order = IndexedQueue(track_ids)
+        except ValueError:
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_QUEUE_ORDER)
 
-        return SuccessResponse[dict[str, bool]](
+        self._shuffle_enabled = True
+        self._lazy_shuffle = None
+        self._active_order = restored_order
+        return _BoolMapResponse.trusted(
             message=SuccessMessage.QUEUE_MODE_UPDATED,
             data={"shuffle_enabled": self._shuffle_enabled},
         )
 
+    def track_ids(self) -> list[str]:
+        return list(self._active_order)
+
     def next_track(self, current_track_id: str) -> MethodResponse[dict[str, str | None]]:
         return self._resolve_neighbor(current_track_id=current_track_id, direction=1)
 
     def previous_track(self, current_track_id: str) -> MethodResponse[dict[str, str | None]]:
         return self._resolve_neighbor(current_track_id=current_track_id, direction=-1)
 
+    def upcoming_tracks(self, current_track_id: str, count: int = 2) -> MethodResponse[dict[str, list[str]]]:
+        if current_track_id not in self._active_order:
+            return ErrorResponse.trusted(message=ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE)
+
+        upcoming: list[str] = []
+        if self._lazy_shuffle is not None:
+            upcoming = self._lazy_shuffle.upcoming(current_track_id, count)
+        elif self._repeat_mode != RepeatMode.REPEAT_ONE:
+            track_id = current_track_id
+            while len(upcoming) < count:
+                track_id = self._active_order.next_of(track_id)
+                if track_id is None and self._repeat_mode == RepeatMode.REPEAT_ALL:
+                    track_id = self._active_order.first()
+                if track_id is None or track_id == current_track_id:
+                    break
+                upcoming.append(track_id)
+
+        return _StrListMapResponse.trusted(
+            message=SuccessMessage.QUEUE_TRACK_RESOLVED,
+            data={"track_ids": upcoming},
+        )
+
+    def enqueue(self, track_ids: Sequence[str]) -> MethodResponse[dict[str, int]]:
+        new_track_ids = list(dict.fromkeys(track_ids))
+        if any(track_id in self._original_order for track_id in new_track_ids):
+            return ErrorResponse.trusted(message=ErrorMessage.TRACK_ALREADY_IN_QUEUE)
+
+        for track_id in new_track_ids:
+            for order in self._orders():
+                order.append(track_id)
+
+        return _IntMapResponse.trusted(
+            message=SuccessMessage.QUEUE_UPDATED,
+            data={"queue_length": len(self._active_order)},
+        )
+
+    def play_next(self, track_id: str, current_track_id: str) -> MethodResponse[dict[str, str]]:
+        if current_track_id not in self._active_order:
+            return ErrorResponse.trusted(message=ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE)
+        if track_id == current_track_id:
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_QUEUE_POSITION)
+
+        for order in self._orders():
+            if track_id in order:
+                self._remove_from(order, track_id)
+            order.insert_after(current_track_id, track_id)
+        if self._lazy_shuffle is not None:
+            self._lazy_shuffle.push_next(track_id)
+
+        return _StrMapResponse.trusted(
+            message=SuccessMessage.QUEUE_UPDATED,
+            data={"track_id": track_id},
+        )
+
+    def remove_track(self, track_id: str) -> MethodResponse[dict[str, str]]:
+        if track_id not in self._active_order:
+            return ErrorResponse.trusted(message=ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE)
+
+        for order in self._orders():
+            self._remove_from(order, track_id)
+        if self._lazy_shuffle is not None:
+            self._lazy_shuffle.forget(track_id)
+
+        return _StrMapResponse.trusted(
+            message=SuccessMessage.QUEUE_UPDATED,
+            data={"track_id": track_id},
+        )
+
+    def move_track(self, track_id: str, position: int) -> MethodResponse[dict[str, str | int]]:
+        if track_id not in self._active_order:
+            return ErrorResponse.trusted(message=ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE)
+        if isinstance(position, bool) or not isinstance(position, int) or not 0 <= position < len(self._active_order):
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_QUEUE_POSITION)
+
+        self._active_order.move(track_id, position)
+        return _StrOrIntMapResponse.trusted(
+            message=SuccessMessage.QUEUE_UPDATED,
+            data={"track_id": track_id, "position": position},
+        )
+
+    def move_tracks(self, track_ids: Sequence[str], position: int) -> MethodResponse[dict[str, int]]:
+        """Move tracks, as one block in the given order, to `position` of the unshuffled order.
+
+        A shuffled order is left as it is; the block lands where the
+        unshuffled order resumes when shuffle is turned off.
+        """
+        moved = list(dict.fromkeys(track_ids))
+        order = self._original_order
+        if not moved or len(moved) != len(track_ids) or any(track_id not in order for track_id in moved):
+            return ErrorResponse.trusted(message=ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE)
+        if isinstance(position, bool) or not isinstance(position, int) or not 0 <= position <= len(order) - len(moved):
+            return ErrorResponse.trusted(message=ErrorMessage.INVALID_QUEUE_POSITION)
+
+        # Parking the block at the tail first means placing each track never
+        # shifts the ones already placed. `move` keeps each track's sequence
+        # number, which a lazy shuffle draws from.
+        last = len(order) - 1
+        for track_id in moved:
+            order.move(track_id, last)
+        for offset, track_id in enumerate(moved):
+            order.move(track_id, position + offset)
+
+        return _IntMapResponse.trusted(
+            message=SuccessMessage.QUEUE_UPDATED,
+            data={"position": position},
+        )
+
+    def _remove_from(self, order: IndexedQueue, track_id: str) -> None:
+        renumbered = order.remove(track_id)
+        # A lazy shuffle always draws from the unshuffled order.
+        if renumbered is not None and self._lazy_shuffle is not None:
+            self._lazy_shuffle.renumber(renumbered)
+
+    def _orders(self) -> list[IndexedQueue]:
+        if self._active_order is self._original_order:
+            return [self._original_order]
+        return [self._original_order, self._active_order]
+
     def _resolve_neighbor(self, current_track_id: str, direction: int) -> MethodResponse[dict[str, str | None]]:
         if current_track_id not in self._active_order:
-            return ErrorResponse(message=ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE)
+            return ErrorResponse.trusted(message=ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE)
 
         if self._repeat_mode == RepeatMode.REPEAT_ONE:
-            return SuccessResponse[dict[str, str | None]](
+            return _OptionalStrMapResponse.trusted(
                 message=SuccessMessage.QUEUE_TRACK_RESOLVED,
                 data={"track_id": current_track_id},
             )
 
-        current_index = self._active_order.index(current_track_id)
-        neighbor_index = current_index + direction
-
-        if 0 <= neighbor_index < len(self._active_order):
-            track_id = self._active_order[neighbor_index]
-            return SuccessResponse[dict[str, str | None]](
-                message=SuccessMessage.QUEUE_TRACK_RESOLVED,
-                data={"track_id": track_id},
-            )
+        if self._lazy_shuffle is not None:
+            track_id = self._resolve_lazy_neighbor(current_track_id, direction)
+        elif direction > 0:
+            track_id = self._active_order.next_of(current_track_id)
+        else:
+            track_id = self._active_order.previous_of(current_track_id)
 
-        if self._repeat_mode == RepeatMode.REPEAT_ALL and self._active_order:
-            wrap_index = 0 if direction > 0 else len(self._active_order) - 1
-            return SuccessResponse[dict[str, str | None]](
-                message=SuccessMessage.QUEUE_TRACK_RESOLVED,
-                data={"track_id": self._active_order[wrap_index]},
-            )
+        if track_id is None and self._repeat_mode == RepeatMode.REPEAT_ALL and self._lazy_shuffle is None:
+            track_id = self._active_order.first() if direction > 0 else self._active_order.last()
 
-        return SuccessResponse[dict[str, str | None]](
+        return _OptionalStrMapResponse.trusted(
             message=SuccessMessage.QUEUE_TRACK_RESOLVED,
-            data={"track_id": None},
+            data={"track_id": track_id},
         )
+
+    def _resolve_lazy_neighbor(self, current_track_id: str, direction: int) -> str | None:
+        if direction < 0:
+            return self._lazy_shuffle.previous_track(current_track_id)
+
+        track_id = self._lazy_shuffle.next_track(current_track_id)
+        if track_id is None and self._repeat_mode == RepeatMode.REPEAT_ALL:
+            self._lazy_shuffle.start_new_round()
+            track_id = self._lazy_shuffle.next_track(current_track_id)
+        return track_id
@@ -1,12 +1,52 @@
+import asyncio
 import importlib
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from types import ModuleType
+from typing import Any, Protocol
 
 from pydantic import ValidationError
 
-from app.back_end.utils.class_method_request_models import LibraryScanRequest, MetadataWriteRequest, TrackPathRequest
-from app.back_end.utils.class_method_response_models import ErrorResponse, MethodResponse, SuccessResponse
+from app.back_end.services import python_backend
+from app.back_end.utils.class_method_request_models import (
+    IngestRequest,
+    LibraryScanRequest,
+    MetadataWriteRequest,
+    TrackPathRequest,
+)
+from app.back_end.utils.class_method_response_models import (
+    ErrorResponse,
+    FastErrorResponse,
+    MethodResponse,
+    SuccessResponse,
+)
 from app.back_end.utils.error_messages import ErrorMessage
 from app.back_end.utils.success_messages import SuccessMessage
+from app.back_end.utils.tracing import traced
+
+_StrMapResponse = SuccessResponse[dict[str, str]]
+_StrOrStrListMapResponse = SuccessResponse[dict[str, str | list[str]]]
+_OptionalBytesMapResponse = SuccessResponse[dict[str, bytes | None]]
+_ColumnsResponse = SuccessResponse[dict[str, list[str | int | None]]]
+
+# "native" requires the Rust build, "python" skips it; anything else prefers
+# the Rust build and falls back to python_backend when it is not installed.
+BACKEND_ENV_VAR = "MUSIC_PLAYER_BACKEND"
+# Columns of an `ingest` result; each is also a `tracks` column.
+INGEST_COLUMNS = python_backend.INGEST_COLUMNS
+
+
+class MetadataBackend(Protocol):
+    """The functions a backend module provides; python_backend documents the contract."""
+
+    scan_library: Callable[[list[str]], list[str]]
+    read_metadata: Callable[..., dict[str, str]]
+    write_metadata: Callable[[str, dict[str, str]], list[str]]
+    extract_artwork: Callable[..., bytes | None]
+    ingest: Callable[..., dict[str, list[str | int | None]]]
 
 
 def _load_rust_backend_module() -> ModuleType:
@@ -19,6 +59,98 @@ def _load_rust_backend_module() -> ModuleType:
         ) from exc
 
 
+def _resolve_backend() -> MetadataBackend:
+    choice = os.environ.get(BACKEND_ENV_VAR, "").strip().lower()
+    if choice == "python":
+        return python_backend
+    try:
+        return _load_rust_backend_module()
+    except RuntimeError:
+        if choice == "native":
+            raise
+        return python_backend
+
+
+_backend: MetadataBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def _load_backend() -> MetadataBackend:
+    # Resolved once: a failed import is not cached by Python, so probing for
+    # the native module on every call would search sys.path every time.
+    global _backend
+    backend = _backend
+    if backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _resolve_backend()
+            backend = _backend
+    return backend
+
+
+def use_backend(backend: MetadataBackend | None) -> None:
+    """Route every bridge call to `backend`; None resolves the default again on next use."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+class CancelFlagProtocol(Protocol):
+    def cancel(self) -> None: ...
+
+    def is_cancelled(self) -> bool: ...
+
+
+class _LocalCancelFlag:
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+def create_cancel_flag() -> CancelFlagProtocol:
+    try:
+        backend = _load_backend()
+    except RuntimeError:
+        return _LocalCancelFlag()
+
+    native_flag_type = getattr(backend, "CancelFlag", None)
+    if native_flag_type is None:
+        return _LocalCancelFlag()
+    return native_flag_type()
+
+
+def _cancel_kwargs(backend: MetadataBackend, cancel_flag: CancelFlagProtocol | None) -> dict[str, Any]:
+    # Only the backend's own flag can be observed from inside its call; other
+    # flags are still honoured before and after it.
+    native_flag_type = getattr(backend, "CancelFlag", None)
+    if cancel_flag is None or native_flag_type is None or not isinstance(cancel_flag, native_flag_type):
+        return {}
+    return {"cancel_flag": cancel_flag}
+
+
+def _is_cancelled(cancel_flag: CancelFlagProtocol | None) -> bool:
+    return cancel_flag is not None and cancel_flag.is_cancelled()
+
+
+def _operation_error(cancel_flag: CancelFlagProtocol | None) -> ErrorResponse | FastErrorResponse:
+    if _is_cancelled(cancel_flag):
+        return ErrorResponse.trusted(message=ErrorMessage.RUST_BACKEND_OPERATION_CANCELLED)
+    return ErrorResponse.trusted(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
+
+
+def _path_detail(path: str, *args: Any, **kwargs: Any) -> str:
+    return path
+
+
+def _paths_detail(paths: list[str], *args: Any, **kwargs: Any) -> str:
+    return f"{len(paths)} paths"
+
+
 def get_rust_backend_version() -> str:
     module = _load_rust_backend_module()
 
@@ -34,74 +166,194 @@ def get_rust_backend_version() -> str:
     return version
 
 
+@traced("bridge", detail=_paths_detail)
 def scan_library(paths: list[str]) -> MethodResponse[dict[str, str]]:
     try:
         request = LibraryScanRequest(paths=paths)
     except ValidationError:
-        return ErrorResponse(message=ErrorMessage.INVALID_LIBRARY_SCAN_PATHS)
+        return ErrorResponse.trusted(message=ErrorMessage.INVALID_LIBRARY_SCAN_PATHS)
 
     try:
-        module = _load_rust_backend_module()
-        raw_paths = module.scan_library(request.paths)
+        backend = _load_backend()
+        raw_paths = backend.scan_library(request.paths)
         normalized = [{"path": str(path)} for path in raw_paths if str(path).strip()]
-        return SuccessResponse[dict[str, str]](
+        return _StrMapResponse.trusted(
             message=SuccessMessage.LIBRARY_SCAN_COMPLETED,
             data=normalized,
         )
     except Exception:
-        return ErrorResponse(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
+        return ErrorResponse.trusted(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
 
 
-def read_metadata(path: str) -> MethodResponse[dict[str, str]]:
+@traced("bridge", detail=_path_detail)
+def read_metadata(path: str, cancel_flag: CancelFlagProtocol | None = None) -> MethodResponse[dict[str, str]]:
     try:
         request = TrackPathRequest(path=path)
     except ValidationError:
-        return ErrorResponse(message=ErrorMessage.TRACK_NOT_FOUND)
+        return ErrorResponse.trusted(message=ErrorMessage.TRACK_NOT_FOUND)
+    if _is_cancelled(cancel_flag):
+        return _operation_error(cancel_flag)
 
     try:
-        module = _load_rust_backend_module()
-        raw_metadata = module.read_metadata(request.path)
+        backend = _load_backend()
+        raw_metadata = backend.read_metadata(request.path, **_cancel_kwargs(backend, cancel_flag))
+        if _is_cancelled(cancel_flag):
+            return _operation_error(cancel_flag)
         normalized = {str(key): str(value) for key, value in dict(raw_metadata).items()}
-        return SuccessResponse[dict[str, str]](
+        return _StrMapResponse.trusted(
             message=SuccessMessage.METADATA_READ_COMPLETED,
             data=normalized,
         )
     except Exception:
-        return ErrorResponse(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
+        return _operation_error(cancel_flag)
 
 
+@traced("bridge", detail=_path_detail)
 def write_metadata(path: str, changes: dict[str, str | int | float | bool]) -> MethodResponse[dict[str, str | list[str]]]:
     try:
         request = MetadataWriteRequest(path=path, changes=changes)
     except ValidationError:
-        return ErrorResponse(message=ErrorMessage.INVALID_METADATA_CHANGES)
+        return ErrorResponse.trusted(message=ErrorMessage.INVALID_METADATA_CHANGES)
 
     try:
-        module = _load_rust_backend_module()
+        backend = _load_backend()
         normalized_changes = {key: str(value) for key, value in request.changes.items()}
-        updated_fields = [str(field) for field in module.write_metadata(request.path, normalized_changes)]
-        return SuccessResponse[dict[str, str | list[str]]](
+        updated_fields = [str(field) for field in backend.write_metadata(request.path, normalized_changes)]
+        return _StrOrStrListMapResponse.trusted(
             message=SuccessMessage.METADATA_WRITE_COMPLETED,
             data={"path": request.path, "updated_fields": updated_fields},
         )
     except Exception:
-        return ErrorResponse(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
+        return ErrorResponse.trusted(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
 
 
-def extract_artwork(path: str) -> MethodResponse[dict[str, bytes | None]]:
+@traced("bridge", detail=_path_detail)
+def extract_artwork(
+    path: str,
+    cancel_flag: CancelFlagProtocol | None = None,
+) -> MethodResponse[dict[str, bytes | None]]:
     try:
         request = TrackPathRequest(path=path)
     except ValidationError:
-        return ErrorResponse(message=ErrorMessage.TRACK_NOT_FOUND)
+        return ErrorResponse.trusted(message=ErrorMessage.TRACK_NOT_FOUND)
+    if _is_cancelled(cancel_flag):
+        return _operation_error(cancel_flag)
 
     try:
-        module = _load_rust_backend_module()
-        artwork_bytes = module.extract_artwork(request.path)
+        backend = _load_backend()
+        artwork_bytes = backend.extract_artwork(request.path, **_cancel_kwargs(backend, cancel_flag))
+        if _is_cancelled(cancel_flag):
+            return _operation_error(cancel_flag)
         if artwork_bytes is not None and not isinstance(artwork_bytes, bytes):
             artwork_bytes = bytes(artwork_bytes)
-        return SuccessResponse[dict[str, bytes | None]](
+        return _OptionalBytesMapResponse.trusted(
             message=SuccessMessage.ARTWORK_EXTRACTION_COMPLETED,
             data={"artwork_bytes": artwork_bytes},
         )
     except Exception:
-        return ErrorResponse(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
+        return _operation_error(cancel_flag)
+
+
+@traced("bridge", detail=_paths_detail)
+def ingest(
+    paths: list[str],
+    cancel_flag: CancelFlagProtocol | None = None,
+) -> MethodResponse[dict[str, list[str | int | None]]]:
+    """Read everything the `tracks` table stores about `paths` in one backend call.
+
+    The data holds one equal-length list per column named in INGEST_COLUMNS,
+    in the order of `paths`; files that cannot be read keep their row, with
+    no stats and their file name as title.
+    """
+    try:
+        request = IngestRequest(paths=paths)
+    except ValidationError:
+        return ErrorResponse.trusted(message=ErrorMessage.INVALID_INGEST_PATHS)
+    if _is_cancelled(cancel_flag):
+        return _operation_error(cancel_flag)
+
+    try:
+        backend = _load_backend()
+        raw_columns = backend.ingest(request.paths, **_cancel_kwargs(backend, cancel_flag))
+        if _is_cancelled(cancel_flag):
+            return _operation_error(cancel_flag)
+        columns = {name: list(raw_columns[name]) for name in INGEST_COLUMNS}
+        if any(len(column) != len(request.paths) for column in columns.values()):
+            return ErrorResponse.trusted(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
+        return _ColumnsResponse.trusted(
+            message=SuccessMessage.LIBRARY_INGEST_COMPLETED,
+            data=columns,
+        )
+    except Exception:
+        return _operation_error(cancel_flag)
+
+
+class AsyncBridge:
+    """Awaitable bridge calls for running many reads from one asyncio loop.
+
+    Calls run on the bridge's own thread pool, and at most `max_concurrency`
+    of them at a time; the rest wait on a semaphore, where cancelling them is
+    free. Cancelling a task whose read has started sets that read's cancel
+    flag, and its slot is only handed on once the worker has returned, so
+    the limit holds even for reads that are winding down.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="bridge-async")
+
+    async def __aenter__(self) -> "AsyncBridge":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def scan_library(self, paths: list[str]) -> MethodResponse[dict[str, str]]:
+        return await self._run(scan_library, paths)
+
+    async def read_metadata(self, path: str) -> MethodResponse[dict[str, str]]:
+        return await self._run_cancellable(read_metadata, path)
+
+    async def write_metadata(
+        self, path: str, changes: dict[str, str | int | float | bool]
+    ) -> MethodResponse[dict[str, str | list[str]]]:
+        return await self._run(write_metadata, path, changes)
+
+    async def extract_artwork(self, path: str) -> MethodResponse[dict[str, bytes | None]]:
+        return await self._run_cancellable(extract_artwork, path)
+
+    async def ingest(self, paths: list[str]) -> MethodResponse[dict[str, list[str | int | None]]]:
+        return await self._run_cancellable(ingest, paths)
+
+    async def _run_cancellable(self, function: Callable[..., Any], *args: Any) -> Any:
+        cancel_flag = create_cancel_flag()
+        try:
+            return await self._run(partial(function, cancel_flag=cancel_flag), *args)
+        except asyncio.CancelledError:
+            cancel_flag.cancel()
+            raise
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        await self._semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # Released from the worker's completion rather than the awaiting
+        # task, which may be cancelled while the worker is still running.
+        future.add_done_callback(lambda _future: self._release_slot(loop))
+        return await asyncio.wrap_future(future)
+
+    def _release_slot(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.call_soon_threadsafe(self._semaphore.release)
+        except RuntimeError:
+            # The loop closed while the worker ran; nobody is waiting.
+            pass
@@ -0,0 +1,109 @@
+import random
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from heapq import heapify, heappop, heappush, heapreplace
+
+TrackGroup = tuple[str, str]
+
+
+def spread_shuffle(
+    track_ids: Sequence[str],
+    track_groups: Mapping[str, TrackGroup],
+    seed: int | None = None,
+) -> list[str]:
+    """Shuffle so tracks sharing an artist, then an album, land far apart.
+
+    Each artist's tracks are spread evenly over [0, 1), and the tracks are
+    merged in order of those positions, skipping ahead whenever the next one
+    would follow its own artist: O(n log g) for g artists, with no rejection
+    sampling. No two neighbours share an artist unless one artist has more
+    than half the tracks. Albums are spread the same way inside each artist.
+    Tracks without a known artist are treated as their own group.
+    """
+    rng = random.Random(seed)
+
+    albums_by_artist: dict[str, dict[str, list[str]]] = {}
+    for track_id in track_ids:
+        artist, album = track_groups.get(track_id, ("", ""))
+        artist_key = artist.strip().casefold() or f"\0{track_id}"
+        albums = albums_by_artist.setdefault(artist_key, {})
+        albums.setdefault(album.strip().casefold(), []).append(track_id)
+
+    artist_orders = [_spread(list(albums.values()), rng) for albums in albums_by_artist.values()]
+    return _spread(artist_orders, rng, shuffle_groups=False)
+
+
+def _spread(groups: list[list[str]], rng: random.Random, shuffle_groups: bool = True) -> list[str]:
+    # Groups of one size take evenly staggered phases, in random order, so
+    # equal groups alternate; larger groups come first and win ties.
+    rng.shuffle(groups)
+    groups.sort(key=len, reverse=True)
+    class_sizes = Counter(map(len, groups))
+    lanes: Counter[int] = Counter()
+    # Track `index` of a group sits at (index + (lane + 0.5) / count) / size
+    # for the `count` groups of its size, kept as a ratio of integers so that
+    # equal fractions from different group sizes divide to equal floats.
+    steps: list[int] = []
+    offsets: list[int] = []
+    denominators: list[int] = []
+    for group in groups:
+        if shuffle_groups:
+            rng.shuffle(group)
+        size = len(group)
+        count = class_sizes[size]
+        steps.append(2 * count)
+        offsets.append(2 * lanes[size] + 1)
+        denominators.append(2 * count * size)
+        lanes[size] += 1
+
+    # Heaps of (position, rank, index) for each group's next track and of
+    # (-tracks left, rank). Entries go stale as tracks are picked; a stale
+    # count only overstates what is left, so that heap is only brought up to
+    # date when its top says some group might hold more than half.
+    taken = [0] * len(groups)
+    upcoming = [(offsets[rank] / denominators[rank], rank, 0) for rank in range(len(groups))]
+    heapify(upcoming)
+    largest = [(-len(group), rank) for rank, group in enumerate(groups)]
+    heapify(largest)
+
+    order: list[str] = []
+    left = sum(map(len, groups))
+    previous = -1
+    while left:
+        rank = -1
+        while -2 * largest[0][0] > left:
+            negative_count, largest_rank = largest[0]
+            current = taken[largest_rank] - len(groups[largest_rank])
+            if negative_count == current:
+                # More than half of what is left must go now, or two of
+                # its tracks will end up side by side.
+                rank = largest_rank
+                break
+            heapreplace(largest, (current, largest_rank))
+        if rank == -1 or rank == previous:
+            rank = _next_rank(upcoming, taken, previous)
+
+        index = taken[rank]
+        order.append(groups[rank][index])
+        taken[rank] = index + 1
+        left -= 1
+        previous = rank
+        if index + 1 < len(groups[rank]):
+            heappush(upcoming, (((index + 1) * steps[rank] + offsets[rank]) / denominators[rank], rank, index + 1))
+    return order
+
+
+def _next_rank(upcoming: list[tuple[float, int, int]], taken: list[int], previous: int) -> int:
+    """The group whose next track comes first and is not `previous`, unless only `previous` is left."""
+    held = None
+    while upcoming:
+        entry = heappop(upcoming)
+        _position, rank, index = entry
+        if index != taken[rank]:
+            continue
+        if rank != previous:
+            if held is not None:
+                heappush(upcoming, held)
+            return rank
+        held = entry
+    return previous
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from app.back_end.services import rust_bridge
+from app.back_end.services.rust_bridge import CancelFlagProtocol
+from app.back_end.utils.class_method_response_models import MethodResponse
+
+MetadataReader = Callable[..., MethodResponse[dict[str, str]]]
+ArtworkReader = Callable[..., bytes | None]
+
+_MISSING = object()
+
+
+def _read_rust_artwork(path: str, cancel_flag: CancelFlagProtocol | None = None) -> bytes | None:
+    response = rust_bridge.extract_artwork(path, cancel_flag)
+    if not response.status:
+        return None
+    return response.data.get("artwork_bytes")
+
+
+def _call_reader(reader: Callable[..., object], path: str, cancel_flag: CancelFlagProtocol | None) -> object:
+    if cancel_flag is None:
+        return reader(path)
+    return reader(path, cancel_flag=cancel_flag)
+
+
+class _LruCache:
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> object:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: object) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+
+class TrackPrefetcher:
+    """Read-through metadata/artwork caches with background warm-up.
+
+    `warm` schedules upcoming tracks on a small worker pool: their metadata and
+    artwork are read into the caches and the audio file is hinted to the OS
+    page cache, so the next track change only touches memory.
+    """
+
+    DEFAULT_MAX_ENTRIES = 64
+    READ_AHEAD_BYTES = 256 * 1024
+
+    def __init__(
+        self,
+        metadata_reader: MetadataReader | None = None,
+        artwork_reader: ArtworkReader | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        executor: Executor | None = None,
+    ) -> None:
+        self._metadata_reader = metadata_reader or rust_bridge.read_metadata
+        self._artwork_reader = artwork_reader or _read_rust_artwork
+        self._metadata_cache = _LruCache(max_entries)
+        self._artwork_cache = _LruCache(max_entries)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=2, thread_name_prefix="track-prefetch")
+        self._in_flight: dict[str, Future[None]] = {}
+        # Done callbacks run inline when a task finishes before it is
+        # registered, so `_finish` may re-enter while `warm` holds the lock.
+        self._lock = threading.RLock()
+
+    def metadata_for(
+        self,
+        path: str,
+        cancel_flag: CancelFlagProtocol | None = None,
+    ) -> MethodResponse[dict[str, str]]:
+        cached = self._metadata_cache.get(path)
+        if cached is not _MISSING:
+            return cached
+        response = _call_reader(self._metadata_reader, path, cancel_flag)
+        if response.status:
+            self._metadata_cache.put(path, response)
+        return response
+
+    def artwork_for(self, path: str, cancel_flag: CancelFlagProtocol | None = None) -> bytes | None:
+        cached = self._artwork_cache.get(path)
+        if cached is not _MISSING:
+            return cached
+        artwork_bytes = _call_reader(self._artwork_reader, path, cancel_flag)
+        # An interrupted read says nothing about whether the track has artwork.
+        if cancel_flag is None or not cancel_flag.is_cancelled():
+            self._artwork_cache.put(path, artwork_bytes)
+        return artwork_bytes
+
+    def is_warm(self, path: str) -> bool:
+        return path in self._metadata_cache and path in self._artwork_cache
+
+    def warm(self, paths: Iterable[str]) -> list[Future[None]]:
+        paths = list(paths)
+        futures: list[Future[None]] = []
+        with self._lock:
+            # Warm-ups for tracks that are no longer upcoming are dropped if
+            # they have not started yet, so rapid skipping cannot pile them up.
+            for path, future in list(self._in_flight.items()):
+                if path not in paths:
+                    future.cancel()
+            for path in paths:
+                if path in self._in_flight or self.is_warm(path):
+                    continue
+                future = self._executor.submit(self._warm_one, path)
+                self._in_flight[path] = future
+                future.add_done_callback(lambda _, path=path: self._finish(path))
+                futures.append(future)
+        return futures
+
+    def in_flight_count(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+    def invalidate(self, path: str) -> None:
+        self._metadata_cache.discard(path)
+        self._artwork_cache.discard(path)
+
+    def shutdown(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, path: str) -> None:
+        with self._lock:
+            self._in_flight.pop(path, None)
+
+    def _warm_one(self, path: str) -> None:
+        self._read_ahead(path)
+        self.metadata_for(path)
+        self.artwork_for(path)
+
+    @classmethod
+    def _read_ahead(cls, path: str) -> None:
+        try:
+            descriptor = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                os.read(descriptor, cls.READ_AHEAD_BYTES)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import operator
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from enum import IntFlag
+from functools import reduce
+from itertools import compress
+
+STRING_COLUMNS = ("artist", "album", "genre")
+NUMERIC_COLUMNS = {"track_id": "q", "duration_ms": "q", "flags": "B"}
+
+
+class TrackFlag(IntFlag):
+    FAVORITE = 1
+    HAS_ARTWORK = 2
+    MISSING = 4
+    TAGS_READ = 8
+
+
+class StringColumn:
+    """Dictionary-encoded strings: one array code per row, each distinct value stored once.
+
+    Code 0 is always the empty string, so a fresh row costs nothing to encode.
+    """
+
+    def __init__(self) -> None:
+        self.values: list[str] = [""]
+        self.codes = array("I")
+        self._code_of: dict[str, int] = {"": 0}
+        self._ranks: array | None = None
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+    def encode(self, value: str) -> int:
+        code = self._code_of.get(value)
+        if code is None:
+            code = self._code_of[value] = len(self.values)
+            self.values.append(value)
+            self._ranks = None
+        return code
+
+    def code(self, value: str) -> int | None:
+        return self._code_of.get(value)
+
+    def ranks(self) -> array:
+        """Each code's position in case-insensitive order of the values."""
+        if self._ranks is None:
+            folded = [value.casefold() for value in self.values]
+            # Values equal but for case share a rank, so later sort keys decide.
+            rank_of = {value: rank for rank, value in enumerate(sorted(set(folded)))}
+            self._ranks = array("I", map(rank_of.__getitem__, folded))
+        return self._ranks
+
+
+class TrackRow:
+    """A view of one row; reads go straight to the store's columns."""
+
+    __slots__ = ("_store", "row")
+
+    def __init__(self, store: TrackStore, row: int) -> None:
+        self._store = store
+        self.row = row
+
+    @property
+    def path(self) -> str:
+        return self._store._paths[self.row]
+
+    @property
+    def title(self) -> str:
+        return self._store._titles[self.row]
+
+    @property
+    def artist(self) -> str:
+        return self._store._strings["artist"][self.row]
+
+    @property
+    def album(self) -> str:
+        return self._store._strings["album"][self.row]
+
+    @property
+    def genre(self) -> str:
+        return self._store._strings["genre"][self.row]
+
+    @property
+    def duration_ms(self) -> int:
+        return self._store._numbers["duration_ms"][self.row]
+
+    @property
+    def track_id(self) -> int:
+        return self._store._numbers["track_id"][self.row]
+
+    @property
+    def flags(self) -> TrackFlag:
+        return TrackFlag(self._store._numbers["flags"][self.row])
+
+    def __repr__(self) -> str:
+        return f"TrackRow({self.row}, {self.path!r})"
+
+
+class TrackStore:
+    """Columnar in-memory track table keyed by path.
+
+    Numbers live in typed arrays, artist/album/genre are dictionary-encoded
+    StringColumns, and only path and title keep one str per row. Rows are
+    read through TrackRow views, so no per-track object outlives its use.
+    `sort` and `filter` work on whole columns with C-level sorts, maps and
+    compress, and return row numbers as an array.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()) -> None:
+        self._paths: list[str] = []
+        self._titles: list[str] = []
+        self._row_of: dict[str, int] = {}
+        self._strings = {name: StringColumn() for name in STRING_COLUMNS}
+        self._numbers = {name: array(typecode) for name, typecode in NUMERIC_COLUMNS.items()}
+        self.extend(paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._row_of
+
+    def __getitem__(self, row: int) -> TrackRow:
+        if not -len(self._paths) <= row < len(self._paths):
+            raise IndexError(row)
+        return TrackRow(self, row % len(self._paths))
+
+    def __iter__(self) -> Iterator[TrackRow]:
+        return (TrackRow(self, row) for row in range(len(self._paths)))
+
+    def path(self, row: int) -> str:
+        return self._paths[row]
+
+    def paths(self) -> list[str]:
+        return list(self._paths)
+
+    def row_of(self, path: str) -> int | None:
+        return self._row_of.get(path)
+
+    def append(
+        self,
+        path: str,
+        title: str = "",
+        artist: str = "",
+        album: str = "",
+        genre: str = "",
+        duration_ms: int = 0,
+        track_id: int = 0,
+        flags: int = 0,
+    ) -> int:
+        """Add a row and return its number; a path already stored keeps its row unchanged."""
+        row = self._row_of.get(path)
+        if row is not None:
+            return row
+        row = self._row_of[path] = len(self._paths)
+        self._paths.append(path)
+        self._titles.append(title)
+        for name, value in (("artist", artist), ("album", album), ("genre", genre)):
+            column = self._strings[name]
+            column.codes.append(column.encode(value))
+        self._numbers["duration_ms"].append(duration_ms)
+        self._numbers["track_id"].append(track_id)
+        self._numbers["flags"].append(flags)
+        return row
+
+    def extend(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            self.append(path)
+
+    def extend_columns(self, columns: Mapping[str, Sequence]) -> None:
+        """Append the rows of a column batch such as `rust_bridge.ingest` returns."""
+        paths = columns["path"]
+        empty = [None] * len(paths)
+        titles = columns.get("title", empty)
+        artists = columns.get("artist", empty)
+        albums = columns.get("album", empty)
+        genres = columns.get("genre", empty)
+        durations = columns.get("duration_ms", empty)
+        sizes = columns.get("file_size", empty)
+        artwork = columns.get("artwork_hash", empty)
+        for index, path in enumerate(paths):
+            flags = 0
+            if artwork[index] is not None:
+                flags |= TrackFlag.HAS_ARTWORK
+            if "file_size" in columns and sizes[index] is None:
+                flags |= TrackFlag.MISSING
+            self.append(
+                path,
+                titles[index] or "",
+                artists[index] or "",
+                albums[index] or "",
+                genres[index] or "",
+                durations[index] or 0,
+                flags=flags,
+            )
+
+    def update(self, row: int, **fields: str | int) -> None:
+        for name, value in fields.items():
+            if name == "title":
+                self._titles[row] = value
+            elif name in self._strings:
+                column = self._strings[name]
+                column.codes[row] = column.encode(value)
+            elif name in self._numbers:
+                self._numbers[name][row] = value
+            else:
+                raise ValueError(f"Unknown column: {name}")
+
+    def set_flag(self, rows: Iterable[int], flag: TrackFlag, enabled: bool = True) -> None:
+        flags = self._numbers["flags"]
+        for row in rows:
+            flags[row] = flags[row] | flag if enabled else flags[row] & ~flag
+
+    def reorder(self, rows: Sequence[int]) -> None:
+        """Put the rows in the given order; `rows` must be a permutation of every row."""
+        if len(rows) != len(self._paths) or set(rows) != set(range(len(self._paths))):
+            raise ValueError("Row order must list every row exactly once.")
+        self._paths = list(map(self._paths.__getitem__, rows))
+        self._titles = list(map(self._titles.__getitem__, rows))
+        for column in self._strings.values():
+            column.codes = array("I", map(column.codes.__getitem__, rows))
+        for name, values in self._numbers.items():
+            self._numbers[name] = array(values.typecode, map(values.__getitem__, rows))
+        self._row_of = {path: row for row, path in enumerate(self._paths)}
+
+    def sort(self, keys: Sequence[str], rows: Iterable[int] | None = None) -> array:
+        """Row numbers ordered by `keys`, a "-" prefix making one descending.
+
+        Titles, artists, albums and genres compare case-insensitively; ties
+        keep their row order.
+        """
+        order = list(range(len(self._paths)) if rows is None else rows)
+        # Stable sorts from the last key to the first give a multi-key order
+        # whose every pass runs on a C-level key function.
+        for key in reversed(keys):
+            name = key.removeprefix("-")
+            order.sort(key=self._sort_key(name), reverse=key.startswith("-"))
+        return array("I", order)
+
+    def filter(
+        self,
+        rows: Iterable[int] | None = None,
+        *,
+        artist: str | None = None,
+        album: str | None = None,
+        genre: str | None = None,
+        min_duration_ms: int | None = None,
+        max_duration_ms: int | None = None,
+        flags: int = 0,
+    ) -> array:
+        """Row numbers, from `rows` or every row, matching all the given criteria exactly."""
+        masks: list[Iterable[bool]] = []
+        for name, value in (("artist", artist), ("album", album), ("genre", genre)):
+            if value is None:
+                continue
+            code = self._strings[name].code(value)
+            if code is None:
+                return array("I")
+            masks.append(map(code.__eq__, self._strings[name].codes))
+        durations = self._numbers["duration_ms"]
+        if min_duration_ms is not None:
+            masks.append(map(int(min_duration_ms).__le__, durations))
+        if max_duration_ms is not None:
+            masks.append(map(int(max_duration_ms).__ge__, durations))
+        if flags:
+            required = int(flags)
+            masks.append(map(required.__eq__, map(required.__and__, self._numbers["flags"])))
+
+        if not masks:
+            return array("I", range(len(self._paths)) if rows is None else rows)
+        mask = bytes(reduce(lambda left, right: map(operator.and_, left, right), masks))
+        if rows is None:
+            return array("I", compress(range(len(self._paths)), mask))
+        rows = list(rows)
+        return array("I", compress(rows, map(mask.__getitem__, rows)))
+
+    def _sort_key(self, name: str):
+        if name in self._numbers:
+            return self._numbers[name].__getitem__
+        if name in self._strings:
+            column = self._strings[name]
+            return array("I", map(column.ranks().__getitem__, column.codes)).__getitem__
+        if name == "title":
+            return list(map(str.casefold, self._titles)).__getitem__
+        if name == "path":
+            return self._paths.__getitem__
+        raise ValueError(f"Unknown column: {name}")
@@ -0,0 +1,281 @@
+import re
+from array import array
+from collections import Counter
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from itertools import repeat
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+_SEPARATORS = re.compile(r"[\W_]+")
+_NO_POSTINGS = array("I")
+# The set bits of every byte value, so bitmaps are walked a byte at a time.
+_BIT_OFFSETS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+# Every byte value spread to one 0/1 byte per bit, lowest bit first.
+_BIT_BYTES = tuple(bytes(byte >> bit & 1 for bit in range(8)) for byte in range(256))
+
+
+class TrigramMatch(Generic[K]):
+    """Keys matched by one search.
+
+    Membership and size are O(1) whether the match is held as a set of
+    document ids or as a bitmap, so callers can filter an ordered list by
+    walking it instead of materializing every matching key; `flags` walks
+    a whole slice of such a list without a Python call per key.
+    """
+
+    def __init__(
+        self,
+        document_of: dict[K, int],
+        keys: list[K | None],
+        documents: set[int] | None = None,
+        bitmap: bytes = b"",
+        count: int = 0,
+    ) -> None:
+        self._document_of = document_of
+        self._keys = keys
+        self._documents = documents
+        self._bitmap = bitmap
+        self._count = len(documents) if documents is not None else count
+        self._members: bytes | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: object) -> bool:
+        document = self._document_of.get(key)
+        if document is None:
+            return False
+        if self._documents is not None:
+            return document in self._documents
+        byte = document >> 3
+        return byte < len(self._bitmap) and (self._bitmap[byte] >> (document & 7)) & 1 == 1
+
+    def flags(self, keys: Sequence[K]) -> Iterator[int]:
+        """Yield 1 for each of `keys` in the match and 0 for the rest, e.g. for itertools.compress."""
+        members = self._membership()
+        # Keys without a document read the trailing zero byte.
+        return map(members.__getitem__, map(self._document_of.get, keys, repeat(len(members) - 1)))
+
+    def keys(self) -> list[K]:
+        keys = self._keys
+        if self._documents is not None:
+            return [keys[document] for document in self._documents]
+        bitmap = self._bitmap
+        return [
+            keys[base + bit]
+            for base, byte in zip(range(0, len(bitmap) << 3, 8), bitmap)
+            if byte
+            for bit in _BIT_OFFSETS[byte]
+        ]
+
+    def _membership(self) -> bytes:
+        # One byte per document, built once per match and padded with zeros
+        # for documents indexed after the search.
+        size = len(self._keys) + 1
+        if self._members is None:
+            if self._documents is not None:
+                members = bytearray(size)
+                for document in self._documents:
+                    members[document] = 1
+                self._members = bytes(members)
+            else:
+                self._members = b"".join(map(_BIT_BYTES.__getitem__, self._bitmap))
+        if len(self._members) < size:
+            self._members += bytes(size - len(self._members))
+        return self._members
+
+
+class TrigramIndex(Generic[K]):
+    """Incremental trigram index for type-ahead search over short texts.
+
+    Every key owns one document: its fields, case-folded and reduced to
+    space-separated words, split into trigrams with a leading space per word
+    so prefixes match word starts. Posting lists are append-only arrays of
+    document ids; re-adding or removing a key tombstones the old document,
+    and the postings are compacted once dead documents outnumber live ones.
+
+    Common trigrams also keep a bitmap over document ids. A query whose
+    rarest trigram is still common is answered by ANDing bitmaps, which
+    costs the same however many tracks match; otherwise candidates come from
+    the rarest posting list and are checked against the remaining trigrams.
+    When nothing contains every trigram, documents missing at most
+    `MAX_MISSED_TRIGRAMS` of them, and never more than a third, are returned
+    instead, which absorbs a typo or transposition.
+    """
+
+    BITMAP_MIN_POSTINGS = 2_048
+    MIN_FUZZY_TRIGRAMS = 5
+    MAX_MISSED_TRIGRAMS = 4
+    MAX_FUZZY_CANDIDATES = 4_096
+
+    def __init__(self) -> None:
+        self._document_of: dict[K, int] = {}
+        self._keys: list[K | None] = []
+        self._texts: list[str] = []
+        self._postings: dict[str, array] = {}
+        self._bitmaps: dict[str, bytearray] = {}
+
+    def __len__(self) -> int:
+        return len(self._document_of)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._document_of
+
+    def add(self, key: K, fields: Iterable[str]) -> None:
+        if key in self._document_of:
+            self.remove(key)
+
+        text = self._normalize(" ".join(fields))
+        document = len(self._keys)
+        self._keys.append(key)
+        self._texts.append(text)
+        self._document_of[key] = document
+
+        postings = self._postings
+        bitmaps = self._bitmaps
+        for trigram in self._trigrams(text):
+            posting = postings.get(trigram)
+            if posting is None:
+                postings[trigram] = array("I", (document,))
+                continue
+            posting.append(document)
+            bitmap = bitmaps.get(trigram)
+            if bitmap is not None:
+                self._set_bit(bitmap, document)
+            elif len(posting) >= self.BITMAP_MIN_POSTINGS:
+                bitmap = bitmaps[trigram] = bytearray()
+                for indexed in posting:
+                    if self._keys[indexed] is not None:
+                        self._set_bit(bitmap, indexed)
+
+    def remove(self, key: K) -> None:
+        document = self._document_of.pop(key, None)
+        if document is None:
+            return
+
+        mask = ~(1 << (document & 7)) & 0xFF
+        for trigram in self._trigrams(self._texts[document]):
+            bitmap = self._bitmaps.get(trigram)
+            if bitmap is not None:
+                bitmap[document >> 3] &= mask
+        # An empty text makes the tombstone fail every substring check.
+        self._keys[document] = None
+        self._texts[document] = ""
+        if len(self._keys) - len(self._document_of) > max(len(self._document_of), 1_024):
+            self._compact()
+
+    def clear(self) -> None:
+        # Fresh containers rather than clear(): earlier matches keep reading
+        # the documents they were built from.
+        self._document_of = {}
+        self._keys = []
+        self._texts = []
+        self._postings = {}
+        self._bitmaps = {}
+
+    def search(self, query: str) -> TrigramMatch[K] | None:
+        """Return the keys matching `query`, or None if it is too short to filter."""
+        trigrams = self._query_trigrams(query)
+        if not trigrams:
+            return None
+
+        postings = self._postings
+        ranked = sorted(
+            ((trigram, postings.get(trigram, _NO_POSTINGS)) for trigram in trigrams),
+            key=lambda item: len(item[1]),
+        )
+        if ranked[0][0] in self._bitmaps:
+            match = self._match_bitmaps(ranked)
+            if match is not None:
+                return match
+            documents: set[int] = set()
+        else:
+            documents = self._match_all(ranked)
+
+        if not documents and len(ranked) >= self.MIN_FUZZY_TRIGRAMS:
+            documents = self._match_most(ranked, len(ranked) - min(self.MAX_MISSED_TRIGRAMS, len(ranked) // 3))
+        return TrigramMatch(self._document_of, self._keys, documents=documents)
+
+    def _match_bitmaps(self, ranked: list[tuple[str, array]]) -> TrigramMatch[K] | None:
+        # The rarest posting has a bitmap, so every other one does too.
+        bits = -1
+        for trigram, _posting in ranked:
+            bits &= int.from_bytes(self._bitmaps[trigram], "little")
+        if not bits:
+            return None
+        return TrigramMatch(
+            self._document_of,
+            self._keys,
+            bitmap=bits.to_bytes((bits.bit_length() + 7) // 8, "little"),
+            count=bits.bit_count(),
+        )
+
+    def _match_all(self, ranked: list[tuple[str, array]]) -> set[int]:
+        keys = self._keys
+        texts = self._texts
+        documents = {document for document in ranked[0][1] if keys[document] is not None}
+        for trigram, _posting in ranked[1:]:
+            if not documents:
+                break
+            # The rarest posting bounds the candidates, so checking their
+            # texts is cheaper than walking the longer lists.
+            documents = {document for document in documents if trigram in texts[document]}
+        return documents
+
+    def _match_most(self, ranked: list[tuple[str, array]], needed: int) -> set[int]:
+        # A document missing at most `len - needed` trigrams must appear in at
+        # least one of the `len - needed + 1` rarest posting lists.
+        seeds = ranked[: len(ranked) - needed + 1]
+        if sum(len(posting) for _trigram, posting in seeds) > self.MAX_FUZZY_CANDIDATES:
+            # Only common trigrams survived the typo; a fuzzy match would
+            # return most of the library.
+            return set()
+
+        hits: Counter[int] = Counter()
+        for _trigram, posting in seeds:
+            hits.update(posting)
+
+        keys = self._keys
+        texts = self._texts
+        candidates = [document for document in hits if keys[document] is not None]
+        misses_left = len(ranked) - needed
+        checked = len(seeds)
+        for trigram, _posting in ranked[len(seeds) :]:
+            hits.update(document for document in candidates if trigram in texts[document])
+            checked += 1
+            # Most candidates share a single seed trigram with the query and
+            # drop out at their next miss, so later trigrams check only a few.
+            candidates = [document for document in candidates if checked - hits[document] <= misses_left]
+        return set(candidates)
+
+    def _compact(self) -> None:
+        live = [(key, self._texts[document]) for key, document in self._document_of.items()]
+        self.clear()
+        for key, text in live:
+            self.add(key, (text,))
+
+    @staticmethod
+    def _set_bit(bitmap: bytearray, document: int) -> None:
+        byte = document >> 3
+        if byte >= len(bitmap):
+            bitmap.extend(bytes(byte - len(bitmap) + 1))
+        bitmap[byte] |= 1 << (document & 7)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return f" {_SEPARATORS.sub(' ', text.casefold()).strip()} "
+
+    @staticmethod
+    def _trigrams(text: str) -> set[str]:
+        return {text[start : start + 3] for start in range(len(text) - 2)}
+
+    @staticmethod
+    def _query_trigrams(query: str) -> list[str]:
+        trigrams: dict[str, None] = {}
+        for word in _SEPARATORS.sub(" ", query.casefold()).split():
+            # Words only anchor their start, so any of them may be a prefix.
+            padded = f" {word}"
+            for start in range(len(padded) - 2):
+                trigrams[padded[start : start + 3]] = None
+        return list(trigrams)
@@ -37,6 +37,20 @@ class LibraryScanRequest(BaseRequestModel):
         return value
 
 
+class IngestRequest(BaseRequestModel):
+    paths: list[str]
+
+    @field_validator("paths")
+    @classmethod
+    def validate_paths(cls, value: list[str]) -> list[str]:
+        if not value:
+            raise ValueError("At least one track path is required.")
+        for path in value:
+            if not path.strip():
+                raise ValueError("Track paths cannot include empty values.")
+        return value
+
+
 MetadataValue: TypeAlias = str | int | float | bool
 
 
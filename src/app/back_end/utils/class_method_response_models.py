@@ -1,12 +1,18 @@
-from typing import Generic, Literal, TypeVar
+import os
+from typing import Any, Generic, Literal, TypeVar
 
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import core_schema
 
 from app.back_end.utils.error_messages import ErrorMessage
 from app.back_end.utils.success_messages import SuccessMessage
 
 T = TypeVar("T")
 
+RESPONSE_VALIDATION_ENV_VAR = "MUSIC_PLAYER_VALIDATE_RESPONSES"
+# Debug switch: when set, `trusted(...)` builds fully validated models too.
+VALIDATE_RESPONSES = os.environ.get(RESPONSE_VALIDATION_ENV_VAR, "").strip() not in ("", "0")
+
 
 class BaseResponseModel(BaseModel):
     model_config = ConfigDict(extra="forbid", strict=True)
@@ -17,11 +23,69 @@ class SuccessResponse(BaseResponseModel, Generic[T]):
     message: SuccessMessage
     data: T | list[T]
 
+    @classmethod
+    def trusted(cls, message: SuccessMessage, data: T | list[T]) -> "SuccessResponse[T] | FastSuccessResponse[T]":
+        """Build a response from a payload the caller assembled itself.
+
+        Hot paths call this on a module-level parametrization (subscripting
+        per call costs as much as validating). Validation only runs when
+        VALIDATE_RESPONSES is on.
+        """
+        if VALIDATE_RESPONSES:
+            return cls(message=message, data=data)
+        return FastSuccessResponse(message, data)
+
 
 class ErrorResponse(BaseResponseModel):
     status: Literal[False] = False
     message: ErrorMessage
     data: None = None
 
+    @classmethod
+    def trusted(cls, message: ErrorMessage) -> "ErrorResponse | FastErrorResponse":
+        if VALIDATE_RESPONSES:
+            return cls(message=message)
+        return FastErrorResponse(message)
+
+
+class _FastResponse:
+    __slots__ = ()
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(cls)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _FastResponse | BaseResponseModel):
+            return NotImplemented
+        return (self.status, self.message, self.data) == (other.status, other.message, other.data)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(status={self.status!r}, message={self.message!r}, data={self.data!r})"
+
+
+class FastSuccessResponse(_FastResponse, Generic[T]):
+    """Slotted stand-in for SuccessResponse with the same status/message/data."""
+
+    __slots__ = ("message", "data")
+    status: Literal[True] = True
+
+    def __init__(self, message: SuccessMessage, data: T | list[T]) -> None:
+        self.message = message
+        self.data = data
+
+
+class FastErrorResponse(_FastResponse):
+    """Slotted stand-in for ErrorResponse with the same status/message/data."""
+
+    __slots__ = ("message",)
+    status: Literal[False] = False
+    data: None = None
+
+    def __init__(self, message: ErrorMessage) -> None:
+        self.message = message
+
 
-type MethodResponse[T] = SuccessResponse[T] | ErrorResponse
+type MethodResponse[T] = SuccessResponse[T] | ErrorResponse | FastSuccessResponse[T] | FastErrorResponse
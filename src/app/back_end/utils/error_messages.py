@@ -8,13 +8,23 @@ class ErrorMessage(str, Enum):
     PLAYBACK_OPERATION_FAILED = "Playback operation failed."
     INVALID_REPEAT_MODE = "Invalid repeat mode."
     INVALID_SHUFFLE_FLAG = "Invalid shuffle flag."
+    INVALID_SHUFFLE_MODE = "Invalid shuffle mode."
     TRACK_NOT_FOUND_IN_QUEUE = "Track not found in queue."
+    TRACK_ALREADY_IN_QUEUE = "Track already exists in queue."
+    INVALID_QUEUE_POSITION = "Invalid queue position."
+    INVALID_QUEUE_ORDER = "Invalid queue order."
     TRACK_NOT_FOUND = "Track not found."
     PLAYLIST_NOT_FOUND = "Playlist not found."
     INVALID_PLAYLIST_NAME = "Invalid playlist name."
     TRACK_ALREADY_IN_PLAYLIST = "Track already exists in playlist."
     TRACK_NOT_IN_PLAYLIST = "Track does not exist in playlist."
     INVALID_PLAYLIST_REORDER = "Invalid playlist reorder input."
+    INVALID_PLAYLIST_PAGE = "Invalid playlist page request."
     INVALID_LIBRARY_SCAN_PATHS = "Invalid library scan paths."
+    LIBRARY_IMPORT_CANCELLED = "Library import was cancelled."
+    INVALID_INGEST_PATHS = "Invalid ingest paths."
     INVALID_METADATA_CHANGES = "Invalid metadata changes payload."
+    INVALID_SESSION_OPERATION = "Invalid session operation."
+    SESSION_RESTORE_FAILED = "Session could not be restored."
     RUST_BACKEND_OPERATION_FAILED = "Rust backend operation failed."
+    RUST_BACKEND_OPERATION_CANCELLED = "Rust backend operation was cancelled."
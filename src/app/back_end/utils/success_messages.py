@@ -9,12 +9,18 @@ class SuccessMessage(str, Enum):
     PLAYBACK_SPEED_UPDATED = "Playback speed updated."
     QUEUE_MODE_UPDATED = "Queue mode updated."
     QUEUE_TRACK_RESOLVED = "Queue resolved next or previous track."
+    QUEUE_UPDATED = "Queue updated."
     TRACK_ADDED_TO_FAVORITES = "Track added to favorites."
     PLAYLIST_CREATED = "Playlist created."
     PLAYLIST_UPDATED = "Playlist updated."
     PLAYLIST_DELETED = "Playlist deleted."
     PLAYLIST_TRACKS_UPDATED = "Playlist tracks updated."
+    PLAYLIST_PAGE_FETCHED = "Playlist page fetched."
+    SESSION_SAVED = "Session saved."
+    SESSION_RESTORED = "Session restored."
     LIBRARY_SCAN_COMPLETED = "Library scan completed."
+    LIBRARY_IMPORT_COMPLETED = "Library import completed."
+    LIBRARY_INGEST_COMPLETED = "Library ingest completed."
     METADATA_READ_COMPLETED = "Metadata read completed."
     METADATA_WRITE_COMPLETED = "Metadata write completed."
     ARTWORK_EXTRACTION_COMPLETED = "Artwork extraction completed."
@@ -0,0 +1,189 @@
+"""Opt-in tracing spans, exported as Chrome trace JSON (chrome://tracing, ui.perfetto.dev).
+
+Spans are recorded only while the module-level `tracer` is enabled; a
+disabled traced call costs one flag check. Setting MUSIC_PLAYER_TRACE turns
+tracing on at startup and writes the trace when the app exits: to the path
+it names, or to DEFAULT_TRACE_PATH when it is just "1".
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+TRACE_ENV_VAR = "MUSIC_PLAYER_TRACE"
+DEFAULT_TRACE_PATH = Path("music-player-trace.json")
+
+F = TypeVar("F", bound=Callable[..., Any])
+C = TypeVar("C", bound=type)
+
+# (name, category, start ns, duration ns, thread id, detail)
+SpanRecord = tuple[str, str, int, int, int, str | None]
+
+
+class Tracer:
+    # Keeps the newest spans once full, so a long session cannot grow unbounded.
+    MAX_SPANS = 500_000
+
+    def __init__(self, max_spans: int = MAX_SPANS) -> None:
+        self.enabled = False
+        self._spans: deque[SpanRecord] = deque(maxlen=max_spans)
+        self._thread_names: dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        self._spans.clear()
+        self._thread_names.clear()
+
+    def spans(self) -> list[SpanRecord]:
+        return list(self._spans)
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int, detail: str | None = None) -> None:
+        thread = threading.current_thread()
+        thread_id = thread.ident or 0
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = thread.name
+        # deque.append is atomic, so worker threads need no lock here.
+        self._spans.append((name, category, start_ns, end_ns - start_ns, thread_id, detail))
+
+    @contextmanager
+    def span(self, name: str, category: str = "app", detail: str | None = None) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, category, started, time.perf_counter_ns(), detail)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """The recorded spans as a Chrome trace: complete ("X") events, microsecond timestamps."""
+        process_id = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": process_id, "tid": thread_id, "args": {"name": thread_name}}
+            for thread_id, thread_name in list(self._thread_names.items())
+        ]
+        for name, category, start_ns, duration_ns, thread_id, detail in self.spans():
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1000,
+                "dur": duration_ns / 1000,
+                "pid": process_id,
+                "tid": thread_id,
+            }
+            if detail is not None:
+                event["args"] = {"detail": detail}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        return path
+
+
+tracer = Tracer()
+
+
+def _positional_limit(function: Callable[..., Any]) -> int | None:
+    parameters = inspect.signature(function).parameters.values()
+    if any(parameter.kind is inspect.Parameter.VAR_POSITIONAL for parameter in parameters):
+        return None
+    positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    return sum(parameter.kind in positional for parameter in parameters)
+
+
+def traced(
+    category: str,
+    name: str | None = None,
+    detail: Callable[..., Any] | None = None,
+    qt_slot: bool = False,
+) -> Callable[[F], F]:
+    """Record each call of the decorated function as a span.
+
+    `detail` receives the call's arguments and returns a short string stored
+    with the span (a query, a path); it only runs while tracing is enabled.
+    PyQt reads a slot's arity to drop signal arguments it does not take, which
+    a wrapper hides; `qt_slot` makes the wrapper drop them itself.
+    """
+
+    def decorate(function: F) -> F:
+        span_name = name or function.__qualname__
+        active = tracer
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not active.enabled:
+                return function(*args, **kwargs)
+            started = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                described = None
+                if detail is not None:
+                    try:
+                        described = str(detail(*args, **kwargs))
+                    except Exception:
+                        described = None
+                active.record(span_name, category, started, time.perf_counter_ns(), described)
+
+        positional_limit = _positional_limit(function) if qt_slot else None
+        if positional_limit is not None:
+            traced_call = wrapper
+
+            @functools.wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return traced_call(*args[:positional_limit], **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def traced_methods(category: str, qt_slots: bool = False) -> Callable[[C], C]:
+    """Class decorator: trace every method the class itself defines, dunders aside."""
+
+    def decorate(cls: C) -> C:
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("__"):
+                continue
+            span_name = f"{cls.__qualname__}.{attribute}"
+            if isinstance(value, staticmethod | classmethod):
+                wrapped = traced(category, span_name, qt_slot=qt_slots)(value.__func__)
+                setattr(cls, attribute, type(value)(wrapped))
+            elif inspect.isfunction(value):
+                setattr(cls, attribute, traced(category, span_name, qt_slot=qt_slots)(value))
+        return cls
+
+    return decorate
+
+
+def start_from_environment() -> Path | None:
+    """Enable tracing when MUSIC_PLAYER_TRACE is set and export at exit; returns the output path."""
+    value = os.environ.get(TRACE_ENV_VAR, "").strip()
+    if value in ("", "0"):
+        return None
+    path = DEFAULT_TRACE_PATH if value == "1" else Path(value)
+    tracer.enable()
+    atexit.register(tracer.export, path)
+    return path
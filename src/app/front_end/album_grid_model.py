@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, QSize, Qt
+from PyQt6.QtGui import QColor, QPixmap
+
+from app.back_end.controllers.library_controller import AlbumCover
+from app.front_end.thumbnail_loader import ThumbnailLoader
+
+
+class AlbumGridModel(QAbstractListModel):
+    """One cell per album, with artwork fetched only for painted cells.
+
+    The view asks for DecorationRole only while painting, so that is where
+    thumbnails are requested; until one arrives a shared placeholder is
+    shown, and the cell is repainted when the loader reports it ready.
+    """
+
+    ALBUM_ROLE = Qt.ItemDataRole.UserRole
+    COVER_PATH_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, thumbnail_loader: ThumbnailLoader, thumbnail_size: QSize, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._thumbnail_loader = thumbnail_loader
+        self._albums: list[AlbumCover] = []
+        self._row_of: dict[str, int] = {}
+        self._placeholder = QPixmap(thumbnail_size)
+        self._placeholder.fill(QColor("#1f1f1f"))
+        thumbnail_loader.thumbnail_ready.connect(self._refresh_cover)
+
+    def set_albums(self, albums: Sequence[AlbumCover]) -> None:
+        self.beginResetModel()
+        self._albums = list(albums)
+        self._row_of = {cover_path: row for row, (_artist, _album, _tracks, cover_path) in enumerate(self._albums)}
+        self.endResetModel()
+
+    def cover_path(self, row: int) -> str:
+        return self._albums[row][3]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._albums)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        artist, album, track_count, cover_path = self._albums[index.row()]
+
+        if role == Qt.ItemDataRole.DecorationRole:
+            thumbnail = self._thumbnail_loader.thumbnail(cover_path)
+            return thumbnail if thumbnail is not None else self._placeholder
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{album or 'Unknown Album'}\n{artist or 'Unknown Artist'}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"{album or 'Unknown Album'} - {artist or 'Unknown Artist'} ({track_count:,} tracks)"
+        if role == self.ALBUM_ROLE:
+            return artist, album
+        if role == self.COVER_PATH_ROLE:
+            return cover_path
+        return None
+
+    def _refresh_cover(self, cover_path: str) -> None:
+        row = self._row_of.get(cover_path)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from PyQt6.QtCore import QModelIndex, QRect, QSize, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QListView, QVBoxLayout, QWidget
+
+from app.back_end.controllers.library_controller import LibraryController
+from app.front_end.album_grid_model import AlbumGridModel
+from app.front_end.thumbnail_loader import ArtworkReader, ThumbnailLoader
+
+
+class AlbumGridView(QWidget):
+    THUMBNAIL_SIZE = 160
+    CELL_SPACING = 16
+    CELL_TEXT_HEIGHT = 40
+    # About 600 thumbnails at 160 px; enough for several screens of scroll-back.
+    THUMBNAIL_CACHE_BYTES = 64 * 1024 * 1024
+    PRUNE_INTERVAL_MS = 50
+
+    album_activated = pyqtSignal(object, object)
+
+    def __init__(
+        self,
+        library_controller: LibraryController,
+        artwork_reader: ArtworkReader,
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._library_controller = library_controller
+        self.thumbnail_loader = ThumbnailLoader(artwork_reader, self.THUMBNAIL_SIZE, self.THUMBNAIL_CACHE_BYTES, self)
+        thumbnail_size = QSize(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE)
+        self.model = AlbumGridModel(self.thumbnail_loader, thumbnail_size, self)
+
+        self.list_view = QListView()
+        self.list_view.setViewMode(QListView.ViewMode.IconMode)
+        self.list_view.setMovement(QListView.Movement.Static)
+        self.list_view.setResizeMode(QListView.ResizeMode.Adjust)
+        # Uniform cells let the view lay out thousands of albums without
+        # asking the model for each cell's size hint.
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setWordWrap(True)
+        self.list_view.setIconSize(thumbnail_size)
+        self.list_view.setGridSize(
+            QSize(self.THUMBNAIL_SIZE + self.CELL_SPACING, self.THUMBNAIL_SIZE + self.CELL_TEXT_HEIGHT + self.CELL_SPACING)
+        )
+        self.list_view.setModel(self.model)
+        self.list_view.doubleClicked.connect(self._emit_album_activated)
+
+        # While scrolling, loads queued for cells that already left the
+        # viewport are dropped before a worker spends time on them.
+        self._prune_timer = QTimer(self)
+        self._prune_timer.setSingleShot(True)
+        self._prune_timer.setInterval(self.PRUNE_INTERVAL_MS)
+        self._prune_timer.timeout.connect(self._prune_offscreen_loads)
+        self.list_view.verticalScrollBar().valueChanged.connect(self._schedule_prune)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.list_view)
+
+    def reload(self) -> None:
+        self.thumbnail_loader.retain(())
+        self.model.set_albums(self._library_controller.list_album_covers())
+
+    def visible_rows(self) -> range:
+        row_count = self.model.rowCount()
+        viewport_height = self.list_view.viewport().height()
+        if row_count == 0 or viewport_height <= 0:
+            return range(0)
+        # Cells flow left to right, top to bottom, so their tops only grow
+        # with the row and both ends can be found by bisection.
+        first = self._first_row(lambda rect: rect.bottom() >= 0)
+        stop = self._first_row(lambda rect: rect.top() >= viewport_height)
+        return range(first, stop)
+
+    def _first_row(self, predicate: Callable[[QRect], bool]) -> int:
+        low, high = 0, self.model.rowCount()
+        while low < high:
+            middle = (low + high) // 2
+            if predicate(self.list_view.visualRect(self.model.index(middle))):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def _schedule_prune(self) -> None:
+        if not self._prune_timer.isActive():
+            self._prune_timer.start()
+
+    def _prune_offscreen_loads(self) -> None:
+        self.thumbnail_loader.retain(self.model.cover_path(row) for row in self.visible_rows())
+
+    def _emit_album_activated(self, index: QModelIndex) -> None:
+        artist, album = index.data(AlbumGridModel.ALBUM_ROLE)
+        self.album_activated.emit(artist, album)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from app.back_end.services.library_importer import LibraryImporter
+from app.back_end.services.rust_bridge import create_cancel_flag
+from app.front_end.task_runner import TaskRunner
+
+
+class FolderImportJob(QObject):
+    """Runs a LibraryImporter on the task runner and streams its batches back.
+
+    The importer's callbacks emit signals from the worker thread; receivers on
+    the GUI thread get them through queued connections.
+    """
+
+    batch_ready = pyqtSignal(list)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, importer: LibraryImporter, task_runner: TaskRunner, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._importer = importer
+        self._task_runner = task_runner
+        self._cancel_flag = create_cancel_flag()
+
+    def start(self, folder: str, known_paths: Collection[str]) -> None:
+        self._task_runner.submit(
+            self._importer.run,
+            [folder],
+            known_paths,
+            self.batch_ready.emit,
+            self.progress.emit,
+            self._cancel_flag,
+            on_result=self.finished.emit,
+            on_error=lambda error: self.failed.emit(str(error)),
+        )
+
+    def cancel(self) -> None:
+        self._cancel_flag.cancel()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_flag.is_cancelled()
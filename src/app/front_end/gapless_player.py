@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+
+from PyQt6.QtCore import QObject, QUrl, pyqtSignal
+from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+
+
+class GapMeter:
+    MAX_GAP_MS = 5_000.0
+
+    def __init__(self, max_samples: int = 50) -> None:
+        self._samples: deque[float] = deque(maxlen=max_samples)
+        self._started_at: float | None = None
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+
+    def stop(self) -> float | None:
+        if self._started_at is None:
+            return None
+        gap_ms = (time.perf_counter() - self._started_at) * 1000
+        self._started_at = None
+        # Playback that ended with nothing queued and resumed much later is
+        # not an inter-track gap.
+        if gap_ms > self.MAX_GAP_MS:
+            return None
+        self._samples.append(gap_ms)
+        return gap_ms
+
+    def is_running(self) -> bool:
+        return self._started_at is not None
+
+    def statistics(self) -> dict[str, float]:
+        if not self._samples:
+            return {"count": 0, "last_ms": 0.0, "average_ms": 0.0, "max_ms": 0.0}
+        return {
+            "count": len(self._samples),
+            "last_ms": self._samples[-1],
+            "average_ms": sum(self._samples) / len(self._samples),
+            "max_ms": max(self._samples),
+        }
+
+
+class GaplessPlayer(QObject):
+    """QMediaPlayer-shaped facade over two player/output pairs.
+
+    The next track is loaded into the standby player ahead of time; when the
+    active one reaches EndOfMedia the pairs are swapped and the standby starts
+    immediately instead of opening the file only after the previous one ended.
+    """
+
+    positionChanged = pyqtSignal(int)
+    durationChanged = pyqtSignal(int)
+    playbackStateChanged = pyqtSignal(QMediaPlayer.PlaybackState)
+    mediaStatusChanged = pyqtSignal(QMediaPlayer.MediaStatus)
+    advanced = pyqtSignal(str)
+    gap_measured = pyqtSignal(float)
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        player_factory: Callable[[QObject], QMediaPlayer] = QMediaPlayer,
+        output_factory: Callable[[QObject], QAudioOutput] = QAudioOutput,
+    ) -> None:
+        super().__init__(parent)
+        self._gapless_enabled = True
+        self._prepared_source: QUrl | None = None
+        self._gap_meter = GapMeter()
+
+        self._players: list[QMediaPlayer] = []
+        self._outputs: list[QAudioOutput] = []
+        for _ in range(2):
+            player = player_factory(self)
+            output = output_factory(self)
+            player.setAudioOutput(output)
+            self._wire_player(player)
+            self._players.append(player)
+            self._outputs.append(output)
+        self._active, self._standby = self._players
+
+    def set_gapless_enabled(self, enabled: bool) -> None:
+        self._gapless_enabled = enabled
+        if not enabled:
+            self.clear_prepared()
+
+    def is_gapless_enabled(self) -> bool:
+        return self._gapless_enabled
+
+    def prepare_next(self, source: QUrl) -> None:
+        if not self._gapless_enabled:
+            return
+        if self._prepared_source is not None and self._prepared_source == source:
+            return
+        self._prepared_source = source
+        self._standby.setSource(source)
+
+    def clear_prepared(self) -> None:
+        if self._prepared_source is None:
+            return
+        self._prepared_source = None
+        self._standby.setSource(QUrl())
+
+    def gap_statistics(self) -> dict[str, float]:
+        return self._gap_meter.statistics()
+
+    def setSource(self, source: QUrl) -> None:
+        self._active.setSource(source)
+
+    def source(self) -> QUrl:
+        return self._active.source()
+
+    def play(self) -> None:
+        self._active.play()
+
+    def pause(self) -> None:
+        self._active.pause()
+
+    def setPosition(self, position_ms: int) -> None:
+        self._active.setPosition(position_ms)
+
+    def position(self) -> int:
+        return self._active.position()
+
+    def setPlaybackRate(self, rate: float) -> None:
+        for player in self._players:
+            player.setPlaybackRate(rate)
+
+    def setVolume(self, volume: float) -> None:
+        for output in self._outputs:
+            output.setVolume(volume)
+
+    def playbackState(self) -> QMediaPlayer.PlaybackState:
+        return self._active.playbackState()
+
+    def is_playing(self) -> bool:
+        return self._active.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+
+    def _wire_player(self, player: QMediaPlayer) -> None:
+        player.positionChanged.connect(partial(self._on_position_changed, player))
+        player.durationChanged.connect(partial(self._on_duration_changed, player))
+        player.playbackStateChanged.connect(partial(self._on_playback_state_changed, player))
+        player.mediaStatusChanged.connect(partial(self._on_media_status_changed, player))
+
+    def _on_duration_changed(self, player: QMediaPlayer, duration_ms: int) -> None:
+        if player is self._active:
+            self.durationChanged.emit(duration_ms)
+
+    def _on_playback_state_changed(self, player: QMediaPlayer, state: QMediaPlayer.PlaybackState) -> None:
+        if player is self._active:
+            self.playbackStateChanged.emit(state)
+
+    def _on_position_changed(self, player: QMediaPlayer, position_ms: int) -> None:
+        if player is not self._active:
+            return
+        if position_ms > 0 and self._gap_meter.is_running():
+            gap_ms = self._gap_meter.stop()
+            if gap_ms is not None:
+                self.gap_measured.emit(gap_ms)
+        self.positionChanged.emit(position_ms)
+
+    def _on_media_status_changed(self, player: QMediaPlayer, status: QMediaPlayer.MediaStatus) -> None:
+        if player is not self._active:
+            return
+
+        if status == QMediaPlayer.MediaStatus.EndOfMedia:
+            self._gap_meter.start()
+            if self._gapless_enabled and self._prepared_source is not None:
+                self._swap_to_prepared()
+                return
+
+        self.mediaStatusChanged.emit(status)
+
+    def _swap_to_prepared(self) -> None:
+        source = self._prepared_source
+        self._prepared_source = None
+        self._active, self._standby = self._standby, self._active
+        self._active.play()
+        self._standby.stop()
+
+        self.durationChanged.emit(self._active.duration())
+        self.advanced.emit(source.toLocalFile())
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from pathlib import PurePath
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt
+
+from app.back_end.controllers.library_controller import LibraryController
+
+
+class _LibraryNode:
+    __slots__ = ("kind", "parent", "row", "key", "album_count", "track_count", "duration_ms", "path", "children")
+
+    def __init__(
+        self,
+        kind: int,
+        parent: _LibraryNode | None,
+        row: int,
+        key: str | None,
+        album_count: int = 0,
+        track_count: int = 0,
+        duration_ms: int = 0,
+        path: str | None = None,
+    ) -> None:
+        self.kind = kind
+        self.parent = parent
+        self.row = row
+        self.key = key
+        self.album_count = album_count
+        self.track_count = track_count
+        self.duration_ms = duration_ms
+        self.path = path
+        # None until the node is expanded; an empty list means "fetched, no rows".
+        self.children: list[_LibraryNode] | None = None
+
+
+class LibraryTreeModel(QAbstractItemModel):
+    """Artist -> album -> track tree that queries SQLite one level at a time.
+
+    Artists are paged in with keyset queries as the view scrolls, and albums
+    and tracks are only fetched when their parent is expanded, so opening a
+    large library costs one page of grouped rows rather than the whole table.
+    """
+
+    COLUMNS = ("Name", "Albums", "Tracks", "Duration")
+    ARTIST_BATCH_SIZE = 200
+    PATH_ROLE = Qt.ItemDataRole.UserRole
+
+    ROOT, ARTIST, ALBUM, TRACK = range(4)
+    _ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def __init__(self, library_controller: LibraryController, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._library_controller = library_controller
+        self._root = _LibraryNode(self.ROOT, None, 0, None)
+        self._root.children = []
+        self._artists_exhausted = False
+
+    def reload(self) -> None:
+        self.beginResetModel()
+        self._root.children = []
+        self._artists_exhausted = False
+        self.endResetModel()
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        children = self._node(parent).children
+        if children is None or not 0 <= row < len(children) or not 0 <= column < len(self.COLUMNS):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        children = self._node(parent).children
+        return len(children) if children is not None else 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        if node.kind == self.ROOT:
+            return bool(node.children) or not self._artists_exhausted
+        if node.kind == self.TRACK:
+            return False
+        # Unexpanded artists and albums always have rows; showing the
+        # expander must not cost a query.
+        return node.children is None or bool(node.children)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self._node(parent)
+        if node.kind == self.ROOT:
+            return not self._artists_exhausted
+        return node.kind != self.TRACK and node.children is None
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        node = self._node(parent)
+        if node.kind == self.ROOT:
+            self._fetch_artists()
+        elif node.kind == self.ARTIST and node.children is None:
+            rows = self._library_controller.list_albums(node.key)
+            self._insert_children(
+                parent,
+                node,
+                [
+                    _LibraryNode(self.ALBUM, node, row, album, track_count=tracks, duration_ms=duration)
+                    for row, (album, tracks, duration) in enumerate(rows)
+                ],
+            )
+        elif node.kind == self.ALBUM and node.children is None:
+            rows = self._library_controller.list_album_tracks(node.parent.key, node.key)
+            self._insert_children(
+                parent,
+                node,
+                [
+                    _LibraryNode(self.TRACK, node, row, title, duration_ms=duration, path=path)
+                    for row, (_track_id, path, title, duration) in enumerate(rows)
+                ],
+            )
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node: _LibraryNode = index.internalPointer()
+        column = index.column()
+
+        if role in (self.PATH_ROLE, Qt.ItemDataRole.ToolTipRole):
+            return node.path
+        if role == Qt.ItemDataRole.TextAlignmentRole and column > 0:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if column == 0:
+            return self._display_name(node)
+        if column == 1:
+            return f"{node.album_count:,}" if node.kind == self.ARTIST else ""
+        if column == 2:
+            return f"{node.track_count:,}" if node.kind != self.TRACK else ""
+        return self._format_duration(node.duration_ms)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return self._ITEM_FLAGS
+
+    def _node(self, index: QModelIndex) -> _LibraryNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _fetch_artists(self) -> None:
+        artists = self._root.children
+        after = artists[-1].key if artists else None
+        rows = self._library_controller.list_artists(after=after, limit=self.ARTIST_BATCH_SIZE)
+        if len(rows) < self.ARTIST_BATCH_SIZE:
+            self._artists_exhausted = True
+        if not rows:
+            return
+
+        start = len(artists)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        artists.extend(
+            _LibraryNode(self.ARTIST, self._root, start + offset, artist, albums, tracks, duration)
+            for offset, (artist, albums, tracks, duration) in enumerate(rows)
+        )
+        self.endInsertRows()
+
+    def _insert_children(self, parent: QModelIndex, node: _LibraryNode, children: list[_LibraryNode]) -> None:
+        node.children = []
+        if not children:
+            return
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        node.children = children
+        self.endInsertRows()
+
+    def _display_name(self, node: _LibraryNode) -> str:
+        if node.kind == self.ARTIST:
+            return node.key or "Unknown Artist"
+        if node.kind == self.ALBUM:
+            return node.key or "Unknown Album"
+        return node.key or PurePath(node.path).name
+
+    @staticmethod
+    def _format_duration(duration_ms: int) -> str:
+        if duration_ms <= 0:
+            return ""
+        hours, remainder = divmod(duration_ms // 1000, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{seconds:02d}"
+        return f"{minutes}:{seconds:02d}"
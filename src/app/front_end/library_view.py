@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from PyQt6.QtCore import QModelIndex, pyqtSignal
+from PyQt6.QtWidgets import QHeaderView, QTreeView, QVBoxLayout, QWidget
+
+from app.back_end.controllers.library_controller import LibraryController
+from app.front_end.library_tree_model import LibraryTreeModel
+
+
+class LibraryView(QWidget):
+    track_activated = pyqtSignal(str)
+
+    def __init__(self, library_controller: LibraryController, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.model = LibraryTreeModel(library_controller, self)
+
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.model)
+        # Uniform rows let the view skip measuring every expanded child.
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setWordWrap(False)
+
+        header = self.tree_view.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, len(LibraryTreeModel.COLUMNS)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, 80)
+
+        self.tree_view.doubleClicked.connect(self._emit_track_activated)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.tree_view)
+
+    def reload(self) -> None:
+        self.model.reload()
+
+    def _emit_track_activated(self, index: QModelIndex) -> None:
+        path = index.data(LibraryTreeModel.PATH_ROLE)
+        if path is not None:
+            self.track_activated.emit(path)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from mutagen import File as MutagenFile
-from PyQt6.QtCore import QUrl, Qt
+from PyQt6.QtCore import QEvent, QTimer, QUrl, Qt, pyqtSignal
 from PyQt6.QtGui import QAction
-from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -13,40 +13,102 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QSplitter,
+    QStackedWidget,
     QToolBar,
     QVBoxLayout,
     QWidget,
 )
 
+from app.back_end.controllers.library_controller import LibraryController
 from app.back_end.controllers.metadata_controller import MetadataController
-from app.back_end.services.rust_bridge import extract_artwork
-from app.front_end.metadata_editor_dialog import MetadataEditorDialog
+from app.back_end.controllers.session_controller import SessionController, SessionState
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.services import python_backend
+from app.back_end.services.library_importer import LibraryImporter
+from app.back_end.services.queue_service import QueueService, ShuffleMode
+from app.back_end.services.rust_bridge import CancelFlagProtocol, extract_artwork
+from app.back_end.services.smart_shuffle import TrackGroup
+from app.back_end.services.track_prefetcher import TrackPrefetcher
+from app.back_end.services.track_store import TrackFlag, TrackStore
+from app.back_end.utils.tracing import DEFAULT_TRACE_PATH, traced_methods, tracer
+from app.front_end.album_grid_view import AlbumGridView
+from app.front_end.folder_import import FolderImportJob
+from app.front_end.library_view import LibraryView
 from app.front_end.now_playing_bar import NowPlayingBar
 from app.front_end.playlist_view import PlaylistView
+from app.front_end.position_coalescer import PositionUpdateCoalescer
+from app.front_end.stall_watchdog import StallWatchdog, stall_threshold_ms
+from app.front_end.task_runner import TaskRunner
 
+if TYPE_CHECKING:
+    from PyQt6.QtMultimedia import QMediaPlayer
 
+    from app.front_end.gapless_player import GaplessPlayer
+    from app.front_end.stall_stats_dialog import StallStatsDialog
+
+
+@traced_methods("ui", qt_slots=True)
 class MainWindow(QMainWindow):
+    SESSION_SAVE_INTERVAL_MS = 5_000
+
+    playback_ready = pyqtSignal()
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Music Player")
         self.resize(1180, 760)
 
-        self._track_paths: list[Path] = []
+        self._tracks = TrackStore()
         self._current_index: int | None = None
-
+        self._pending_position_ms = 0
+        self._repeat_mode = "off"
+        self._shuffle_enabled = False
+        self._folder_import: FolderImportJob | None = None
+        self._imported_track_ids: list[str] = []
+        self._import_progress: QProgressDialog | None = None
+
+        self._task_runner = TaskRunner(self)
         self._metadata_controller = MetadataController()
-
-        self._player = QMediaPlayer(self)
-        self._audio_output = QAudioOutput(self)
-        self._player.setAudioOutput(self._audio_output)
-        self._audio_output.setVolume(0.7)
+        self._track_prefetcher = TrackPrefetcher(
+            metadata_reader=self._metadata_controller.read_metadata,
+            artwork_reader=self._read_album_art,
+        )
+        # Artist and album per queued path, filled in from the library in the
+        # background; the queue service reads it when spreading a shuffle.
+        self._track_groups: dict[str, TrackGroup] = {}
+        self._queue_service = QueueService([])
+        self._queue_service.set_track_groups(self._track_groups)
+        self._db_handler = DatabaseHandler()
+        self._db_handler.initialize_schema()
+        self._session_controller = SessionController(Repository(self._db_handler))
+        self._library_controller = LibraryController(Repository(self._db_handler))
+
+        # QtMultimedia brings up the platform audio stack, which is the
+        # slowest part of startup; the player is created after the first paint.
+        self._player: GaplessPlayer | None = None
+        self._restored_index: int | None = None
+        self._playback_scheduled = False
+
+        threshold_ms = stall_threshold_ms()
+        self._stall_watchdog = StallWatchdog(self, threshold_ms=threshold_ms)
+        if threshold_ms:
+            self._stall_watchdog.start()
+        self._stall_stats_dialog: StallStatsDialog | None = None
 
         self._build_toolbar()
         self._build_ui()
-        self._wire_player_signals()
+        self._position_coalescer = PositionUpdateCoalescer(self.now_playing_bar.set_playback_position_ms, self)
         self._apply_theme()
 
+        self._session_timer = QTimer(self)
+        self._session_timer.setInterval(self.SESSION_SAVE_INTERVAL_MS)
+        self._session_timer.timeout.connect(self._save_playback_cursor)
+        self._session_timer.start()
+        self._restore_session()
+
     def _build_toolbar(self) -> None:
         toolbar = QToolBar("Main")
         toolbar.setMovable(False)
@@ -56,10 +118,32 @@ class MainWindow(QMainWindow):
         add_action.triggered.connect(self._add_songs)
         toolbar.addAction(add_action)
 
+        add_folder_action = QAction("Add Folder", self)
+        add_folder_action.triggered.connect(self._add_folder)
+        toolbar.addAction(add_folder_action)
+
         edit_action = QAction("Edit Metadata", self)
         edit_action.triggered.connect(self._open_metadata_editor)
         toolbar.addAction(edit_action)
 
+        self._gapless_action = QAction("Gapless", self)
+        self._gapless_action.setCheckable(True)
+        self._gapless_action.setChecked(True)
+        self._gapless_action.toggled.connect(self._set_gapless_enabled)
+        toolbar.addAction(self._gapless_action)
+
+        self._trace_action = QAction("Trace", self)
+        self._trace_action.setCheckable(True)
+        self._trace_action.setChecked(tracer.enabled)
+        self._trace_action.setToolTip("Record tracing spans; unchecking saves them as a Chrome trace")
+        self._trace_action.toggled.connect(self._set_tracing_enabled)
+        toolbar.addAction(self._trace_action)
+
+        stalls_action = QAction("Stalls", self)
+        stalls_action.setToolTip("Event-loop stalls caught by the watchdog, with the stack that caused them")
+        stalls_action.triggered.connect(self._show_stall_stats)
+        toolbar.addAction(stalls_action)
+
     def _build_ui(self) -> None:
         root = QWidget()
         root_layout = QVBoxLayout(root)
@@ -68,21 +152,28 @@ class MainWindow(QMainWindow):
 
         splitter = QSplitter(Qt.Orientation.Horizontal)
 
-        sidebar = QListWidget()
-        sidebar.addItems(["Library", "Favorites", "Playlists"])
-        sidebar.setFixedWidth(220)
+        self.sidebar = QListWidget()
+        self.sidebar.addItems(["Now Playing", "Library", "Albums", "Favorites", "Playlists"])
+        self.sidebar.setFixedWidth(220)
+        self.sidebar.setCurrentRow(0)
 
-        content = QWidget()
-        content_layout = QVBoxLayout(content)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(8)
-        content_layout.addWidget(QLabel("Now Playing Queue"))
+        queue_page = QWidget()
+        queue_layout = QVBoxLayout(queue_page)
+        queue_layout.setContentsMargins(0, 0, 0, 0)
+        queue_layout.setSpacing(8)
+        queue_layout.addWidget(QLabel("Now Playing Queue"))
 
         self.playlist_view = PlaylistView()
-        content_layout.addWidget(self.playlist_view)
+        queue_layout.addWidget(self.playlist_view)
 
-        splitter.addWidget(sidebar)
-        splitter.addWidget(content)
+        # Other pages are built the first time they are opened.
+        self._content_stack = QStackedWidget()
+        self._content_stack.addWidget(queue_page)
+        self._library_view: LibraryView | None = None
+        self._album_grid_view: AlbumGridView | None = None
+
+        splitter.addWidget(self.sidebar)
+        splitter.addWidget(self._content_stack)
         splitter.setStretchFactor(0, 0)
         splitter.setStretchFactor(1, 1)
 
@@ -92,19 +183,79 @@ class MainWindow(QMainWindow):
         root_layout.addWidget(self.now_playing_bar)
         self.setCentralWidget(root)
 
+        self.sidebar.currentTextChanged.connect(self._show_sidebar_page)
         self.playlist_view.track_activated.connect(self._play_track_at_index)
+        self.playlist_view.tracks_moved.connect(self._on_tracks_moved)
+        self.playlist_view.track_details_requested.connect(self._load_track_details)
+        self.playlist_view.set_track_store(self._tracks)
 
         self.now_playing_bar.previous_requested.connect(self._play_previous_track)
         self.now_playing_bar.next_requested.connect(self._play_next_track)
         self.now_playing_bar.play_pause_requested.connect(self._toggle_play_pause)
-        self.now_playing_bar.seek_requested.connect(self._player.setPosition)
-        self.now_playing_bar.playback_speed_requested.connect(self._player.setPlaybackRate)
+        self.now_playing_bar.seek_requested.connect(self._seek)
+        self.now_playing_bar.playback_speed_requested.connect(self._set_playback_rate)
+        self.now_playing_bar.shuffle_toggled.connect(self._set_shuffle_enabled)
+        self.now_playing_bar.repeat_mode_requested.connect(self._set_repeat_mode)
+
+    def _ensure_player(self) -> GaplessPlayer:
+        if self._player is None:
+            from app.front_end.gapless_player import GaplessPlayer
+
+            self._player = GaplessPlayer(self)
+            self._player.setVolume(0.7)
+            self._player.set_gapless_enabled(self._gapless_action.isChecked())
+            self._wire_player_signals()
+            if self._restored_index is not None:
+                index, self._restored_index = self._restored_index, None
+                self._play_track_at_index(index, autoplay=False)
+            self.playback_ready.emit()
+        return self._player
+
+    def _seek(self, position_ms: int) -> None:
+        if self._player is not None:
+            self._player.setPosition(position_ms)
+
+    def _set_playback_rate(self, rate: float) -> None:
+        self._ensure_player().setPlaybackRate(rate)
 
     def _wire_player_signals(self) -> None:
-        self._player.positionChanged.connect(self.now_playing_bar.set_playback_position_ms)
+        self._player.positionChanged.connect(self._position_coalescer.submit)
         self._player.durationChanged.connect(self.now_playing_bar.set_track_duration_ms)
         self._player.playbackStateChanged.connect(self._on_playback_state_changed)
         self._player.mediaStatusChanged.connect(self._on_media_status_changed)
+        self._player.advanced.connect(self._on_gapless_advanced)
+        self._player.gap_measured.connect(self._show_track_gap)
+
+    def _show_sidebar_page(self, page: str) -> None:
+        if page == "Library":
+            if self._library_view is None:
+                self._library_view = LibraryView(self._library_controller)
+                self._library_view.track_activated.connect(self._play_library_track)
+                self._content_stack.addWidget(self._library_view)
+            self._content_stack.setCurrentWidget(self._library_view)
+        elif page == "Albums":
+            if self._album_grid_view is None:
+                self._album_grid_view = AlbumGridView(self._library_controller, self._read_album_art)
+                self._album_grid_view.album_activated.connect(self._play_album)
+                self._album_grid_view.reload()
+                self._content_stack.addWidget(self._album_grid_view)
+            self._content_stack.setCurrentWidget(self._album_grid_view)
+        else:
+            self._content_stack.setCurrentIndex(0)
+
+    def _play_library_track(self, track_path: str) -> None:
+        self._play_library_tracks([track_path])
+
+    def _play_album(self, artist: str | None, album: str | None) -> None:
+        rows = self._library_controller.list_album_tracks(artist, album)
+        if rows:
+            self._play_library_tracks([path for _track_id, path, _title, _duration in rows])
+
+    def _play_library_tracks(self, track_paths: list[str]) -> None:
+        new_track_ids = self._append_tracks(track_paths)
+        if new_track_ids:
+            self._session_controller.append_journal("enqueue", {"paths": new_track_ids})
+        self._play_track_at_index(self._tracks.row_of(str(Path(track_paths[0]))))
 
     def _apply_theme(self) -> None:
         self.setStyleSheet(
@@ -116,7 +267,7 @@ class MainWindow(QMainWindow):
             QLabel {
                 color: #E7ECF3;
             }
-            QListWidget {
+            QListWidget, QTreeView, QListView {
                 background: #151B24;
                 border: 1px solid #263041;
                 border-radius: 8px;
@@ -182,71 +333,430 @@ class MainWindow(QMainWindow):
         if not files:
             return
 
-        for file_path in files:
-            path = Path(file_path)
-            if path not in self._track_paths:
-                self._track_paths.append(path)
-
-        self.playlist_view.set_tracks(self._track_paths)
-        if self._current_index is None and self._track_paths:
+        new_track_ids = self._append_tracks(files)
+        if new_track_ids:
+            self._session_controller.append_journal("enqueue", {"paths": new_track_ids})
+
+    def _append_tracks(self, track_paths: list[str]) -> list[str]:
+        new_track_ids: list[str] = []
+        for track_path in track_paths:
+            path = Path(track_path)
+            track_id = str(path)
+            if track_id not in self._tracks:
+                self._tracks.append(track_id)
+                new_track_ids.append(track_id)
+        if not new_track_ids:
+            return new_track_ids
+
+        self._queue_service.enqueue(new_track_ids)
+        self._load_track_groups(new_track_ids)
+        self.playlist_view.append_tracks(new_track_ids)
+        if self._current_index is None and self._tracks:
             self._play_track_at_index(0)
+        return new_track_ids
+
+    def _on_folder_import_batch(self, track_paths: list[str]) -> None:
+        self._imported_track_ids.extend(self._append_tracks(track_paths))
+
+    def _add_folder(self) -> None:
+        if self._folder_import is not None:
+            QMessageBox.information(self, "Import Running", "A folder import is already in progress.")
+            return
+
+        folder = QFileDialog.getExistingDirectory(self, "Select folder", str(Path.home()))
+        if not folder:
+            return
+
+        job = FolderImportJob(LibraryImporter(self._db_handler.db_path), self._task_runner, self)
+        job.batch_ready.connect(self._on_folder_import_batch)
+        job.progress.connect(self._on_folder_import_progress)
+        job.finished.connect(self._on_folder_import_finished)
+        job.failed.connect(self._on_folder_import_failed)
+
+        progress = QProgressDialog("Scanning folder...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Add Folder")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+        progress.setMinimumDuration(0)
+        progress.canceled.connect(job.cancel)
+        progress.show()
+
+        self._folder_import = job
+        self._import_progress = progress
+        self._imported_track_ids = []
+        job.start(folder, frozenset(self._tracks.paths()))
+
+    def _on_folder_import_progress(self, done: int, total: int) -> None:
+        progress = self._import_progress
+        if progress is None:
+            return
+        progress.setLabelText(f"Importing {done:,} of {total:,} files...")
+        progress.setMaximum(total)
+        # A window-modal dialog processes events inside setValue, which may
+        # already deliver the import's completion.
+        progress.setValue(done)
+
+    def _on_folder_import_finished(self, response) -> None:
+        self._finish_folder_import()
+        if response.status:
+            self.statusBar().showMessage(
+                f"Imported {response.data['imported']:,} of {response.data['scanned']:,} files.", 5_000
+            )
+        else:
+            self.statusBar().showMessage(response.message.value, 5_000)
+
+    def _on_folder_import_failed(self, message: str) -> None:
+        self._finish_folder_import()
+        QMessageBox.warning(self, "Import Error", message)
+
+    def _finish_folder_import(self) -> None:
+        # Imports are journaled once at the end; a batch-sized journal write
+        # per chunk would compete with the importer for the database.
+        if self._imported_track_ids:
+            self._session_controller.append_journal("enqueue", {"paths": self._imported_track_ids})
+            self._imported_track_ids = []
+        if self._library_view is not None:
+            self._library_view.reload()
+        if self._album_grid_view is not None:
+            self._album_grid_view.reload()
+        if self._import_progress is not None:
+            self._import_progress.close()
+            self._import_progress.deleteLater()
+        if self._folder_import is not None:
+            self._folder_import.deleteLater()
+        self._import_progress = None
+        self._folder_import = None
+
+    def _load_track_groups(self, track_paths: list[str]) -> None:
+        self._task_runner.submit(
+            self._read_track_groups,
+            self._db_handler.db_path,
+            track_paths,
+            on_result=self._track_groups.update,
+        )
+
+    @staticmethod
+    def _read_track_groups(db_path: Path, track_paths: list[str]) -> dict[str, TrackGroup]:
+        # Worker threads cannot share the GUI thread's connection.
+        db_handler = DatabaseHandler(db_path=db_path)
+        try:
+            return LibraryController(Repository(db_handler)).get_track_groupings(track_paths)
+        finally:
+            db_handler.close()
+
+    def _load_track_details(self, track_paths: list[str]) -> None:
+        self._task_runner.submit(
+            self._read_track_details,
+            track_paths,
+            on_result=self._apply_track_details,
+        )
+
+    def _apply_track_details(self, result: tuple[dict[str, tuple[str, str, int]], dict[str, str]]) -> None:
+        details, albums = result
+        # The view writes them into the rows of self._tracks, which it shares.
+        self.playlist_view.set_track_details(details, albums)
+
+    def _read_track_details(
+        self, track_paths: list[str]
+    ) -> tuple[dict[str, tuple[str, str, int]], dict[str, str]]:
+        details: dict[str, tuple[str, str, int]] = {}
+        albums: dict[str, str] = {}
+        for track_path in track_paths:
+            response = self._metadata_controller.read_metadata(track_path)
+            metadata = response.data if response.status and isinstance(response.data, dict) else {}
+            try:
+                duration_ms = int(metadata.get("duration_ms") or 0)
+            except ValueError:
+                duration_ms = 0
+            details[track_path] = (metadata.get("title", ""), metadata.get("artist", ""), duration_ms)
+            albums[track_path] = metadata.get("album", "")
+        return details, albums
+
+    def _on_tracks_moved(self, track_paths: list[str], position: int) -> None:
+        if not self._queue_service.move_tracks(track_paths, position).status:
+            return
+        # Until the player exists the cursor is the restored index.
+        cursor = self._current_index if self._current_index is not None else self._restored_index
+        current_path = self._tracks.path(cursor) if cursor is not None else None
+        moved = set(track_paths)
+        kept = [row for row, path in enumerate(self._tracks.paths()) if path not in moved]
+        kept[position:position] = [self._tracks.row_of(track_path) for track_path in track_paths]
+        self._tracks.reorder(kept)
+        self._session_controller.append_journal("move", {"paths": track_paths, "position": position})
+        if current_path is None:
+            return
+
+        cursor = self._tracks.row_of(current_path)
+        if self._current_index is not None:
+            self._current_index = cursor
+            position_ms = self._player.position()
+        else:
+            self._restored_index = cursor
+            position_ms = self._pending_position_ms
+        self._session_controller.record_playback_cursor(cursor, position_ms)
+        self._prepare_next_track()
+        self._warm_upcoming_tracks()
 
     def _toggle_play_pause(self) -> None:
-        if self._player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-            self._player.pause()
-        elif self._player.source().isEmpty() and self._track_paths:
+        player = self._ensure_player()
+        if player.is_playing():
+            player.pause()
+        elif player.source().isEmpty() and self._tracks:
             self._play_track_at_index(0)
         else:
-            self._player.play()
+            player.play()
 
-    def _play_track_at_index(self, index: int) -> None:
-        if index < 0 or index >= len(self._track_paths):
+    def _play_track_at_index(self, index: int, autoplay: bool = True) -> None:
+        if index < 0 or index >= len(self._tracks):
             return
 
+        player = self._ensure_player()
+        if autoplay:
+            self._pending_position_ms = 0
+        player.setSource(QUrl.fromLocalFile(self._tracks.path(index)))
+        if autoplay:
+            player.play()
+        self._show_track_at_index(index)
+
+    def _on_gapless_advanced(self, track_path: str) -> None:
+        index = self._tracks.row_of(track_path)
+        if index is not None:
+            self._show_track_at_index(index)
+
+    def _show_track_gap(self, gap_ms: float) -> None:
+        statistics = self._player.gap_statistics()
+        self.statusBar().showMessage(
+            f"Track gap {gap_ms:.0f} ms (average {statistics['average_ms']:.0f} ms, max {statistics['max_ms']:.0f} ms)",
+            4_000,
+        )
+
+    def _show_track_at_index(self, index: int) -> None:
         self._current_index = index
-        path = self._track_paths[index]
+        path = Path(self._tracks.path(index))
         self.playlist_view.set_current_index(index)
-        self._player.setSource(QUrl.fromLocalFile(str(path)))
-        self._player.play()
+        self._session_controller.record_playback_cursor(index, self._pending_position_ms)
+        self._prepare_next_track()
 
-        metadata_response = self._metadata_controller.read_metadata(str(path))
-        title = path.stem
-        artist = "Local File"
-        if metadata_response.status and isinstance(metadata_response.data, dict):
-            title = metadata_response.data.get("title") or title
-            artist = metadata_response.data.get("artist") or artist
-
-        self.now_playing_bar.set_track_info(title, artist)
+        track = self._tracks[index]
+        if track.flags & TrackFlag.TAGS_READ:
+            self.now_playing_bar.set_track_info(track.title or path.stem, track.artist or "Local File")
+        else:
+            self.now_playing_bar.set_track_info(path.stem, "Local File")
+        self._load_track_metadata(path)
         self._update_album_art(path)
+        self._warm_upcoming_tracks()
 
-    def _play_next_track(self) -> None:
-        if self._current_index is None or not self._track_paths:
+    def _is_current_track(self, path: Path) -> bool:
+        return self._current_index is not None and self._tracks.path(self._current_index) == str(path)
+
+    def _load_track_metadata(self, path: Path) -> None:
+        self._task_runner.submit_latest(
+            "track-metadata",
+            self._track_prefetcher.metadata_for,
+            str(path),
+            on_result=partial(self._apply_track_metadata, path),
+        )
+
+    def _apply_track_metadata(self, path: Path, metadata_response) -> None:
+        if not self._is_current_track(path):
             return
-        if self._current_index + 1 >= len(self._track_paths):
+        if metadata_response.status and isinstance(metadata_response.data, dict):
+            self.now_playing_bar.set_track_info(
+                metadata_response.data.get("title") or path.stem,
+                metadata_response.data.get("artist") or "Local File",
+            )
+
+    def _play_next_track(self) -> None:
+        if self._current_index is None or not self._tracks:
             return
-        self._play_track_at_index(self._current_index + 1)
+        response = self._queue_service.next_track(self._tracks.path(self._current_index))
+        self._play_resolved_track(response)
 
     def _play_previous_track(self) -> None:
-        if self._current_index is None or not self._track_paths:
+        if self._current_index is None or not self._tracks:
+            return
+        response = self._queue_service.previous_track(self._tracks.path(self._current_index))
+        self._play_resolved_track(response)
+
+    def _play_resolved_track(self, response) -> None:
+        if not response.status or response.data.get("track_id") is None:
             return
-        if self._current_index - 1 < 0:
+        self._play_track_at_index(self._tracks.row_of(response.data["track_id"]))
+
+    def _prepare_next_track(self) -> None:
+        if self._current_index is None or self._player is None or not self._player.is_gapless_enabled():
+            return
+        response = self._queue_service.next_track(self._tracks.path(self._current_index))
+        if response.status and response.data.get("track_id") is not None:
+            self._player.prepare_next(QUrl.fromLocalFile(response.data["track_id"]))
+        else:
+            self._player.clear_prepared()
+
+    def _warm_upcoming_tracks(self) -> None:
+        if self._current_index is None:
             return
-        self._play_track_at_index(self._current_index - 1)
+        response = self._queue_service.upcoming_tracks(self._tracks.path(self._current_index))
+        if response.status:
+            self._track_prefetcher.warm(response.data["track_ids"])
+
+    def _set_gapless_enabled(self, enabled: bool) -> None:
+        if self._player is None:
+            return
+        self._player.set_gapless_enabled(enabled)
+        self._prepare_next_track()
+
+    def _set_tracing_enabled(self, enabled: bool) -> None:
+        if enabled:
+            tracer.clear()
+            tracer.enable()
+            return
+
+        tracer.disable()
+        path, _ = QFileDialog.getSaveFileName(self, "Save Trace", str(DEFAULT_TRACE_PATH), "Chrome trace (*.json)")
+        if path:
+            tracer.export(path)
+
+    def _show_stall_stats(self) -> None:
+        if self._stall_stats_dialog is None:
+            from app.front_end.stall_stats_dialog import StallStatsDialog
+
+            self._stall_stats_dialog = StallStatsDialog(self._stall_watchdog, self)
+        self._stall_stats_dialog.refresh()
+        self._stall_stats_dialog.show()
+        self._stall_stats_dialog.raise_()
+
+    def _set_shuffle_enabled(self, enabled: bool) -> None:
+        if not self._queue_service.set_shuffle(enabled, mode=ShuffleMode.SPREAD.value).status:
+            return
+        self._shuffle_enabled = enabled
+        self._prepare_next_track()
+        self._warm_upcoming_tracks()
+        # A reshuffle rewrites the whole order, so it is cheaper to snapshot
+        # than to journal it.
+        self._session_controller.save_snapshot(self._session_state())
+
+    def _set_repeat_mode(self, mode: str) -> None:
+        if not self._queue_service.set_repeat_mode(mode).status:
+            return
+        self._repeat_mode = mode
+        self._session_controller.append_journal("repeat_mode", {"mode": mode})
+        self._prepare_next_track()
+        self._warm_upcoming_tracks()
 
     def _on_playback_state_changed(self, state: QMediaPlayer.PlaybackState) -> None:
+        from PyQt6.QtMultimedia import QMediaPlayer
+
         self.now_playing_bar.set_playing(state == QMediaPlayer.PlaybackState.PlayingState)
 
     def _on_media_status_changed(self, status: QMediaPlayer.MediaStatus) -> None:
+        from PyQt6.QtMultimedia import QMediaPlayer
+
+        if status == QMediaPlayer.MediaStatus.LoadedMedia and self._pending_position_ms:
+            self._player.setPosition(self._pending_position_ms)
+            self._pending_position_ms = 0
         if status == QMediaPlayer.MediaStatus.EndOfMedia:
             self._play_next_track()
 
+    def _session_state(self) -> SessionState:
+        queue_order = None
+        if self._shuffle_enabled:
+            queue_order = [self._tracks.row_of(track_id) for track_id in self._queue_service.track_ids()]
+        if self._player is None:
+            # Closed before playback came up: keep what was restored.
+            current_index, position_ms = self._restored_index, self._pending_position_ms
+        else:
+            current_index = self._current_index
+            position_ms = self._player.position() if current_index is not None else 0
+        return SessionState(
+            track_paths=self._tracks.paths(),
+            queue_order=queue_order,
+            current_index=current_index,
+            position_ms=position_ms,
+            repeat_mode=self._repeat_mode,
+            shuffle_enabled=self._shuffle_enabled,
+        )
+
+    def _save_playback_cursor(self) -> None:
+        if self._player is None or not self._player.is_playing():
+            return
+        self._session_controller.record_playback_cursor(self._current_index, self._player.position())
+
+    def _restore_session(self) -> None:
+        response = self._session_controller.restore()
+        if not response.status or not response.data.track_paths:
+            return
+
+        state = response.data
+        self._tracks = TrackStore(state.track_paths)
+        self.playlist_view.set_track_store(self._tracks)
+        self._queue_service = QueueService(state.track_paths)
+        self._queue_service.set_track_groups(self._track_groups)
+        self._load_track_groups(state.track_paths)
+        if self._queue_service.set_repeat_mode(state.repeat_mode).status:
+            self._repeat_mode = state.repeat_mode
+        if state.shuffle_enabled and state.queue_order is not None:
+            restored = self._queue_service.restore_shuffled_order(
+                [state.track_paths[index] for index in state.queue_order]
+            )
+            self._shuffle_enabled = restored.status
+
+        self.now_playing_bar.set_repeat_mode(self._repeat_mode)
+        self.now_playing_bar.set_shuffle_enabled(self._shuffle_enabled)
+        self.playlist_view.set_tracks(state.track_paths)
+        if state.current_index is not None:
+            self._pending_position_ms = state.position_ms
+            self._restored_index = state.current_index
+            self.playlist_view.set_current_index(state.current_index)
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        super().paintEvent(event)
+        if not self._playback_scheduled:
+            self._playback_scheduled = True
+            QTimer.singleShot(0, self._ensure_player)
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        self._update_position_suspension()
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        super().hideEvent(event)
+        self._update_position_suspension()
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._update_position_suspension()
+
+    def _update_position_suspension(self) -> None:
+        self._position_coalescer.set_suspended(not self.isVisible() or self.isMinimized())
+
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        if self._folder_import is not None:
+            self._folder_import.cancel()
+        self._session_timer.stop()
+        self._stall_watchdog.stop()
+        self._session_controller.save_snapshot(self._session_state())
+        self._db_handler.close()
+        self._track_prefetcher.shutdown()
+        self._task_runner.shutdown()
+        if self._album_grid_view is not None:
+            self._album_grid_view.thumbnail_loader.shutdown()
+        super().closeEvent(event)
+
     def _open_metadata_editor(self) -> None:
         if self._current_index is None:
             QMessageBox.information(self, "No Track", "Load and play a track before editing metadata.")
             return
 
-        track_path = self._track_paths[self._current_index]
-        metadata_response = self._metadata_controller.read_metadata(str(track_path))
+        track_path = Path(self._tracks.path(self._current_index))
+        self._task_runner.submit(
+            self._metadata_controller.read_metadata,
+            str(track_path),
+            on_result=partial(self._edit_metadata, track_path),
+        )
+
+    def _edit_metadata(self, track_path: Path, metadata_response) -> None:
         if not metadata_response.status or not isinstance(metadata_response.data, dict):
             QMessageBox.warning(
                 self,
@@ -255,6 +765,8 @@ class MainWindow(QMainWindow):
             )
             return
 
+        from app.front_end.metadata_editor_dialog import MetadataEditorDialog
+
         dialog = MetadataEditorDialog(self)
         dialog.set_values_from_metadata(metadata_response.data)
         if not dialog.exec():
@@ -265,52 +777,40 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Metadata", "No metadata changes to save.")
             return
 
-        write_response = self._metadata_controller.update_metadata(str(track_path), changes)
+        self._task_runner.submit(
+            self._metadata_controller.update_metadata,
+            str(track_path),
+            changes,
+            on_result=partial(self._on_metadata_written, track_path),
+        )
+
+    def _on_metadata_written(self, track_path: Path, write_response) -> None:
         if not write_response.status:
             QMessageBox.warning(self, "Metadata Error", write_response.message.value)
             return
 
-        refreshed = self._metadata_controller.read_metadata(str(track_path))
-        if refreshed.status and isinstance(refreshed.data, dict):
-            self.now_playing_bar.set_track_info(
-                refreshed.data.get("title") or track_path.stem,
-                refreshed.data.get("artist") or "Local File",
-            )
-
+        self._track_prefetcher.invalidate(str(track_path))
+        self._load_track_metadata(track_path)
         self._update_album_art(track_path)
         QMessageBox.information(self, "Metadata Saved", write_response.message.value)
 
     def _update_album_art(self, path: Path) -> None:
-        rust_response = extract_artwork(str(path))
-        if rust_response.status and rust_response.data.get("artwork_bytes"):
-            self.now_playing_bar.set_album_art_bytes(rust_response.data["artwork_bytes"])
-            return
+        self._task_runner.submit_latest(
+            "track-artwork",
+            self._track_prefetcher.artwork_for,
+            str(path),
+            on_result=partial(self._apply_album_art, path),
+        )
 
-        embedded = self._extract_embedded_album_art(path)
-        self.now_playing_bar.set_album_art_bytes(embedded)
+    def _apply_album_art(self, path: Path, artwork_bytes: bytes | None) -> None:
+        if self._is_current_track(path):
+            self.now_playing_bar.set_album_art_bytes(artwork_bytes)
 
     @staticmethod
-    def _extract_embedded_album_art(path: Path) -> bytes | None:
-        try:
-            audio = MutagenFile(path)
-            if audio is None:
-                return None
-
-            tags = getattr(audio, "tags", None)
-            if tags:
-                if "covr" in tags and tags["covr"]:
-                    return bytes(tags["covr"][0])
-
-                for key in tags.keys():
-                    frame = tags[key]
-                    frame_data = getattr(frame, "data", None)
-                    if frame_data:
-                        return bytes(frame_data)
-
-            pictures = getattr(audio, "pictures", None)
-            if pictures:
-                return bytes(pictures[0].data)
-        except Exception:
+    def _read_album_art(path: str, cancel_flag: CancelFlagProtocol | None = None) -> bytes | None:
+        rust_response = extract_artwork(path, cancel_flag)
+        if rust_response.status and rust_response.data.get("artwork_bytes"):
+            return rust_response.data["artwork_bytes"]
+        if cancel_flag is not None and cancel_flag.is_cancelled():
             return None
-
-        return None
+        return python_backend.read_embedded_artwork(path)
@@ -15,6 +15,12 @@ from PyQt6.QtWidgets import (
 
 
 class NowPlayingBar(QFrame):
+    REPEAT_MODE_LABELS = {
+        "off": "Repeat: Off",
+        "repeat_all": "Repeat: All",
+        "repeat_one": "Repeat: One",
+    }
+
     previous_requested = pyqtSignal()
     play_pause_requested = pyqtSignal()
     next_requested = pyqtSignal()
@@ -45,7 +51,8 @@ class NowPlayingBar(QFrame):
         self.play_pause_button = QPushButton("Play")
         self.next_button = QPushButton("Next")
 
-        self.current_time_label = QLabel("00:00")
+        self._displayed_time_text = "00:00"
+        self.current_time_label = QLabel(self._displayed_time_text)
         self.duration_label = QLabel("00:00")
 
         self.seek_slider = QSlider(Qt.Orientation.Horizontal)
@@ -126,7 +133,13 @@ class NowPlayingBar(QFrame):
         self.seek_requested.emit(self.seek_slider.value())
 
     def _on_seek_value_changed(self, value: int) -> None:
-        self.current_time_label.setText(self._format_ms(value))
+        self._set_time_text(self._format_ms(value))
+
+    def _set_time_text(self, text: str) -> None:
+        if text == self._displayed_time_text:
+            return
+        self._displayed_time_text = text
+        self.current_time_label.setText(text)
 
     def _emit_selected_speed(self, value: str) -> None:
         speed = value.replace("x", "").strip()
@@ -138,14 +151,20 @@ class NowPlayingBar(QFrame):
     def _cycle_repeat_mode(self) -> None:
         self._repeat_mode_index = (self._repeat_mode_index + 1) % len(self._repeat_modes)
         mode = self._repeat_modes[self._repeat_mode_index]
-        label = {
-            "off": "Repeat: Off",
-            "repeat_all": "Repeat: All",
-            "repeat_one": "Repeat: One",
-        }[mode]
-        self.repeat_button.setText(label)
+        self.repeat_button.setText(self.REPEAT_MODE_LABELS[mode])
         self.repeat_mode_requested.emit(mode)
 
+    def set_repeat_mode(self, mode: str) -> None:
+        if mode not in self._repeat_modes:
+            return
+        self._repeat_mode_index = self._repeat_modes.index(mode)
+        self.repeat_button.setText(self.REPEAT_MODE_LABELS[mode])
+
+    def set_shuffle_enabled(self, enabled: bool) -> None:
+        self.shuffle_button.blockSignals(True)
+        self.shuffle_button.setChecked(enabled)
+        self.shuffle_button.blockSignals(False)
+
     def set_playing(self, is_playing: bool) -> None:
         self.play_pause_button.setText("Pause" if is_playing else "Play")
 
@@ -162,6 +181,11 @@ class NowPlayingBar(QFrame):
         if self._is_scrubbing:
             return
         bounded = max(0, min(int(position_ms), self.seek_slider.maximum()))
+        # Moves smaller than one pixel of the groove only matter when the
+        # clock text changes with them.
+        ms_per_pixel = self.seek_slider.maximum() / max(1, self.seek_slider.width())
+        if abs(bounded - self.seek_slider.value()) < ms_per_pixel and self._format_ms(bounded) == self._displayed_time_text:
+            return
         self.seek_slider.setValue(bounded)
 
     def set_album_art_bytes(self, image_data: bytes | None) -> None:
@@ -1,56 +1,142 @@
 from __future__ import annotations
 
-from pathlib import Path
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from pathlib import Path, PurePath
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QVBoxLayout, QWidget
+from PyQt6.QtCore import QModelIndex, Qt, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QLineEdit, QTableView, QVBoxLayout, QWidget
 
+from app.back_end.services.track_store import TrackStore
+from app.back_end.services.trigram_index import TrigramIndex
+from app.front_end.track_list_model import TrackDetails, TrackListModel
 
-class _ReorderableTrackList(QListWidget):
-    order_changed = pyqtSignal(list)
+
+class PlaylistView(QWidget):
+    ROW_HEIGHT = 28
+    FILTER_DEBOUNCE_MS = 60
+    INDEX_SLICE_MS = 8
+
+    track_activated = pyqtSignal(int)
+    tracks_moved = pyqtSignal(list, int)
+    track_details_requested = pyqtSignal(list)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self.setDragDropMode(QListWidget.DragDropMode.InternalMove)
-        self.setDefaultDropAction(Qt.DropAction.MoveAction)
+        self.model = TrackListModel(self)
+        self.model.rows_moved.connect(self.tracks_moved.emit)
+        self.model.details_requested.connect(self.track_details_requested.emit)
 
-    def dropEvent(self, event) -> None:  # type: ignore[override]
-        super().dropEvent(event)
-        ordered_paths = []
-        for index in range(self.count()):
-            item = self.item(index)
-            ordered_paths.append(item.data(Qt.ItemDataRole.UserRole))
-        self.order_changed.emit(ordered_paths)
+        # Tracks are indexed from their paths in short slices on the event
+        # loop, and re-indexed with their tags once those are read.
+        self._search_index: TrigramIndex[str] = TrigramIndex()
+        self._unindexed: deque[str] = deque()
+        self._index_timer = QTimer(self)
+        self._index_timer.setInterval(0)
+        self._index_timer.timeout.connect(self._index_pending_tracks)
 
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter queue")
+        self.filter_edit.setClearButtonEnabled(True)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.filter_edit.textChanged.connect(self._filter_timer.start)
 
-class PlaylistView(QWidget):
-    track_activated = pyqtSignal(int)
-    track_order_changed = pyqtSignal(list)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setShowGrid(False)
+        self.table_view.setWordWrap(False)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table_view.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self.table_view.setDefaultDropAction(Qt.DropAction.MoveAction)
+        self.table_view.setDragDropOverwriteMode(False)
 
-    def __init__(self, parent: QWidget | None = None) -> None:
-        super().__init__(parent)
-        self.list_widget = _ReorderableTrackList()
-        self.list_widget.itemDoubleClicked.connect(self._emit_track_activated)
-        self.list_widget.order_changed.connect(self.track_order_changed.emit)
+        # Fixed row heights let the view map scroll offsets to rows without
+        # measuring every row.
+        vertical_header = self.table_view.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.ROW_HEIGHT)
+
+        horizontal_header = self.table_view.horizontalHeader()
+        horizontal_header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        horizontal_header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
+        horizontal_header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+        horizontal_header.resizeSection(1, 220)
+        horizontal_header.resizeSection(2, 72)
+
+        self.table_view.doubleClicked.connect(self._emit_track_activated)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.filter_edit)
+        layout.addWidget(self.table_view)
+
+    def set_track_store(self, tracks: TrackStore) -> None:
+        self.model.set_track_store(tracks)
+
+    def set_tracks(self, track_paths: Sequence[Path | str]) -> None:
+        paths = [str(path) for path in track_paths]
+        self.model.set_tracks(paths)
+        self._search_index.clear()
+        self._unindexed = deque(paths)
+        self._index_timer.start()
+        if self.filter_edit.text():
+            self._filter_timer.start()
 
-    def set_tracks(self, track_paths: list[Path]) -> None:
-        self.list_widget.clear()
-        for path in track_paths:
-            item = QListWidgetItem(path.name)
-            item.setToolTip(str(path))
-            item.setData(Qt.ItemDataRole.UserRole, str(path))
-            self.list_widget.addItem(item)
+    def append_tracks(self, track_paths: Sequence[Path | str]) -> None:
+        paths = [str(path) for path in track_paths]
+        self.model.append_tracks(paths)
+        self._unindexed.extend(paths)
+        self._index_timer.start()
+
+    def set_track_details(self, details: dict[str, TrackDetails], albums: Mapping[str, str] | None = None) -> None:
+        self.model.set_track_details(details, albums)
+        for path, (title, artist, _duration_ms) in details.items():
+            album = albums.get(path, "") if albums is not None else ""
+            self._search_index.add(path, (title, artist, album, PurePath(path).stem))
+        # Re-indexing gives these tracks new documents that the active match
+        # does not know, and their tags may match where the path did not.
+        if details and self.filter_edit.text():
+            self._filter_timer.start()
 
     def set_current_index(self, index: int) -> None:
-        if 0 <= index < self.list_widget.count():
-            self.list_widget.setCurrentRow(index)
+        if not 0 <= index < self.model.track_count():
+            return
+        row = self.model.row_for_source(index)
+        if row < 0:
+            return
+        self.model.ensure_row_loaded(row)
+        self.table_view.selectRow(row)
+        self.table_view.scrollTo(self.model.index(row, 0))
 
     def current_index(self) -> int:
-        return self.list_widget.currentRow()
+        row = self.table_view.currentIndex().row()
+        return self.model.source_row(row) if row >= 0 else row
+
+    def _emit_track_activated(self, index: QModelIndex) -> None:
+        self.track_activated.emit(self.model.source_row(index.row()))
+
+    def _apply_filter(self) -> None:
+        self.model.set_filter(self._search_index.search(self.filter_edit.text()))
 
-    def _emit_track_activated(self, item: QListWidgetItem) -> None:
-        self.track_activated.emit(self.list_widget.row(item))
+    def _index_pending_tracks(self) -> None:
+        deadline = time.perf_counter() + self.INDEX_SLICE_MS / 1000
+        pending = self._unindexed
+        index = self._search_index
+        while pending and time.perf_counter() < deadline:
+            for _ in range(min(len(pending), 64)):
+                track_path = pending.popleft()
+                # Tracks whose tags already arrived were indexed with those.
+                if track_path not in index:
+                    path = PurePath(track_path)
+                    index.add(track_path, (path.stem, path.parent.name, path.parent.parent.name))
+        if pending:
+            return
+        self._index_timer.stop()
+        if self.filter_edit.text():
+            self._apply_filter()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from PyQt6.QtCore import QElapsedTimer, QObject, QTimer
+
+
+class PositionUpdateCoalescer(QObject):
+    """Forwards the latest playback position at most `max_rate_hz` times a second.
+
+    The first update after a quiet period goes out immediately; updates that
+    arrive faster are folded into one trailing delivery. While suspended only
+    the latest value is kept and it is delivered on resume.
+    """
+
+    DEFAULT_MAX_RATE_HZ = 10
+
+    def __init__(
+        self,
+        sink: Callable[[int], None],
+        parent: QObject | None = None,
+        max_rate_hz: int = DEFAULT_MAX_RATE_HZ,
+    ) -> None:
+        super().__init__(parent)
+        self._sink = sink
+        self._interval_ms = max(1, 1000 // max_rate_hz)
+        self._latest: int | None = None
+        self._delivered: int | None = None
+        self._suspended = False
+        self._since_delivery = QElapsedTimer()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def submit(self, position_ms: int) -> None:
+        self._latest = position_ms
+        if self._suspended or self._timer.isActive():
+            return
+
+        elapsed = self._since_delivery.elapsed() if self._since_delivery.isValid() else self._interval_ms
+        if elapsed >= self._interval_ms:
+            self.flush()
+        else:
+            self._timer.start(self._interval_ms - elapsed)
+
+    def flush(self) -> None:
+        self._timer.stop()
+        if self._suspended or self._latest is None or self._latest == self._delivered:
+            return
+        self._delivered = self._latest
+        self._since_delivery.start()
+        self._sink(self._latest)
+
+    def set_suspended(self, suspended: bool) -> None:
+        if suspended == self._suspended:
+            return
+        self._suspended = suspended
+        if suspended:
+            self._timer.stop()
+        else:
+            self.flush()
+
+    def is_suspended(self) -> bool:
+        return self._suspended
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QDialogButtonBox,
+    QHeaderView,
+    QLabel,
+    QPlainTextEdit,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from app.front_end.stall_watchdog import StallSite, StallWatchdog
+
+
+class StallStatsDialog(QDialog):
+    """Stall totals per location; selecting a row shows the last stack captured there."""
+
+    COLUMNS = ("Location", "Stalls", "Total ms", "Longest ms")
+
+    def __init__(self, watchdog: StallWatchdog, parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Event Loop Stalls")
+        self.resize(720, 480)
+        self._watchdog = watchdog
+        self._sites: list[StallSite] = []
+
+        self.summary_label = QLabel()
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.currentCellChanged.connect(self._show_stack)
+
+        self.stack_view = QPlainTextEdit()
+        self.stack_view.setReadOnly(True)
+        self.stack_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        reset_button = QPushButton("Reset")
+        buttons.addButton(reset_button, QDialogButtonBox.ButtonRole.ResetRole)
+        reset_button.clicked.connect(self._reset)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.summary_label)
+        layout.addWidget(self.table, 3)
+        layout.addWidget(self.stack_view, 2)
+        layout.addWidget(buttons)
+
+        watchdog.stall_detected.connect(self.refresh)
+        self.refresh()
+
+    def refresh(self) -> None:
+        self._sites = self._watchdog.sites()
+        count = sum(site.count for site in self._sites)
+        if not self._watchdog.is_running():
+            self.summary_label.setText(f"Watchdog off. {count} stalls recorded.")
+        else:
+            total_ms = sum(site.total_ms for site in self._sites)
+            longest_ms = max((site.max_ms for site in self._sites), default=0.0)
+            self.summary_label.setText(
+                f"{count} stalls over {self._watchdog.threshold_ms} ms: "
+                f"{total_ms:.0f} ms in total, longest {longest_ms:.0f} ms."
+            )
+
+        self.table.setRowCount(len(self._sites))
+        for row, site in enumerate(self._sites):
+            values = (site.location, str(site.count), f"{site.total_ms:.0f}", f"{site.max_ms:.0f}")
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+        if self._sites and self.table.currentRow() < 0:
+            self.table.setCurrentCell(0, 0)
+        self._show_stack(self.table.currentRow())
+
+    def _show_stack(self, row: int, *_: int) -> None:
+        self.stack_view.setPlainText(self._sites[row].last_stack if 0 <= row < len(self._sites) else "")
+
+    def _reset(self) -> None:
+        self._watchdog.reset()
+        self.refresh()
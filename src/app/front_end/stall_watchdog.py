@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from app.back_end.utils.tracing import tracer
+
+STALL_THRESHOLD_ENV_VAR = "MUSIC_PLAYER_STALL_THRESHOLD_MS"
+UNKNOWN_LOCATION = "<stack not captured>"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Stall:
+    duration_ms: float
+    location: str
+    stack: str
+
+
+@dataclass(slots=True)
+class StallSite:
+    location: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_stack: str = ""
+
+
+def stall_threshold_ms() -> int:
+    """The threshold from MUSIC_PLAYER_STALL_THRESHOLD_MS, the default when unset; 0 turns the watchdog off."""
+    value = os.environ.get(STALL_THRESHOLD_ENV_VAR, "").strip()
+    try:
+        return max(0, int(value)) if value else StallWatchdog.DEFAULT_THRESHOLD_MS
+    except ValueError:
+        return StallWatchdog.DEFAULT_THRESHOLD_MS
+
+
+class StallWatchdog(QObject):
+    """Reports event-loop stalls of the thread that creates it, with that thread's Python stack.
+
+    A timer on the watched loop records a heartbeat every
+    `heartbeat_interval_ms`. A daemon thread checks the heartbeat's age; once
+    it is overdue by `threshold_ms` the thread snapshots the loop thread's
+    stack through sys._current_frames, while the stall is still in progress.
+    The next heartbeat measures how long the stall lasted, logs it with the
+    stack and folds it into per-location statistics.
+    """
+
+    DEFAULT_THRESHOLD_MS = 250
+    HEARTBEAT_INTERVAL_MS = 50
+    RECENT_STALLS = 100
+
+    stall_detected = pyqtSignal(object)
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        threshold_ms: int = DEFAULT_THRESHOLD_MS,
+        heartbeat_interval_ms: int = HEARTBEAT_INTERVAL_MS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self._heartbeat_interval_ms = heartbeat_interval_ms
+        self._clock = clock
+        self._watched_thread_id = threading.get_ident()
+        self._last_beat = clock()
+        self._lock = threading.Lock()
+        # (heartbeat the stall followed, location, stack), written by the watchdog thread.
+        self._captured: tuple[float, str, str] | None = None
+        self._recent: deque[Stall] = deque(maxlen=self.RECENT_STALLS)
+        self._sites: dict[str, StallSite] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(heartbeat_interval_ms)
+        self._timer.timeout.connect(self._heartbeat)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._last_beat = self._clock()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def recent_stalls(self) -> list[Stall]:
+        with self._lock:
+            return list(self._recent)
+
+    def sites(self) -> list[StallSite]:
+        """Per-location totals, the location that cost the most stalled time first."""
+        with self._lock:
+            sites = [replace(site) for site in self._sites.values()]
+        return sorted(sites, key=lambda site: site.total_ms, reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._sites.clear()
+
+    def _watch(self) -> None:
+        poll_seconds = max(self.threshold_ms / 4, 10) / 1000
+        while not self._stop.wait(poll_seconds):
+            self._check()
+
+    def _overdue_ms(self, now: float, last_beat: float) -> float:
+        return (now - last_beat) * 1000 - self._heartbeat_interval_ms
+
+    def _check(self) -> None:
+        last_beat = self._last_beat
+        if self._overdue_ms(self._clock(), last_beat) < self.threshold_ms:
+            return
+        with self._lock:
+            if self._captured is not None and self._captured[0] == last_beat:
+                return
+        frame = sys._current_frames().get(self._watched_thread_id)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)
+        del frame
+        innermost = stack[-1]
+        location = f"{Path(innermost.filename).name}:{innermost.lineno} in {innermost.name}"
+        with self._lock:
+            self._captured = (last_beat, location, "".join(stack.format()))
+
+    def _heartbeat(self) -> None:
+        now = self._clock()
+        last_beat, self._last_beat = self._last_beat, now
+        duration_ms = self._overdue_ms(now, last_beat)
+        if duration_ms < self.threshold_ms:
+            return
+
+        with self._lock:
+            captured, self._captured = self._captured, None
+        if captured is not None and captured[0] == last_beat:
+            stall = Stall(duration_ms, captured[1], captured[2])
+        else:
+            # The watchdog thread never got the GIL while the loop was stuck.
+            stall = Stall(duration_ms, UNKNOWN_LOCATION, "")
+        self._record(stall)
+
+    def _record(self, stall: Stall) -> None:
+        with self._lock:
+            self._recent.append(stall)
+            site = self._sites.get(stall.location)
+            if site is None:
+                site = self._sites[stall.location] = StallSite(stall.location)
+            site.count += 1
+            site.total_ms += stall.duration_ms
+            site.max_ms = max(site.max_ms, stall.duration_ms)
+            site.last_stack = stall.stack
+
+        logger.warning("Event loop stalled for %.0f ms at %s\n%s", stall.duration_ms, stall.location, stall.stack)
+        if tracer.enabled:
+            ended = time.perf_counter_ns()
+            tracer.record("event loop stall", "stall", ended - int(stall.duration_ms * 1_000_000), ended, stall.location)
+        self.stall_detected.emit(stall)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from typing import TextIO
+
+from PyQt6.QtCore import QEvent, QObject
+
+# Subsystems that are not needed for the first paint and must stay unloaded
+# until the window is on screen.
+DEFERRED_MODULES = (
+    "PyQt6.QtMultimedia",
+    "mutagen",
+    "app.front_end.metadata_editor_dialog",
+    "app.front_end.stall_stats_dialog",
+)
+
+
+class StartupProfile:
+    def __init__(self, started_at: float) -> None:
+        self._started_at = started_at
+        self._last_mark = started_at
+        self._phases: list[tuple[str, float, float]] = []
+        self.loaded_before_first_paint: list[str] = []
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self._phases.append((phase, (now - self._last_mark) * 1000, (now - self._started_at) * 1000))
+        self._last_mark = now
+
+    def mark_first_paint(self) -> None:
+        self.mark("first paint")
+        self.loaded_before_first_paint = [name for name in DEFERRED_MODULES if name in sys.modules]
+
+    def phases(self) -> list[tuple[str, float, float]]:
+        return list(self._phases)
+
+    def report(self, stream: TextIO) -> None:
+        stream.write(f"{'phase':<28}{'duration':>12}{'elapsed':>12}\n")
+        for phase, duration_ms, elapsed_ms in self._phases:
+            stream.write(f"{phase:<28}{duration_ms:>9.1f} ms{elapsed_ms:>9.1f} ms\n")
+        loaded = ", ".join(self.loaded_before_first_paint) or "none"
+        stream.write(f"deferred modules loaded before first paint: {loaded}\n")
+        stream.flush()
+
+
+class FirstPaintWatcher(QObject):
+    """Event filter that fires once, on the first paint of the watched widget."""
+
+    def __init__(self, callback: Callable[[], None], parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._callback: Callable[[], None] | None = callback
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        if event.type() == QEvent.Type.Paint and self._callback is not None:
+            callback, self._callback = self._callback, None
+            watched.removeEventFilter(self)
+            callback()
+        return False
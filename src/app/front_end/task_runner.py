@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import itertools
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from app.back_end.services.rust_bridge import CancelFlagProtocol, create_cancel_flag
+
+ResultCallback = Callable[[Any], None]
+ErrorCallback = Callable[[BaseException], None]
+
+
+@dataclass(slots=True)
+class _Task:
+    key: str | None
+    generation: int
+    on_result: ResultCallback | None
+    on_error: ErrorCallback | None
+    cancel_flag: CancelFlagProtocol | None = None
+    future: Future[Any] | None = field(default=None, repr=False)
+
+
+class TaskRunner(QObject):
+    """Runs blocking back-end calls on a worker pool.
+
+    Callbacks are always invoked on the thread that owns the runner: the
+    worker emits `_completed`, and Qt queues the cross-thread delivery.
+    Keyed tasks supersede each other: submitting a new task for a key cancels
+    the previous one and drops its result even if it already finished.
+    """
+
+    _completed = pyqtSignal(object, object, object)
+
+    def __init__(self, parent: QObject | None = None, max_workers: int = 4) -> None:
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-task")
+        self._generations = itertools.count(1)
+        self._latest: dict[str, _Task] = {}
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._completed.connect(self._deliver)
+
+    def submit(
+        self,
+        function: Callable[..., Any],
+        *args: Any,
+        on_result: ResultCallback | None = None,
+        on_error: ErrorCallback | None = None,
+    ) -> Future[Any]:
+        task = _Task(None, next(self._generations), on_result, on_error)
+        return self._start(task, function, args, {})
+
+    def submit_latest(
+        self,
+        key: str,
+        function: Callable[..., Any],
+        *args: Any,
+        on_result: ResultCallback | None = None,
+        on_error: ErrorCallback | None = None,
+    ) -> Future[Any]:
+        """Run `function(*args, cancel_flag=...)`, superseding earlier work for `key`."""
+        self.cancel(key)
+        task = _Task(key, next(self._generations), on_result, on_error, create_cancel_flag())
+        self._latest[key] = task
+        return self._start(task, function, args, {"cancel_flag": task.cancel_flag})
+
+    def cancel(self, key: str) -> None:
+        task = self._latest.pop(key, None)
+        if task is None:
+            return
+        task.cancel_flag.cancel()
+        task.future.cancel()
+
+    def in_flight_count(self) -> int:
+        with self._in_flight_lock:
+            return self._in_flight
+
+    def shutdown(self) -> None:
+        for key in list(self._latest):
+            self.cancel(key)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _start(
+        self,
+        task: _Task,
+        function: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Future[Any]:
+        with self._in_flight_lock:
+            self._in_flight += 1
+        task.future = self._executor.submit(function, *args, **kwargs)
+        task.future.add_done_callback(lambda done: self._relay(task, done))
+        return task.future
+
+    def _relay(self, task: _Task, future: Future[Any]) -> None:
+        with self._in_flight_lock:
+            self._in_flight -= 1
+        if future.cancelled() or (task.cancel_flag is not None and task.cancel_flag.is_cancelled()):
+            return
+        error = future.exception()
+        try:
+            self._completed.emit(task, None if error is not None else future.result(), error)
+        except RuntimeError:
+            # The runner was destroyed while the task was still running.
+            pass
+
+    def _deliver(self, task: _Task, result: Any, error: BaseException | None) -> None:
+        if task.key is not None:
+            if self._latest.get(task.key) is not task:
+                return
+            del self._latest[task.key]
+
+        if error is not None:
+            if task.on_error is not None:
+                task.on_error(error)
+        elif task.on_result is not None:
+            task.on_result(result)
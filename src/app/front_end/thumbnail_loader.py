@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+from PyQt6.QtCore import QByteArray, QBuffer, QIODevice, QObject, QRect, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+from app.back_end.services.rust_bridge import CancelFlagProtocol
+from app.front_end.task_runner import TaskRunner
+
+ArtworkReader = Callable[..., bytes | None]
+
+
+def decode_thumbnail(image_data: bytes, size: int) -> QImage | None:
+    """Decode `image_data` straight to a `size` x `size` center crop.
+
+    The reader scales while decoding, so a large JPEG never exists in memory
+    at full resolution. Safe to call off the GUI thread.
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(image_data))
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    reader = QImageReader(buffer)
+    source_size = reader.size()
+    if source_size.isValid() and not source_size.isEmpty():
+        scaled = source_size.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatioByExpanding)
+        reader.setScaledSize(scaled)
+        reader.setScaledClipRect(QRect((scaled.width() - size) // 2, (scaled.height() - size) // 2, size, size))
+    image = reader.read()
+    if image.isNull():
+        return None
+    if image.size() != QSize(size, size):
+        image = image.scaled(
+            size,
+            size,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    # The premultiplied format is what the raster paint engine blits from,
+    # so QPixmap.fromImage on the GUI thread does not convert again.
+    return image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+
+class PixmapLruCache:
+    """Least-recently-used pixmaps, bounded by their pixel bytes."""
+
+    # Charged for every entry, so albums without artwork count too.
+    ENTRY_OVERHEAD_BYTES = 256
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[QPixmap | None, int]] = OrderedDict()
+        self._total_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: str) -> QPixmap | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: str, pixmap: QPixmap | None) -> None:
+        self.discard(key)
+        cost = self.ENTRY_OVERHEAD_BYTES
+        if pixmap is not None:
+            cost += pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        self._entries[key] = (pixmap, cost)
+        self._total_bytes += cost
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            _evicted, (_pixmap, evicted_cost) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_cost
+
+    def discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_bytes = 0
+
+
+class ThumbnailLoader(QObject):
+    """Reads and decodes artwork thumbnails on a small worker pool.
+
+    Each key is a track path whose artwork is wanted. Loads are keyed tasks
+    on a dedicated TaskRunner, so `retain` can cancel requests for cells that
+    scrolled away before a worker picked them up, and thumbnails never queue
+    behind (or delay) the window's other background work.
+    """
+
+    thumbnail_ready = pyqtSignal(str)
+
+    def __init__(
+        self,
+        artwork_reader: ArtworkReader,
+        size: int,
+        max_bytes: int,
+        parent: QObject | None = None,
+        max_workers: int = 2,
+    ) -> None:
+        super().__init__(parent)
+        self._artwork_reader = artwork_reader
+        self._size = size
+        self._cache = PixmapLruCache(max_bytes)
+        self._pending: set[str] = set()
+        self._task_runner = TaskRunner(self, max_workers=max_workers)
+
+    @property
+    def cache(self) -> PixmapLruCache:
+        return self._cache
+
+    def thumbnail(self, key: str) -> QPixmap | None:
+        """Return the cached thumbnail for `key`, loading it if it is not cached."""
+        if key in self._cache:
+            return self._cache.get(key)
+        if key not in self._pending:
+            self._pending.add(key)
+            self._task_runner.submit_latest(
+                key,
+                self._load,
+                key,
+                on_result=lambda image, key=key: self._store(key, image),
+                on_error=lambda _error, key=key: self._store(key, None),
+            )
+        return None
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """Cancel pending loads for every key not in `keys`."""
+        wanted = set(keys)
+        for key in self._pending - wanted:
+            self._task_runner.cancel(key)
+            self._pending.discard(key)
+
+    def clear(self) -> None:
+        self.retain(())
+        self._cache.clear()
+
+    def shutdown(self) -> None:
+        self.retain(())
+        self._task_runner.shutdown()
+
+    def _load(self, key: str, cancel_flag: CancelFlagProtocol | None = None) -> QImage | None:
+        image_data = self._artwork_reader(key, cancel_flag=cancel_flag)
+        if not image_data or (cancel_flag is not None and cancel_flag.is_cancelled()):
+            return None
+        return decode_thumbnail(image_data, self._size)
+
+    def _store(self, key: str, image: QImage | None) -> None:
+        self._pending.discard(key)
+        self._cache.put(key, QPixmap.fromImage(image) if image is not None else None)
+        self.thumbnail_ready.emit(key)
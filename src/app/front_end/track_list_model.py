@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from itertools import compress
+from pathlib import PurePath
+
+from PyQt6.QtCore import QAbstractTableModel, QByteArray, QMimeData, QModelIndex, Qt, QTimer, pyqtSignal
+
+from app.back_end.services.track_store import TrackFlag, TrackStore
+from app.back_end.services.trigram_index import TrigramMatch
+
+TrackDetails = tuple[str, str, int]
+
+
+class TrackListModel(QAbstractTableModel):
+    """Table over a flat list of track paths that materializes rows lazily.
+
+    Rows are exposed in `FETCH_BATCH_SIZE` chunks through canFetchMore/fetchMore,
+    and title/artist/duration are only requested for rows the view actually
+    paints; until they arrive the file name stands in for the title. Details
+    are kept in a TrackStore, which the owner of the queue may share.
+
+    A filter narrows the rows to a TrigramMatch while keeping queue order.
+    Small, sparse matches are mapped to rows up front; the rest are found by
+    walking the queue only as far as the view has fetched, and a keystroke
+    only walks far enough to fill the first screens.
+    """
+
+    COLUMNS = ("Title", "Artist", "Duration")
+    FETCH_BATCH_SIZE = 500
+    ROWS_MIME_TYPE = "application/x-music-player-rows"
+    SPARSE_FILTER_RATIO = 8
+    SPARSE_FILTER_LIMIT = 2_048
+    FILTER_SCAN_CHUNK = 1_024
+    FILTER_FIRST_BATCH_SIZE = 128
+
+    details_requested = pyqtSignal(list)
+    rows_moved = pyqtSignal(list, int)
+
+    def __init__(self, parent=None, tracks: TrackStore | None = None) -> None:
+        super().__init__(parent)
+        self._paths: list[str] = []
+        self._loaded_count = 0
+        self._tracks = tracks if tracks is not None else TrackStore()
+        self._requested: set[str] = set()
+        self._queued: list[str] = []
+        self._filter: TrigramMatch[str] | None = None
+        self._filtered_rows: list[int] = []
+        self._scanned_count = 0
+        self._row_of: dict[str, int] | None = None
+
+        self._request_timer = QTimer(self)
+        self._request_timer.setSingleShot(True)
+        self._request_timer.setInterval(0)
+        self._request_timer.timeout.connect(self._flush_requests)
+
+    def set_track_store(self, tracks: TrackStore) -> None:
+        self._tracks = tracks
+        self._requested.clear()
+        if self._loaded_count:
+            self._emit_rows_changed()
+
+    def set_tracks(self, track_paths: Sequence[str]) -> None:
+        self.beginResetModel()
+        self._paths = list(track_paths)
+        self._row_of = None
+        self._filter = None
+        self._loaded_count = min(len(self._paths), self.FETCH_BATCH_SIZE)
+        self._requested.clear()
+        self._queued.clear()
+        self.endResetModel()
+
+    def append_tracks(self, track_paths: Sequence[str]) -> None:
+        fully_loaded = not self.canFetchMore(QModelIndex())
+        if self._row_of is not None:
+            self._row_of.update((path, row) for row, path in enumerate(track_paths, start=len(self._paths)))
+        self._paths.extend(track_paths)
+        # Appends only become rows right away when the view has already
+        # scrolled through everything; otherwise fetchMore picks them up.
+        if fully_loaded:
+            self._load_rows(self.FETCH_BATCH_SIZE)
+
+    def set_filter(self, match: TrigramMatch[str] | None) -> None:
+        self.beginResetModel()
+        self._filter = match
+        self._filtered_rows = []
+        self._scanned_count = 0
+        # Mapping every matched path to its row costs more per match than the
+        # walk does per row, so large matches are walked even when sparse.
+        sparse_limit = min(len(self._paths) // self.SPARSE_FILTER_RATIO, self.SPARSE_FILTER_LIMIT)
+        if match is not None and len(match) <= sparse_limit:
+            row_of = self._rows_by_path()
+            self._filtered_rows = sorted(row for row in map(row_of.get, match.keys()) if row is not None)
+            self._scanned_count = len(self._paths)
+        self._scan_matches(self.FILTER_FIRST_BATCH_SIZE)
+        self._loaded_count = min(self._row_limit(), self.FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    def is_filtered(self) -> bool:
+        return self._filter is not None
+
+    def source_row(self, row: int) -> int:
+        return self._filtered_rows[row] if self._filter is not None else row
+
+    def row_for_source(self, source_row: int) -> int:
+        if self._filter is None:
+            return source_row
+        if self._scanned_count <= source_row:
+            self._scan_through(source_row)
+        row = bisect_left(self._filtered_rows, source_row)
+        if row < len(self._filtered_rows) and self._filtered_rows[row] == source_row:
+            return row
+        return -1
+
+    def track_path(self, row: int) -> str:
+        return self._paths[self.source_row(row)]
+
+    def track_count(self) -> int:
+        return len(self._paths)
+
+    def ensure_row_loaded(self, row: int) -> None:
+        if row >= self._loaded_count:
+            self._load_rows(row + 1 - self._loaded_count)
+
+    def set_track_details(self, details: dict[str, TrackDetails], albums: Mapping[str, str] | None = None) -> None:
+        tracks = self._tracks
+        for path, (title, artist, duration_ms) in details.items():
+            self._requested.discard(path)
+            row = tracks.row_of(path)
+            if row is None:
+                row = tracks.append(path)
+            album = albums.get(path, "") if albums is not None else tracks[row].album
+            tracks.update(row, title=title, artist=artist, album=album, duration_ms=duration_ms)
+            tracks.set_flag((row,), TrackFlag.TAGS_READ)
+        if details and self._loaded_count:
+            self._emit_rows_changed()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if parent.isValid():
+            return False
+        if self._filter is not None and self._scanned_count < len(self._paths):
+            return True
+        return self._loaded_count < self._row_limit()
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not parent.isValid():
+            self._load_rows(self.FETCH_BATCH_SIZE)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self._paths[self.source_row(index.row())]
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return path
+        if role == Qt.ItemDataRole.UserRole:
+            return path
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 2:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        row = self._tracks.row_of(path)
+        track = self._tracks[row] if row is not None else None
+        if track is None or not track.flags & TrackFlag.TAGS_READ:
+            self._request_details(path)
+            return PurePath(path).name if index.column() == 0 else ""
+
+        if index.column() == 0:
+            return track.title or PurePath(path).name
+        if index.column() == 1:
+            return track.artist
+        return self._format_duration(track.duration_ms)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if self._filter is not None:
+            # Reordering a filtered subset has no well-defined queue position.
+            if not index.isValid():
+                return Qt.ItemFlag.NoItemFlags
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsDragEnabled
+        )
+
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self) -> list[str]:
+        return [self.ROWS_MIME_TYPE]
+
+    def mimeData(self, indexes: list[QModelIndex]) -> QMimeData:
+        rows = sorted({index.row() for index in indexes})
+        mime_data = QMimeData()
+        mime_data.setData(self.ROWS_MIME_TYPE, QByteArray(",".join(map(str, rows)).encode()))
+        return mime_data
+
+    def dropMimeData(self, data: QMimeData, action: Qt.DropAction, row: int, column: int, parent: QModelIndex) -> bool:
+        if action != Qt.DropAction.MoveAction or not data.hasFormat(self.ROWS_MIME_TYPE):
+            return False
+        payload = bytes(data.data(self.ROWS_MIME_TYPE)).decode()
+        rows = [int(value) for value in payload.split(",") if value]
+        if not rows:
+            return False
+        if row < 0:
+            row = parent.row() if parent.isValid() else len(self._paths)
+        return self.move_rows(rows, row)
+
+    def move_rows(self, rows: list[int], destination: int) -> bool:
+        if self._filter is not None:
+            return False
+        rows = sorted(set(rows))
+        if rows[0] < 0 or rows[-1] >= self._loaded_count or not 0 <= destination <= len(self._paths):
+            return False
+
+        contiguous = rows[-1] - rows[0] + 1 == len(rows)
+        if contiguous and rows[0] <= destination <= rows[-1] + 1:
+            return False
+
+        moved = [self._paths[row] for row in rows]
+        insert_at = destination - sum(1 for row in rows if row < destination)
+        # Rows can only be moved among the fetched ones; a move past them
+        # takes rows out of the view, so it resets the model instead.
+        in_view = contiguous and destination <= self._loaded_count
+        if in_view:
+            self.beginMoveRows(QModelIndex(), rows[0], rows[-1], QModelIndex(), destination)
+        else:
+            self.beginResetModel()
+
+        for row in reversed(rows):
+            del self._paths[row]
+        self._paths[insert_at:insert_at] = moved
+        self._row_of = None
+
+        if in_view:
+            self.endMoveRows()
+        else:
+            self.endResetModel()
+        self.rows_moved.emit(moved, insert_at)
+        return True
+
+    def _row_limit(self) -> int:
+        return len(self._filtered_rows) if self._filter is not None else len(self._paths)
+
+    def _rows_by_path(self) -> dict[str, int]:
+        if self._row_of is None:
+            self._row_of = {path: row for row, path in enumerate(self._paths)}
+        return self._row_of
+
+    def _scan_matches(self, wanted: int) -> None:
+        if self._filter is None:
+            return
+        while len(self._filtered_rows) < wanted and self._scanned_count < len(self._paths):
+            self._scan_chunk()
+
+    def _scan_through(self, source_row: int) -> None:
+        while self._scanned_count <= source_row and self._scanned_count < len(self._paths):
+            self._scan_chunk()
+
+    def _scan_chunk(self) -> None:
+        paths = self._paths
+        match = self._filter
+        start = self._scanned_count
+        stop = min(len(paths), start + self.FILTER_SCAN_CHUNK)
+        self._filtered_rows.extend(compress(range(start, stop), match.flags(paths[start:stop])))
+        self._scanned_count = stop
+
+    def _load_rows(self, count: int) -> None:
+        self._scan_matches(self._loaded_count + count)
+        stop = min(self._row_limit(), self._loaded_count + count)
+        if stop <= self._loaded_count:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_count, stop - 1)
+        self._loaded_count = stop
+        self.endInsertRows()
+
+    def _emit_rows_changed(self) -> None:
+        self.dataChanged.emit(
+            self.index(0, 0),
+            self.index(self._loaded_count - 1, len(self.COLUMNS) - 1),
+            [Qt.ItemDataRole.DisplayRole],
+        )
+
+    def _request_details(self, path: str) -> None:
+        if path in self._requested:
+            return
+        self._requested.add(path)
+        self._queued.append(path)
+        self._request_timer.start()
+
+    def _flush_requests(self) -> None:
+        queued, self._queued = self._queued, []
+        if queued:
+            self.details_requested.emit(queued)
+
+    @staticmethod
+    def _format_duration(duration_ms: int) -> str:
+        if duration_ms <= 0:
+            return ""
+        total_seconds = duration_ms // 1000
+        minutes, seconds = divmod(total_seconds, 60)
+        return f"{minutes}:{seconds:02d}"
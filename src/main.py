@@ -3,15 +3,51 @@
 from __future__ import annotations
 
 import sys
+import time
 
-from PyQt6.QtWidgets import QApplication
+PROFILE_STARTUP_FLAG = "--profile-startup"
 
-from app.front_end.main_window import MainWindow
 
+def main(argv: list[str] | None = None) -> int:
+    started_at = time.perf_counter()
+    argv = list(sys.argv if argv is None else argv)
+    profile_startup = PROFILE_STARTUP_FLAG in argv
+    if profile_startup:
+        argv.remove(PROFILE_STARTUP_FLAG)
 
-def main() -> int:
-    app = QApplication.instance() or QApplication(sys.argv)
+    # Imports stay inside main() so --profile-startup can attribute their cost.
+    from PyQt6.QtWidgets import QApplication
+
+    from app.back_end.utils.tracing import start_from_environment
+
+    start_from_environment()
+
+    from app.front_end.startup_profile import FirstPaintWatcher, StartupProfile
+
+    profile = StartupProfile(started_at)
+    profile.mark("import Qt widgets")
+
+    app = QApplication.instance() or QApplication(argv)
+    profile.mark("create application")
+
+    from app.front_end.main_window import MainWindow
+
+    profile.mark("import main window")
     window = MainWindow()
+    profile.mark("construct main window")
+
+    if profile_startup:
+        watcher = FirstPaintWatcher(profile.mark_first_paint, window)
+        window.installEventFilter(watcher)
+
+        def finish() -> None:
+            profile.mark("playback ready")
+            profile.report(sys.stderr)
+            window.close()
+            app.quit()
+
+        window.playback_ready.connect(finish)
+
     window.show()
     return app.exec()
 
@@ -0,0 +1,149 @@
+from app.back_end.controllers.library_controller import LibraryController
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.services.rust_bridge import INGEST_COLUMNS
+
+
+def _create_track(db_handler: DatabaseHandler, path: str, artist: str | None, album: str | None) -> int:
+    connection = db_handler.connect()
+    cursor = connection.execute(
+        "INSERT INTO tracks (path, title, artist, album, duration_ms) VALUES (?, ?, ?, ?, ?)",
+        (path, "Title", artist, album, 200_000),
+    )
+    connection.commit()
+    return int(cursor.lastrowid)
+
+
+def test_get_track_groupings_returns_artist_and_album_by_path_in_bulk(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = LibraryController(Repository(db_handler))
+    _create_track(db_handler, "/music/a.mp3", "Artist A", "Album A")
+    _create_track(db_handler, "/music/b.mp3", None, None)
+    bulk_paths = [f"/music/bulk_{i}.mp3" for i in range(1_500)]
+    for path in bulk_paths:
+        _create_track(db_handler, path, "Bulk", "B")
+
+    groupings = controller.get_track_groupings(["/music/a.mp3", "/music/b.mp3", *bulk_paths, "/elsewhere/c.mp3"])
+
+    assert len(groupings) == 2 + len(bulk_paths)
+    assert groupings["/music/a.mp3"] == ("Artist A", "Album A")
+    assert groupings["/music/b.mp3"] == ("", "")
+    assert "/elsewhere/c.mp3" not in groupings
+    assert controller.get_track_groupings([]) == {}
+    db_handler.close()
+
+
+def test_ingest_columns_inserts_new_paths_and_skips_existing(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = LibraryController(Repository(db_handler))
+    _create_track(db_handler, "/music/a.mp3", "Artist A", "Album A")
+    columns = {name: [None, None] for name in INGEST_COLUMNS}
+    columns.update(
+        path=["/music/a.mp3", "/music/b.mp3"],
+        title=["Other", "Song B"],
+        artist=["Other", "Artist B"],
+        album=["Other", "Album B"],
+        duration_ms=[1, 90_000],
+    )
+
+    inserted = controller.ingest_columns(columns)
+
+    rows = db_handler.connect().execute("SELECT path, title FROM tracks ORDER BY path").fetchall()
+    assert inserted == 1
+    assert rows == [("/music/a.mp3", "Title"), ("/music/b.mp3", "Song B")]
+    assert controller.ingest_columns({name: [] for name in INGEST_COLUMNS}) == 0
+    db_handler.close()
+
+
+def _create_library(db_handler: DatabaseHandler, artist_count: int) -> None:
+    connection = db_handler.connect()
+    connection.executemany(
+        "INSERT INTO tracks (path, title, artist, album, duration_ms) VALUES (?, ?, ?, ?, ?)",
+        [
+            (f"/music/{artist}/{album}/{track}.mp3", f"Track {track}", f"Artist {artist:05d}", f"Album {album}", 60_000)
+            for artist in range(artist_count)
+            for album in range(2)
+            for track in range(3)
+        ],
+    )
+    connection.commit()
+
+
+def test_list_artists_pages_with_aggregates(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = LibraryController(Repository(db_handler))
+    _create_library(db_handler, 25)
+    _create_track(db_handler, "/music/unknown.mp3", None, None)
+
+    first_page = controller.list_artists(limit=10)
+    second_page = controller.list_artists(after=first_page[-1][0], limit=10)
+    last_page = controller.list_artists(after="Artist 00018", limit=10)
+
+    assert first_page[0] == (None, 0, 1, 200_000)
+    assert first_page[1] == ("Artist 00000", 2, 6, 360_000)
+    assert [artist for artist, *_ in second_page] == [f"Artist {index:05d}" for index in range(9, 19)]
+    assert [artist for artist, *_ in last_page] == [f"Artist {index:05d}" for index in range(19, 25)]
+    db_handler.close()
+
+
+def test_list_albums_and_tracks_for_one_artist(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = LibraryController(Repository(db_handler))
+    _create_library(db_handler, 3)
+    _create_track(db_handler, "/music/loose.mp3", "Artist 00001", None)
+
+    albums = controller.list_albums("Artist 00001")
+    tracks = controller.list_album_tracks("Artist 00001", "Album 1")
+
+    assert albums == [(None, 1, 200_000), ("Album 0", 3, 180_000), ("Album 1", 3, 180_000)]
+    assert [(path, title, duration) for _track_id, path, title, duration in tracks] == [
+        ("/music/1/1/0.mp3", "Track 0", 60_000),
+        ("/music/1/1/1.mp3", "Track 1", 60_000),
+        ("/music/1/1/2.mp3", "Track 2", 60_000),
+    ]
+    assert controller.list_album_tracks("Artist 00001", None)[0][1] == "/music/loose.mp3"
+    db_handler.close()
+
+
+def test_list_album_covers_returns_one_row_per_album(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = LibraryController(Repository(db_handler))
+    _create_library(db_handler, 2)
+    _create_track(db_handler, "/music/loose.mp3", None, None)
+
+    covers = controller.list_album_covers()
+
+    assert covers == [
+        (None, None, 1, "/music/loose.mp3"),
+        ("Artist 00000", "Album 0", 3, "/music/0/0/0.mp3"),
+        ("Artist 00000", "Album 1", 3, "/music/0/1/0.mp3"),
+        ("Artist 00001", "Album 0", 3, "/music/1/0/0.mp3"),
+        ("Artist 00001", "Album 1", 3, "/music/1/1/0.mp3"),
+    ]
+    db_handler.close()
+
+
+def test_grouped_library_queries_use_the_artist_album_index(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    connection = db_handler.connect()
+
+    plans = [
+        connection.execute(
+            "EXPLAIN QUERY PLAN SELECT artist, COUNT(*) FROM tracks WHERE artist > ? GROUP BY artist ORDER BY artist",
+            ("A",),
+        ).fetchall(),
+        connection.execute(
+            "EXPLAIN QUERY PLAN SELECT album, SUM(duration_ms) FROM tracks WHERE artist IS ? GROUP BY album",
+            ("A",),
+        ).fetchall(),
+    ]
+
+    for plan in plans:
+        assert any("COVERING INDEX idx_tracks_artist_album" in row[-1] for row in plan)
+    db_handler.close()
@@ -150,3 +150,90 @@ def test_playlist_methods_return_error_for_unknown_playlist(tmp_path):
     assert response.message is ErrorMessage.PLAYLIST_NOT_FOUND
     assert response.data is None
     db_handler.close()
+
+
+def _create_playlist_with_tracks(db_handler: DatabaseHandler, controller: PlaylistController, count: int):
+    playlist_id = controller.create_playlist("Paged").data["playlist_id"]
+    track_ids = [_create_track(db_handler, f"/music/paged_{index}.mp3") for index in range(count)]
+    for track_id in track_ids:
+        controller.add_track_to_playlist(playlist_id, track_id)
+    return playlist_id, track_ids
+
+
+def test_get_playlist_track_count_returns_membership_size(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = PlaylistController(Repository(db_handler))
+    playlist_id, _ = _create_playlist_with_tracks(db_handler, controller, 5)
+
+    assert controller.get_playlist_track_count(playlist_id) == 5
+    assert controller.get_playlist_track_count(999) == 0
+    db_handler.close()
+
+
+def test_get_playlist_page_walks_playlist_by_position(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = PlaylistController(Repository(db_handler))
+    playlist_id, track_ids = _create_playlist_with_tracks(db_handler, controller, 5)
+
+    first_page = controller.get_playlist_page(playlist_id, limit=2)
+    second_page = controller.get_playlist_page(playlist_id, after_position=first_page.data[-1]["position"], limit=2)
+    last_page = controller.get_playlist_page(playlist_id, after_position=3, limit=2)
+
+    assert first_page.status is True
+    assert first_page.message is SuccessMessage.PLAYLIST_PAGE_FETCHED
+    assert [row["track_id"] for row in first_page.data] == track_ids[:2]
+    assert first_page.data[0] == {
+        "position": 0,
+        "track_id": track_ids[0],
+        "path": "/music/paged_0.mp3",
+        "title": "Title",
+        "artist": "Artist",
+        "album": "Album",
+        "duration_ms": 180_000,
+    }
+    assert [row["track_id"] for row in second_page.data] == track_ids[2:4]
+    assert [row["track_id"] for row in last_page.data] == track_ids[4:]
+    db_handler.close()
+
+
+def test_get_playlist_window_returns_slice_around_index(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = PlaylistController(Repository(db_handler))
+    playlist_id, track_ids = _create_playlist_with_tracks(db_handler, controller, 10)
+
+    middle = controller.get_playlist_window(playlist_id, index=5, radius=2)
+    start = controller.get_playlist_window(playlist_id, index=0, radius=2)
+
+    assert middle.status is True
+    assert [row["position"] for row in middle.data] == [3, 4, 5, 6, 7]
+    assert [row["track_id"] for row in start.data] == track_ids[:3]
+    db_handler.close()
+
+
+def test_get_playlist_page_rejects_invalid_page_size(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = PlaylistController(Repository(db_handler))
+    playlist_id, _ = _create_playlist_with_tracks(db_handler, controller, 1)
+
+    response = controller.get_playlist_page(playlist_id, limit=0)
+    missing = controller.get_playlist_window(999, index=0)
+
+    assert response.status is False
+    assert response.message is ErrorMessage.INVALID_PLAYLIST_PAGE
+    assert missing.message is ErrorMessage.PLAYLIST_NOT_FOUND
+    db_handler.close()
+
+
+def test_get_track_position_uses_playlist_membership(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = PlaylistController(Repository(db_handler))
+    playlist_id, track_ids = _create_playlist_with_tracks(db_handler, controller, 3)
+
+    assert controller.get_track_position(playlist_id, track_ids[2]) == 2
+    assert controller.get_track_position(playlist_id, 999) is None
+    db_handler.close()
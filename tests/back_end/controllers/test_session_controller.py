@@ -0,0 +1,163 @@
+import time
+
+from app.back_end.controllers.session_controller import SessionController, SessionState
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.utils.error_messages import ErrorMessage
+from app.back_end.utils.success_messages import SuccessMessage
+
+
+def _controller(tmp_path) -> tuple[DatabaseHandler, SessionController]:
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    return db_handler, SessionController(Repository(db_handler))
+
+
+def test_restore_without_snapshot_returns_empty_session(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+
+    response = controller.restore()
+
+    assert response.status is True
+    assert response.message is SuccessMessage.SESSION_RESTORED
+    assert response.data == SessionState()
+    db_handler.close()
+
+
+def test_snapshot_round_trips_session_state(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+    state = SessionState(
+        track_paths=["/music/a.mp3", "/music/b.mp3", "/music/c.mp3"],
+        queue_order=[2, 0, 1],
+        current_index=1,
+        position_ms=61_500,
+        repeat_mode="repeat_all",
+        shuffle_enabled=True,
+    )
+
+    save_response = controller.save_snapshot(state)
+    restored = controller.restore()
+
+    assert save_response.status is True
+    assert save_response.message is SuccessMessage.SESSION_SAVED
+    assert restored.data == state
+    db_handler.close()
+
+
+def test_journal_edits_are_replayed_on_top_of_snapshot(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+    controller.save_snapshot(SessionState(track_paths=["/music/a.mp3"], queue_order=[0], shuffle_enabled=True))
+
+    controller.append_journal("enqueue", {"paths": ["/music/b.mp3", "/music/c.mp3"]})
+    controller.append_journal("repeat_mode", {"mode": "repeat_one"})
+    controller.record_playback_cursor(2, 12_000)
+    restored = controller.restore().data
+
+    assert restored.track_paths == ["/music/a.mp3", "/music/b.mp3", "/music/c.mp3"]
+    assert restored.queue_order == [0, 1, 2]
+    assert restored.repeat_mode == "repeat_one"
+    assert restored.current_index == 2
+    assert restored.position_ms == 12_000
+    db_handler.close()
+
+
+def test_journaled_move_reorders_paths_and_follows_queue_order(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+    paths = ["/music/a.mp3", "/music/b.mp3", "/music/c.mp3", "/music/d.mp3"]
+    controller.save_snapshot(SessionState(track_paths=paths, queue_order=[3, 1, 0, 2], shuffle_enabled=True))
+
+    response = controller.append_journal("move", {"paths": ["/music/a.mp3", "/music/b.mp3"], "position": 2})
+    restored = controller.restore().data
+
+    assert response.status is True
+    assert restored.track_paths == ["/music/c.mp3", "/music/d.mp3", "/music/a.mp3", "/music/b.mp3"]
+    assert [restored.track_paths[index] for index in restored.queue_order] == [
+        "/music/d.mp3",
+        "/music/b.mp3",
+        "/music/a.mp3",
+        "/music/c.mp3",
+    ]
+    db_handler.close()
+
+
+def test_journal_is_compacted_into_snapshot(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+
+    for index in range(SessionController.MAX_JOURNAL_ENTRIES + 1):
+        controller.append_journal("enqueue", {"paths": [f"/music/{index}.mp3"]})
+
+    journal_size = db_handler.connect().execute("SELECT COUNT(*) FROM session_journal").fetchone()[0]
+    assert journal_size == 0
+    assert len(controller.restore().data.track_paths) == SessionController.MAX_JOURNAL_ENTRIES + 1
+    db_handler.close()
+
+
+def test_unknown_journal_operation_is_rejected(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+
+    response = controller.append_journal("teleport", {})
+
+    assert response.status is False
+    assert response.message is ErrorMessage.INVALID_SESSION_OPERATION
+    db_handler.close()
+
+
+def test_malformed_journal_row_fails_restore_instead_of_raising(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+    controller.save_snapshot(SessionState(track_paths=["/music/a.mp3"]))
+    connection = db_handler.connect()
+    connection.execute("INSERT INTO session_journal (operation, payload) VALUES ('enqueue', '{\"files\": []}')")
+    connection.commit()
+
+    response = controller.restore()
+
+    assert response.status is False
+    assert response.message is ErrorMessage.SESSION_RESTORE_FAILED
+    db_handler.close()
+
+
+def test_session_with_a_track_queued_twice_fails_restore(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+    controller.save_snapshot(SessionState(track_paths=["/music/a.mp3"]))
+    controller.append_journal("enqueue", {"paths": ["/music/b.mp3", "/music/a.mp3"]})
+
+    response = controller.restore()
+
+    assert response.status is False
+    assert response.message is ErrorMessage.SESSION_RESTORE_FAILED
+    db_handler.close()
+
+
+def test_queue_order_that_is_not_a_permutation_is_dropped(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+    controller.save_snapshot(
+        SessionState(track_paths=["/music/a.mp3", "/music/b.mp3"], queue_order=[0, 7], shuffle_enabled=True)
+    )
+    controller.append_journal("shuffle", {"enabled": True, "order": [1, "0"]})
+
+    restored = controller.restore()
+
+    assert restored.status is True
+    assert restored.data.track_paths == ["/music/a.mp3", "/music/b.mp3"]
+    assert restored.data.queue_order is None
+    db_handler.close()
+
+
+def test_restoring_large_session_is_fast(tmp_path):
+    db_handler, controller = _controller(tmp_path)
+    track_paths = [f"/music/library/artist_{index // 100}/album_{index // 10}/track_{index}.flac" for index in range(50_000)]
+    controller.save_snapshot(
+        SessionState(track_paths=track_paths, queue_order=list(range(50_000)), current_index=25_000, position_ms=90_000)
+    )
+    controller.append_journal("enqueue", {"paths": ["/music/extra.flac"]})
+    db_handler.close()
+
+    db_handler, controller = _controller(tmp_path)
+    started = time.perf_counter()
+    restored = controller.restore().data
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    assert len(restored.track_paths) == 50_001
+    assert restored.current_index == 25_000
+    assert elapsed_ms < 200
+    db_handler.close()
@@ -38,3 +38,30 @@ def test_env_db_path_override_takes_precedence(monkeypatch, tmp_path):
     monkeypatch.setenv("MUSIC_PLAYER_DB_PATH", str(expected_path))
     db = DatabaseHandler()
     assert db.db_path == expected_path
+
+
+def test_session_tables_exist(tmp_path):
+    db = DatabaseHandler(db_path=tmp_path / "app.db")
+    db.initialize_schema()
+    assert db.table_exists("session_snapshot")
+    assert db.table_exists("session_journal")
+    db.close()
+
+
+def test_schema_adds_file_columns_to_older_tracks_tables(tmp_path):
+    db = DatabaseHandler(db_path=tmp_path / "app.db")
+    connection = db.connect()
+    connection.execute(
+        "CREATE TABLE tracks (id INTEGER PRIMARY KEY AUTOINCREMENT, path TEXT NOT NULL UNIQUE, title TEXT, "
+        "artist TEXT, album TEXT, duration_ms INTEGER, artwork_hash TEXT)"
+    )
+    connection.execute("INSERT INTO tracks (path, title) VALUES ('/music/a.mp3', 'A')")
+    connection.commit()
+
+    db.initialize_schema()
+    db.initialize_schema()
+
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(tracks)")]
+    assert columns[-3:] == ["file_size", "file_mtime_ns", "file_inode"]
+    assert connection.execute("SELECT path, title, file_size FROM tracks").fetchall() == [("/music/a.mp3", "A", None)]
+    db.close()
@@ -0,0 +1,78 @@
+from app.back_end.services.lazy_shuffle import LazyShuffle
+from app.back_end.services.queue_engine import IndexedQueue
+
+
+def _play_through(shuffle: LazyShuffle, first_track_id: str) -> list[str]:
+    played = [first_track_id]
+    while True:
+        track_id = shuffle.next_track(played[-1])
+        if track_id is None:
+            return played
+        played.append(track_id)
+
+
+def test_lazy_shuffle_visits_every_track_exactly_once():
+    track_ids = [f"t{index}" for index in range(50)]
+    shuffle = LazyShuffle(IndexedQueue(track_ids), seed=5)
+
+    played = _play_through(shuffle, "t0")
+
+    assert sorted(played) == sorted(track_ids)
+    assert played != track_ids
+
+
+def test_lazy_shuffle_is_reproducible_from_seed():
+    track_ids = [f"t{index}" for index in range(50)]
+
+    first = _play_through(LazyShuffle(IndexedQueue(track_ids), seed=42), "t10")
+    second = _play_through(LazyShuffle(IndexedQueue(track_ids), seed=42), "t10")
+
+    assert first == second
+
+
+def test_previous_walks_back_through_history_and_next_replays_it():
+    shuffle = LazyShuffle(IndexedQueue([f"t{index}" for index in range(20)]), seed=1)
+    first = shuffle.next_track("t0")
+    second = shuffle.next_track(first)
+
+    assert shuffle.previous_track(second) == first
+    assert shuffle.previous_track(first) == "t0"
+    assert shuffle.previous_track("t0") is None
+    assert shuffle.next_track("t0") == first
+    assert shuffle.next_track(first) == second
+
+
+def test_history_is_bounded():
+    shuffle = LazyShuffle(IndexedQueue([f"t{index}" for index in range(100)]), seed=3, history_limit=5)
+    current = "t0"
+    for _ in range(30):
+        current = shuffle.next_track(current)
+
+    steps_back = 0
+    while (current := shuffle.previous_track(current)) is not None:
+        steps_back += 1
+
+    assert steps_back == 4
+
+
+def test_tracks_appended_after_enabling_join_the_pool_and_removed_ones_are_skipped():
+    queue = IndexedQueue(["t0", "t1", "t2"])
+    shuffle = LazyShuffle(queue, seed=9)
+    queue.append("t3")
+    queue.remove("t2")
+
+    played = _play_through(shuffle, "t0")
+
+    assert sorted(played) == ["t0", "t1", "t3"]
+
+
+def test_push_next_takes_priority_over_random_draws():
+    queue = IndexedQueue([f"t{index}" for index in range(10)])
+    shuffle = LazyShuffle(queue, seed=2)
+
+    shuffle.push_next("t7")
+    played = _play_through(shuffle, "t0")
+
+    assert played[1] == "t7"
+    assert played.count("t7") == 1
+    assert len(played) == 10
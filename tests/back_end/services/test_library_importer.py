@@ -0,0 +1,157 @@
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.services import python_backend, rust_bridge
+from app.back_end.services.library_importer import LibraryImporter
+from app.back_end.services.rust_bridge import create_cancel_flag
+from app.back_end.utils.class_method_response_models import ErrorResponse, SuccessResponse
+from app.back_end.utils.error_messages import ErrorMessage
+from app.back_end.utils.success_messages import SuccessMessage
+
+
+def _scanner(paths):
+    def scan(folders):
+        return SuccessResponse[dict[str, str]](
+            message=SuccessMessage.LIBRARY_SCAN_COMPLETED,
+            data=[{"path": path} for path in paths],
+        )
+
+    return scan
+
+
+def _read_metadata(path):
+    if path.endswith("broken.mp3"):
+        return ErrorResponse(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
+    return SuccessResponse[dict[str, str]](
+        message=SuccessMessage.METADATA_READ_COMPLETED,
+        data={"title": f"Title {path[-6:-4]}", "artist": "Artist", "album": "Album", "duration_ms": "1000"},
+    )
+
+
+def _database(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    db_handler.close()
+    return db_handler
+
+
+def test_import_streams_batches_and_skips_known_and_duplicate_paths(tmp_path):
+    db_handler = _database(tmp_path)
+    scanned = [f"/music/{index:02d}.mp3" for index in range(10)] + ["/music/03.mp3", "/music/broken.mp3"]
+    importer = LibraryImporter(
+        db_handler.db_path,
+        scanner=_scanner(scanned),
+        metadata_reader=_read_metadata,
+        batch_size=4,
+    )
+    batches = []
+    progress = []
+
+    response = importer.run(
+        ["/music"],
+        known_paths={"/music/00.mp3"},
+        on_batch=batches.append,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert response.status is True
+    assert response.data == {"scanned": 12, "imported": 10}
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert "/music/00.mp3" not in sum(batches, [])
+    assert progress[0] == (0, 12) and progress[-1] == (12, 12)
+
+    rows = db_handler.connect().execute("SELECT path, title FROM tracks ORDER BY path").fetchall()
+    assert len(rows) == 10
+    assert ("/music/broken.mp3", "broken") in rows
+    db_handler.close()
+
+
+def test_import_counts_only_tracks_the_database_did_not_have(tmp_path):
+    db_handler = _database(tmp_path)
+    connection = db_handler.connect()
+    connection.execute("INSERT INTO tracks (path, title) VALUES ('/music/01.mp3', 'Stored')")
+    connection.commit()
+    importer = LibraryImporter(
+        db_handler.db_path,
+        scanner=_scanner([f"/music/{index:02d}.mp3" for index in range(5)]),
+        metadata_reader=_read_metadata,
+        batch_size=2,
+    )
+
+    response = importer.run(["/music"])
+
+    assert response.data == {"scanned": 5, "imported": 4}
+    assert connection.execute("SELECT title FROM tracks WHERE path = '/music/01.mp3'").fetchone() == ("Stored",)
+    db_handler.close()
+
+
+def test_cancelled_import_stops_between_batches(tmp_path):
+    db_handler = _database(tmp_path)
+    importer = LibraryImporter(
+        db_handler.db_path,
+        scanner=_scanner([f"/music/{index:02d}.mp3" for index in range(20)]),
+        metadata_reader=_read_metadata,
+        batch_size=5,
+    )
+    cancel_flag = create_cancel_flag()
+    batches = []
+
+    def on_batch(batch):
+        batches.append(batch)
+        cancel_flag.cancel()
+
+    response = importer.run(["/music"], on_batch=on_batch, cancel_flag=cancel_flag)
+
+    assert response.status is False
+    assert response.message is ErrorMessage.LIBRARY_IMPORT_CANCELLED
+    assert len(batches) == 1
+    db_handler.close()
+
+
+def test_default_import_ingests_each_batch_in_one_call(tmp_path, monkeypatch):
+    db_handler = _database(tmp_path)
+    music = tmp_path / "music"
+    music.mkdir()
+    for index in range(5):
+        (music / f"{index:02d}.flac").write_bytes(b"x" * index)
+    (music / "cover.jpg").write_bytes(b"cover")
+    python_backend.write_metadata(str(music / "00.flac"), {"title": "First", "duration_ms": "1500"})
+
+    calls = []
+
+    def ingest(paths, cancel_flag=None):
+        calls.append(list(paths))
+        return rust_bridge.ingest(paths, cancel_flag=cancel_flag)
+
+    monkeypatch.setattr(rust_bridge, "_backend", python_backend)
+    importer = LibraryImporter(db_handler.db_path, batch_size=2, ingester=ingest)
+
+    response = importer.run([str(music)])
+
+    assert response.data == {"scanned": 5, "imported": 5}
+    assert [len(paths) for paths in calls] == [2, 2, 1]
+    rows = db_handler.connect().execute(
+        "SELECT title, duration_ms, file_size, file_inode IS NOT NULL, artwork_hash FROM tracks ORDER BY path"
+    ).fetchall()
+    assert rows[0] == ("First", 1500, 0, 1, python_backend.artwork_hash(b"cover"))
+    assert [row[2] for row in rows] == [0, 1, 2, 3, 4]
+    db_handler.close()
+
+
+def test_import_cancelled_during_a_batch_read_stores_nothing_from_it(tmp_path):
+    db_handler = _database(tmp_path)
+    cancel_flag = create_cancel_flag()
+
+    def ingest(paths, cancel_flag=None):
+        cancel_flag.cancel()
+        return ErrorResponse(message=ErrorMessage.RUST_BACKEND_OPERATION_CANCELLED)
+
+    importer = LibraryImporter(
+        db_handler.db_path,
+        scanner=_scanner([f"/music/{index:02d}.mp3" for index in range(4)]),
+        ingester=ingest,
+    )
+
+    response = importer.run(["/music"], cancel_flag=cancel_flag)
+
+    assert response.message is ErrorMessage.LIBRARY_IMPORT_CANCELLED
+    assert db_handler.connect().execute("SELECT COUNT(*) FROM tracks").fetchone() == (0,)
+    db_handler.close()
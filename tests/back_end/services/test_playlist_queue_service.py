@@ -0,0 +1,98 @@
+from app.back_end.controllers.playlist_controller import PlaylistController
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.services.playlist_queue_service import PlaylistQueueService
+from app.back_end.utils.error_messages import ErrorMessage
+from app.back_end.utils.success_messages import SuccessMessage
+
+
+class _CountingRepository(Repository):
+    def __init__(self, db_handler: DatabaseHandler) -> None:
+        super().__init__(db_handler)
+        self.fetch_all_calls = 0
+
+    def fetch_all(self, query, params=()):
+        self.fetch_all_calls += 1
+        return super().fetch_all(query, params)
+
+
+def _build_playlist(tmp_path, track_count: int):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    repository = _CountingRepository(db_handler)
+    controller = PlaylistController(repository)
+    playlist_id = controller.create_playlist("Huge").data["playlist_id"]
+
+    connection = db_handler.connect()
+    connection.executemany(
+        "INSERT INTO tracks (id, path, title) VALUES (?, ?, ?)",
+        [(index + 1, f"/music/{index}.mp3", f"Track {index}") for index in range(track_count)],
+    )
+    connection.executemany(
+        "INSERT INTO playlist_tracks (playlist_id, track_id, position) VALUES (?, ?, ?)",
+        [(playlist_id, index + 1, index) for index in range(track_count)],
+    )
+    connection.commit()
+    return db_handler, repository, controller, playlist_id
+
+
+def test_next_and_previous_follow_playlist_positions(tmp_path):
+    db_handler, _, controller, playlist_id = _build_playlist(tmp_path, 10)
+    service = PlaylistQueueService(controller, playlist_id, window_radius=2)
+
+    next_response = service.next_track("5")
+    previous_response = service.previous_track("5")
+
+    assert next_response.status is True
+    assert next_response.message is SuccessMessage.QUEUE_TRACK_RESOLVED
+    assert next_response.data == {"track_id": "6"}
+    assert previous_response.data == {"track_id": "4"}
+    assert service.next_track("10").data == {"track_id": None}
+    db_handler.close()
+
+
+def test_walking_the_playlist_pages_in_windows(tmp_path):
+    db_handler, repository, controller, playlist_id = _build_playlist(tmp_path, 1_000)
+    service = PlaylistQueueService(controller, playlist_id, window_radius=50)
+
+    current = "1"
+    visited = 1
+    while (current := service.next_track(current).data["track_id"]) is not None:
+        visited += 1
+
+    assert visited == 1_000
+    assert repository.fetch_all_calls <= 1_000 // 50
+    db_handler.close()
+
+
+def test_repeat_all_wraps_without_loading_the_playlist(tmp_path):
+    db_handler, _, controller, playlist_id = _build_playlist(tmp_path, 500)
+    service = PlaylistQueueService(controller, playlist_id)
+    service.set_repeat_mode("repeat_all")
+
+    assert service.next_track("500").data == {"track_id": "1"}
+    assert service.previous_track("1").data == {"track_id": "500"}
+    db_handler.close()
+
+
+def test_lazy_shuffle_draws_each_playlist_track_once(tmp_path):
+    db_handler, _, controller, playlist_id = _build_playlist(tmp_path, 40)
+    service = PlaylistQueueService(controller, playlist_id, window_radius=4)
+    service.set_shuffle(True, seed=12)
+
+    played = ["1"]
+    while (next_id := service.next_track(played[-1]).data["track_id"]) is not None:
+        played.append(next_id)
+
+    assert sorted(played, key=int) == [str(index) for index in range(1, 41)]
+    db_handler.close()
+
+
+def test_unknown_track_and_materializing_shuffle_are_rejected(tmp_path):
+    db_handler, _, controller, playlist_id = _build_playlist(tmp_path, 3)
+    service = PlaylistQueueService(controller, playlist_id)
+
+    assert service.next_track("999").message is ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE
+    assert service.next_track("not-a-number").message is ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE
+    assert service.set_shuffle(True, mode="full").message is ErrorMessage.INVALID_SHUFFLE_MODE
+    db_handler.close()
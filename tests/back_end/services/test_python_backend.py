@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+from app.back_end.services import python_backend
+
+
+def _touch(path, content=b""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def test_scan_library_finds_audio_files_recursively(tmp_path):
+    _touch(tmp_path / "a" / "one.MP3")
+    _touch(tmp_path / "a" / "b" / "two.flac")
+    _touch(tmp_path / "a" / "notes.txt")
+    loose = _touch(tmp_path / "loose.ogg")
+    os.symlink(tmp_path / "a", tmp_path / "a" / "b" / "loop")
+
+    found = python_backend.scan_library([str(tmp_path / "a"), str(loose), str(tmp_path / "missing")])
+
+    # The link back to an ancestor is not followed, as with walkdir.
+    assert found == [str(tmp_path / "a" / "b" / "two.flac"), str(tmp_path / "a" / "one.MP3"), str(loose)]
+    with pytest.raises(RuntimeError):
+        python_backend.scan_library([])
+
+
+def test_metadata_round_trips_through_the_sidecar(tmp_path):
+    track = _touch(tmp_path / "Song Name.mp3")
+
+    assert python_backend.read_metadata(str(track)) == {
+        "path": str(track),
+        "title": "Song Name",
+        "artist": "",
+        "album": "",
+        "duration_ms": "0",
+    }
+
+    assert python_backend.write_metadata(str(track), {"title": "Renamed", "artist": "Band"}) == ["artist", "title"]
+    assert python_backend.write_metadata(str(track), {"artist": " "}) == ["artist"]
+
+    metadata = python_backend.read_metadata(str(track))
+    assert (metadata["title"], metadata["artist"]) == ("Renamed", "")
+    assert json.loads((tmp_path / "Song Name.mp3.musicmeta.json").read_text()) == {"title": "Renamed"}
+    with pytest.raises(RuntimeError):
+        python_backend.write_metadata(str(track), {})
+    with pytest.raises(RuntimeError):
+        python_backend.read_metadata(str(tmp_path / "missing.mp3"))
+
+
+def test_extract_artwork_prefers_explicit_then_track_then_folder_cover(tmp_path):
+    track = _touch(tmp_path / "album" / "01.flac")
+    assert python_backend.extract_artwork(str(track)) is None
+
+    _touch(tmp_path / "album" / "cover.png", b"folder")
+    assert python_backend.extract_artwork(str(track)) == b"folder"
+
+    _touch(tmp_path / "album" / "01.jpg", b"track")
+    assert python_backend.extract_artwork(str(track)) == b"track"
+
+    explicit = _touch(tmp_path / "art" / "front.jpg", b"explicit")
+    python_backend.write_metadata(str(track), {"artwork_path": str(explicit)})
+    assert python_backend.extract_artwork(str(track)) == b"explicit"
+
+
+def test_cancelled_flag_stops_reads(tmp_path):
+    track = _touch(tmp_path / "01.flac")
+    cancel_flag = python_backend.CancelFlag()
+    cancel_flag.cancel()
+
+    with pytest.raises(RuntimeError, match="cancelled"):
+        python_backend.read_metadata(str(track), cancel_flag)
+    with pytest.raises(RuntimeError, match="cancelled"):
+        python_backend.extract_artwork(str(track), cancel_flag)
+    with pytest.raises(RuntimeError, match="cancelled"):
+        python_backend.ingest([str(track)], cancel_flag)
+
+
+def test_ingest_returns_one_column_per_tracks_field(tmp_path):
+    tagged = _touch(tmp_path / "album" / "01.flac", b"audio")
+    untagged = _touch(tmp_path / "album" / "02.flac")
+    _touch(tmp_path / "album" / "cover.jpg", b"cover")
+    python_backend.write_metadata(str(tagged), {"title": "One", "artist": "A", "album": "B", "duration_ms": "900"})
+    missing = str(tmp_path / "album" / "03.flac")
+
+    columns = python_backend.ingest([str(tagged), str(untagged), missing])
+
+    assert tuple(columns) == python_backend.INGEST_COLUMNS
+    assert columns["path"] == [str(tagged), str(untagged), missing]
+    assert columns["title"] == ["One", "02", "03"]
+    assert columns["artist"] == ["A", "", ""]
+    assert columns["duration_ms"] == [900, 0, 0]
+    assert columns["file_size"] == [5, 0, None]
+    assert columns["file_mtime_ns"][0] == os.stat(tagged).st_mtime_ns
+    assert columns["file_inode"][1] == os.stat(untagged).st_ino
+    # CRC-32 (as zlib computes it) and the byte count of the shared cover.
+    assert columns["artwork_hash"] == ["8d0886c5-5", "8d0886c5-5", None]
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from app.back_end.services.queue_engine import IndexedQueue
+
+
+def test_queue_preserves_initial_order_and_neighbors():
+    queue = IndexedQueue(["t1", "t2", "t3"])
+
+    assert list(queue) == ["t1", "t2", "t3"]
+    assert queue.next_of("t1") == "t2"
+    assert queue.previous_of("t1") is None
+    assert queue.next_of("t3") is None
+    assert queue.position_of("t3") == 2
+    assert queue.track_at(1) == "t2"
+
+
+def test_insert_remove_and_move_keep_positions_consistent():
+    queue = IndexedQueue(["t1", "t2", "t3"])
+
+    queue.insert_after("t1", "t4")
+    queue.append("t5")
+    queue.remove("t2")
+    queue.move("t5", 0)
+
+    assert list(queue) == ["t5", "t1", "t4", "t3"]
+    assert [queue.position_of(track_id) for track_id in ["t5", "t1", "t4", "t3"]] == [0, 1, 2, 3]
+    assert queue.first() == "t5"
+    assert queue.last() == "t3"
+    assert "t2" not in queue
+
+
+def test_duplicate_track_ids_are_rejected():
+    queue = IndexedQueue(["t1"])
+
+    with pytest.raises(ValueError):
+        queue.append("t1")
+    with pytest.raises(ValueError):
+        IndexedQueue(["t1", "t1"])
+
+
+def test_removals_compact_sequences_once_tombstones_outnumber_tracks():
+    track_ids = [f"t{index}" for index in range(3_000)]
+    queue = IndexedQueue(track_ids)
+
+    renumbered = [queue.remove(track_id) for track_id in track_ids[:2_000]]
+
+    compactions = [mapping for mapping in renumbered if mapping is not None]
+    assert len(compactions) == 1
+    assert queue.sequence_bound() < 2 * len(queue)
+    assert list(queue) == track_ids[2_000:]
+    sequences = [queue.sequence_of(track_id) for track_id in queue]
+    assert sequences == sorted(sequences)
+    assert [queue.track_for_sequence(sequence) for sequence in sequences] == list(queue)
+
+
+def test_random_edits_match_list_model():
+    rng = random.Random(3)
+    expected = [f"t{index}" for index in range(200)]
+    queue = IndexedQueue(expected, seed=11)
+    next_id = len(expected)
+
+    for _ in range(2_000):
+        operation = rng.choice(["insert", "remove", "move"])
+        if operation == "insert" or not expected:
+            index = rng.randint(0, len(expected))
+            track_id = f"t{next_id}"
+            next_id += 1
+            expected.insert(index, track_id)
+            queue.insert(index, track_id)
+        elif operation == "remove":
+            track_id = rng.choice(expected)
+            expected.remove(track_id)
+            queue.remove(track_id)
+        else:
+            track_id = rng.choice(expected)
+            index = rng.randrange(len(expected))
+            expected.remove(track_id)
+            expected.insert(index, track_id)
+            queue.move(track_id, index)
+
+    assert list(queue) == expected
+    assert len(queue) == len(expected)
+    for index in rng.sample(range(len(expected)), 50):
+        assert queue.track_at(index) == expected[index]
+        assert queue.position_of(expected[index]) == index
@@ -1,3 +1,5 @@
+import pytest
+
 from app.back_end.services.queue_service import QueueService
 from app.back_end.utils.error_messages import ErrorMessage
 from app.back_end.utils.success_messages import SuccessMessage
@@ -13,6 +15,11 @@ def test_next_track_in_normal_mode_returns_next_track():
     assert response.data == {"track_id": "t2"}
 
 
+def test_duplicate_track_ids_are_rejected():
+    with pytest.raises(ValueError):
+        QueueService(track_ids=["t1", "t2", "t1"])
+
+
 def test_previous_track_in_normal_mode_returns_previous_track():
     service = QueueService(track_ids=["t1", "t2", "t3"])
 
@@ -95,3 +102,195 @@ def test_unknown_track_returns_error():
     assert response.status is False
     assert response.message is ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE
     assert response.data is None
+
+
+def test_enqueue_appends_tracks_to_queue():
+    service = QueueService(track_ids=["t1", "t2"])
+
+    response = service.enqueue(["t3", "t4"])
+
+    assert response.status is True
+    assert response.message is SuccessMessage.QUEUE_UPDATED
+    assert response.data == {"queue_length": 4}
+    assert service.next_track("t2").data == {"track_id": "t3"}
+
+
+def test_enqueue_rejects_tracks_already_in_queue():
+    service = QueueService(track_ids=["t1", "t2"])
+
+    response = service.enqueue(["t2"])
+
+    assert response.status is False
+    assert response.message is ErrorMessage.TRACK_ALREADY_IN_QUEUE
+
+
+def test_play_next_moves_track_after_current():
+    service = QueueService(track_ids=["t1", "t2", "t3", "t4"])
+
+    response = service.play_next("t4", current_track_id="t1")
+
+    assert response.status is True
+    assert service.next_track("t1").data == {"track_id": "t4"}
+    assert service.next_track("t4").data == {"track_id": "t2"}
+
+
+def test_play_next_inserts_new_track_in_shuffled_and_original_order():
+    service = QueueService(track_ids=["t1", "t2", "t3"])
+    service.set_shuffle(True, seed=7)
+    service.play_next("t9", current_track_id="t2")
+
+    assert service.next_track("t2").data == {"track_id": "t9"}
+    service.set_shuffle(False)
+    assert service.next_track("t2").data == {"track_id": "t9"}
+    assert service.next_track("t9").data == {"track_id": "t3"}
+
+
+def test_remove_and_move_track_update_neighbors():
+    service = QueueService(track_ids=["t1", "t2", "t3", "t4"])
+
+    remove_response = service.remove_track("t2")
+    move_response = service.move_track("t4", 0)
+
+    assert remove_response.status is True
+    assert move_response.data == {"track_id": "t4", "position": 0}
+    assert service.next_track("t4").data == {"track_id": "t1"}
+    assert service.next_track("t1").data == {"track_id": "t3"}
+
+
+def test_move_track_rejects_out_of_range_position():
+    service = QueueService(track_ids=["t1", "t2"])
+
+    response = service.move_track("t1", 5)
+
+    assert response.status is False
+    assert response.message is ErrorMessage.INVALID_QUEUE_POSITION
+
+
+def test_lazy_shuffle_mode_resolves_every_track_once():
+    track_ids = [f"t{index}" for index in range(30)]
+    service = QueueService(track_ids=track_ids)
+    service.set_shuffle(True, seed=4, mode="lazy")
+
+    played = ["t0"]
+    while (next_id := service.next_track(played[-1]).data["track_id"]) is not None:
+        played.append(next_id)
+
+    assert sorted(played) == sorted(track_ids)
+    assert service.previous_track(played[-1]).data == {"track_id": played[-2]}
+
+
+def test_lazy_shuffle_keeps_its_round_when_removals_compact_the_queue():
+    track_ids = [f"t{index}" for index in range(3_000)]
+    service = QueueService(track_ids=track_ids)
+    service.set_shuffle(True, seed=8, mode="lazy")
+    played = ["t2999"]
+    for _ in range(20):
+        played.append(service.next_track(played[-1]).data["track_id"])
+
+    removed = [track_id for track_id in track_ids if track_id not in played][:2_000]
+    for track_id in removed:
+        service.remove_track(track_id)
+    while (next_id := service.next_track(played[-1]).data["track_id"]) is not None:
+        played.append(next_id)
+
+    assert sorted(played) == sorted(set(track_ids) - set(removed))
+
+
+def test_lazy_shuffle_with_repeat_all_starts_a_new_round():
+    service = QueueService(track_ids=["t1", "t2"])
+    service.set_repeat_mode("repeat_all")
+    service.set_shuffle(True, seed=4, mode="lazy")
+
+    first = service.next_track("t1").data["track_id"]
+    second = service.next_track(first).data["track_id"]
+
+    assert first == "t2"
+    assert second in {"t1", "t2"}
+
+
+def test_invalid_shuffle_mode_returns_error():
+    service = QueueService(track_ids=["t1"])
+
+    response = service.set_shuffle(True, mode="sideways")
+
+    assert response.status is False
+    assert response.message is ErrorMessage.INVALID_SHUFFLE_MODE
+
+
+def test_spread_shuffle_mode_uses_track_groups():
+    groups = {f"t{index}": (f"Artist {index % 2}", "Album") for index in range(10)}
+    service = QueueService(track_ids=list(groups), track_groups=groups)
+
+    response = service.set_shuffle(True, seed=6, mode="spread")
+
+    assert response.status is True
+    current = "t0"
+    while (previous_id := service.previous_track(current).data["track_id"]) is not None:
+        current = previous_id
+    order = [current]
+    while (current := service.next_track(current).data["track_id"]) is not None:
+        order.append(current)
+    assert sorted(order) == sorted(groups)
+    assert sum(1 for left, right in zip(order, order[1:]) if groups[left][0] == groups[right][0]) <= 2
+
+
+def test_restore_shuffled_order_replaces_active_order():
+    service = QueueService(track_ids=["t1", "t2", "t3"])
+
+    response = service.restore_shuffled_order(["t3", "t1", "t2"])
+
+    assert response.status is True
+    assert service.track_ids() == ["t3", "t1", "t2"]
+    assert service.restore_shuffled_order(["t1", "t1", "t2"]).message is ErrorMessage.INVALID_QUEUE_ORDER
+
+
+def test_upcoming_tracks_wraps_with_repeat_all_and_stops_at_current():
+    service = QueueService(track_ids=["t1", "t2", "t3"])
+    service.set_repeat_mode("repeat_all")
+
+    assert service.upcoming_tracks("t3", count=2).data == {"track_ids": ["t1", "t2"]}
+    assert service.upcoming_tracks("t1", count=5).data == {"track_ids": ["t2", "t3"]}
+
+
+def test_upcoming_tracks_in_lazy_shuffle_does_not_draw():
+    service = QueueService(track_ids=[f"t{index}" for index in range(10)])
+    service.set_shuffle(True, seed=3, mode="lazy")
+
+    assert service.upcoming_tracks("t0").data == {"track_ids": []}
+
+    service.play_next("t7", "t0")
+    assert service.upcoming_tracks("t0").data == {"track_ids": ["t7"]}
+    assert service.next_track("t0").data == {"track_id": "t7"}
+
+
+def test_move_tracks_moves_a_block_in_the_unshuffled_order():
+    service = QueueService(track_ids=["t1", "t2", "t3", "t4", "t5"])
+
+    down = service.move_tracks(["t1", "t2"], 3)
+    assert down.data == {"position": 3}
+    assert service.track_ids() == ["t3", "t4", "t5", "t1", "t2"]
+
+    service.move_tracks(["t2", "t4"], 0)
+    assert service.track_ids() == ["t2", "t4", "t3", "t5", "t1"]
+    assert service.next_track("t4").data == {"track_id": "t3"}
+
+
+def test_move_tracks_leaves_a_shuffled_order_alone():
+    service = QueueService(track_ids=["t1", "t2", "t3", "t4"])
+    service.set_shuffle(True, seed=3)
+    shuffled = service.track_ids()
+
+    service.move_tracks(["t4"], 0)
+
+    assert service.track_ids() == shuffled
+    service.set_shuffle(False)
+    assert service.track_ids() == ["t4", "t1", "t2", "t3"]
+
+
+def test_move_tracks_rejects_unknown_tracks_and_positions():
+    service = QueueService(track_ids=["t1", "t2", "t3"])
+
+    assert service.move_tracks(["t9"], 0).message is ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE
+    assert service.move_tracks(["t1", "t1"], 0).message is ErrorMessage.TRACK_NOT_FOUND_IN_QUEUE
+    assert service.move_tracks(["t1", "t2"], 2).message is ErrorMessage.INVALID_QUEUE_POSITION
+    assert service.track_ids() == ["t1", "t2", "t3"]
@@ -2,7 +2,9 @@ import importlib
 
 import pytest
 
+from app.back_end.services import python_backend, rust_bridge
 from app.back_end.services.rust_bridge import get_rust_backend_version
+from app.back_end.utils.error_messages import ErrorMessage
 
 
 class _MockRustModule:
@@ -37,3 +39,52 @@ def test_get_rust_backend_version_raises_type_error_for_invalid_return_type(monk
 
     with pytest.raises(TypeError, match="must return a string"):
         get_rust_backend_version()
+
+
+@pytest.fixture
+def unresolved_backend(monkeypatch):
+    monkeypatch.setattr(rust_bridge, "_backend", None)
+    monkeypatch.delenv(rust_bridge.BACKEND_ENV_VAR, raising=False)
+
+
+def test_backend_is_resolved_once(monkeypatch, unresolved_backend):
+    imports = []
+
+    def _import(name: str):
+        imports.append(name)
+        raise ModuleNotFoundError(name)
+
+    monkeypatch.setattr(importlib, "import_module", _import)
+
+    rust_bridge.create_cancel_flag()
+    rust_bridge.create_cancel_flag()
+
+    assert imports == ["rust_back_end_native"]
+    assert rust_bridge._load_backend() is python_backend
+
+
+def test_python_fallback_serves_bridge_calls(tmp_path, monkeypatch, unresolved_backend):
+    monkeypatch.setattr(importlib, "import_module", lambda _: (_ for _ in ()).throw(ModuleNotFoundError()))
+    track = tmp_path / "Track.mp3"
+    track.write_bytes(b"")
+
+    assert rust_bridge.write_metadata(str(track), {"artist": "Band"}).status is True
+    response = rust_bridge.read_metadata(str(track), rust_bridge.create_cancel_flag())
+
+    assert response.status is True
+    assert response.data["artist"] == "Band"
+    assert rust_bridge.scan_library([str(tmp_path)]).data == [{"path": str(track)}]
+
+
+def test_backend_env_var_selects_or_requires_a_backend(monkeypatch, unresolved_backend):
+    monkeypatch.setattr(importlib, "import_module", lambda _: _MockRustModule())
+    monkeypatch.setenv(rust_bridge.BACKEND_ENV_VAR, "python")
+    assert rust_bridge._load_backend() is python_backend
+
+    rust_bridge.use_backend(None)
+    monkeypatch.setattr(importlib, "import_module", lambda _: (_ for _ in ()).throw(ModuleNotFoundError()))
+    monkeypatch.setenv(rust_bridge.BACKEND_ENV_VAR, "native")
+    response = rust_bridge.scan_library(["/music"])
+
+    assert response.status is False
+    assert response.message is ErrorMessage.RUST_BACKEND_OPERATION_FAILED
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 import pytest
 
 from app.back_end.services import rust_bridge
@@ -34,6 +37,13 @@ class _FakeRustModule:
         assert path == "/music/a.mp3"
         return b"artwork-bytes"
 
+    @staticmethod
+    def ingest(paths: list[str]) -> dict[str, list]:
+        columns = {name: [None] * len(paths) for name in rust_bridge.INGEST_COLUMNS}
+        columns.update(path=paths, title=["Song A", "b"], artist=["Artist A", ""], album=["", ""], duration_ms=[1, 0])
+        columns["file_size"] = [10, None]
+        return columns
+
 
 class _BrokenRustModule:
     @staticmethod
@@ -43,7 +53,7 @@ class _BrokenRustModule:
 
 
 def test_scan_library_returns_success_response(monkeypatch):
-    monkeypatch.setattr(rust_bridge, "_load_rust_backend_module", lambda: _FakeRustModule())
+    monkeypatch.setattr(rust_bridge, "_backend", _FakeRustModule())
 
     response = rust_bridge.scan_library(["/music"])
 
@@ -63,7 +73,7 @@ def test_scan_library_returns_error_for_invalid_paths_payload():
 
 
 def test_read_metadata_returns_success_response(monkeypatch):
-    monkeypatch.setattr(rust_bridge, "_load_rust_backend_module", lambda: _FakeRustModule())
+    monkeypatch.setattr(rust_bridge, "_backend", _FakeRustModule())
 
     response = rust_bridge.read_metadata("/music/a.mp3")
 
@@ -74,7 +84,7 @@ def test_read_metadata_returns_success_response(monkeypatch):
 
 
 def test_write_metadata_returns_success_response(monkeypatch):
-    monkeypatch.setattr(rust_bridge, "_load_rust_backend_module", lambda: _FakeRustModule())
+    monkeypatch.setattr(rust_bridge, "_backend", _FakeRustModule())
 
     response = rust_bridge.write_metadata("/music/a.mp3", {"title": "Updated", "track_number": 2})
 
@@ -86,7 +96,7 @@ def test_write_metadata_returns_success_response(monkeypatch):
 
 
 def test_extract_artwork_returns_success_response(monkeypatch):
-    monkeypatch.setattr(rust_bridge, "_load_rust_backend_module", lambda: _FakeRustModule())
+    monkeypatch.setattr(rust_bridge, "_backend", _FakeRustModule())
 
     response = rust_bridge.extract_artwork("/music/a.mp3")
 
@@ -96,11 +106,177 @@ def test_extract_artwork_returns_success_response(monkeypatch):
 
 
 
+def test_ingest_returns_one_column_list_per_tracks_field(monkeypatch):
+    monkeypatch.setattr(rust_bridge, "_backend", _FakeRustModule())
+
+    response = rust_bridge.ingest(["/music/a.mp3", "/music/b.flac"])
+
+    assert response.status is True
+    assert response.message is SuccessMessage.LIBRARY_INGEST_COMPLETED
+    assert tuple(response.data) == rust_bridge.INGEST_COLUMNS
+    assert response.data["title"] == ["Song A", "b"]
+    assert response.data["file_size"] == [10, None]
+
+
+def test_ingest_rejects_empty_paths_and_ragged_columns(monkeypatch):
+    monkeypatch.setattr(rust_bridge, "_backend", _FakeRustModule())
+
+    assert rust_bridge.ingest([]).message is ErrorMessage.INVALID_INGEST_PATHS
+    assert rust_bridge.ingest(["/music/a.mp3", ""]).message is ErrorMessage.INVALID_INGEST_PATHS
+    # Three paths, but the backend answered with two rows.
+    ragged = rust_bridge.ingest(["/music/a.mp3", "/music/b.flac", "/music/c.ogg"])
+    assert ragged.status is False
+    assert ragged.message is ErrorMessage.RUST_BACKEND_OPERATION_FAILED
+
+
 def test_scan_library_returns_operation_error_when_rust_raises(monkeypatch):
-    monkeypatch.setattr(rust_bridge, "_load_rust_backend_module", lambda: _BrokenRustModule())
+    monkeypatch.setattr(rust_bridge, "_backend", _BrokenRustModule())
 
     response = rust_bridge.scan_library(["/music"])
 
     assert response.status is False
     assert response.message is ErrorMessage.RUST_BACKEND_OPERATION_FAILED
     assert response.data is None
+
+
+class _CancellableRustModule:
+    class CancelFlag:
+        def __init__(self) -> None:
+            self.cancelled = False
+
+        def cancel(self) -> None:
+            self.cancelled = True
+
+        def is_cancelled(self) -> bool:
+            return self.cancelled
+
+    calls: list[tuple[str, object]] = []
+
+    @classmethod
+    def read_metadata(cls, path: str, cancel_flag=None) -> dict[str, str]:
+        cls.calls.append((path, cancel_flag))
+        return {"path": path}
+
+    @classmethod
+    def extract_artwork(cls, path: str, cancel_flag=None) -> bytes:
+        cls.calls.append((path, cancel_flag))
+        # Simulates the user skipping while the Rust side reads the cover.
+        cancel_flag.cancel()
+        raise RuntimeError("Operation cancelled.")
+
+
+def test_native_cancel_flag_is_forwarded_to_rust(monkeypatch):
+    monkeypatch.setattr(rust_bridge, "_backend", _CancellableRustModule())
+    _CancellableRustModule.calls = []
+    cancel_flag = rust_bridge.create_cancel_flag()
+
+    response = rust_bridge.read_metadata("/music/a.mp3", cancel_flag)
+
+    assert response.status is True
+    assert _CancellableRustModule.calls == [("/music/a.mp3", cancel_flag)]
+
+
+def test_cancelled_flag_short_circuits_before_calling_rust(monkeypatch):
+    monkeypatch.setattr(rust_bridge, "_backend", _CancellableRustModule())
+    _CancellableRustModule.calls = []
+    cancel_flag = rust_bridge.create_cancel_flag()
+    cancel_flag.cancel()
+
+    response = rust_bridge.read_metadata("/music/a.mp3", cancel_flag)
+
+    assert response.status is False
+    assert response.message is ErrorMessage.RUST_BACKEND_OPERATION_CANCELLED
+    assert _CancellableRustModule.calls == []
+
+
+def test_cancellation_during_rust_call_is_reported_as_cancelled(monkeypatch):
+    monkeypatch.setattr(rust_bridge, "_backend", _CancellableRustModule())
+    _CancellableRustModule.calls = []
+
+    response = rust_bridge.extract_artwork("/music/a.mp3", rust_bridge.create_cancel_flag())
+
+    assert response.status is False
+    assert response.message is ErrorMessage.RUST_BACKEND_OPERATION_CANCELLED
+
+
+def test_local_cancel_flag_is_not_passed_to_modules_without_native_flag(monkeypatch):
+    monkeypatch.setattr(rust_bridge, "_backend", _FakeRustModule())
+    cancel_flag = rust_bridge.create_cancel_flag()
+
+    response = rust_bridge.read_metadata("/music/a.mp3", cancel_flag)
+
+    assert response.status is True
+    assert response.data["title"] == "Song A"
+
+
+class _SlowRustModule:
+    class CancelFlag(_CancellableRustModule.CancelFlag):
+        pass
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def read_metadata(self, path: str, cancel_flag=None) -> dict[str, str]:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        self.started.set()
+        self.release.wait(5)
+        with self.lock:
+            self.running -= 1
+        if cancel_flag is not None and cancel_flag.is_cancelled():
+            raise RuntimeError("Operation cancelled.")
+        return {"path": path}
+
+
+def test_async_bridge_limits_reads_in_flight(monkeypatch):
+    backend = _SlowRustModule()
+    monkeypatch.setattr(rust_bridge, "_backend", backend)
+
+    async def read_all():
+        async with rust_bridge.AsyncBridge(max_concurrency=3) as bridge:
+            tasks = [asyncio.create_task(bridge.read_metadata(f"/music/{index}.mp3")) for index in range(12)]
+            for _attempt in range(500):
+                if backend.running == 3:
+                    break
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            backend.release.set()
+            return await asyncio.gather(*tasks)
+
+    responses = asyncio.run(read_all())
+
+    assert [response.data["path"] for response in responses] == [f"/music/{index}.mp3" for index in range(12)]
+    assert backend.peak == 3
+
+
+def test_async_bridge_cancellation_reaches_the_running_read(monkeypatch):
+    backend = _SlowRustModule()
+    monkeypatch.setattr(rust_bridge, "_backend", backend)
+    flags = []
+    original_create = rust_bridge.create_cancel_flag
+    monkeypatch.setattr(rust_bridge, "create_cancel_flag", lambda: flags.append(original_create()) or flags[-1])
+
+    async def cancel_running_read():
+        bridge = rust_bridge.AsyncBridge(max_concurrency=1)
+        running = asyncio.create_task(bridge.read_metadata("/music/running.mp3"))
+        waiting = asyncio.create_task(bridge.read_metadata("/music/waiting.mp3"))
+        await asyncio.to_thread(backend.started.wait, 5)
+        running.cancel()
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        backend.release.set()
+        response = await waiting
+        bridge.close()
+        return running, response
+
+    running, response = asyncio.run(cancel_running_read())
+
+    assert running.cancelled()
+    assert flags[0].is_cancelled()
+    assert response.data == {"path": "/music/waiting.mp3"}
+    assert backend.peak == 1
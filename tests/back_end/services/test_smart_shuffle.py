@@ -0,0 +1,82 @@
+import random
+
+from app.back_end.services.smart_shuffle import spread_shuffle
+
+
+def _adjacent_same_artist(order: list[str], groups: dict[str, tuple[str, str]]) -> int:
+    return sum(1 for left, right in zip(order, order[1:]) if groups[left][0] == groups[right][0])
+
+
+def _library(artist_count: int, tracks_per_artist: int) -> dict[str, tuple[str, str]]:
+    return {
+        f"a{artist}-t{track}": (f"Artist {artist}", f"Album {track % 3}")
+        for artist in range(artist_count)
+        for track in range(tracks_per_artist)
+    }
+
+
+def test_spread_shuffle_returns_a_permutation():
+    groups = _library(artist_count=5, tracks_per_artist=8)
+    track_ids = list(groups)
+
+    order = spread_shuffle(track_ids, groups, seed=1)
+
+    assert sorted(order) == sorted(track_ids)
+
+
+def test_spread_shuffle_is_deterministic_for_seed():
+    groups = _library(artist_count=5, tracks_per_artist=8)
+    track_ids = list(groups)
+
+    assert spread_shuffle(track_ids, groups, seed=3) == spread_shuffle(track_ids, groups, seed=3)
+
+
+def test_spread_shuffle_separates_artists_better_than_plain_shuffle():
+    groups = _library(artist_count=4, tracks_per_artist=25)
+    track_ids = list(groups)
+    plain = list(track_ids)
+    random.Random(8).shuffle(plain)
+
+    spread = spread_shuffle(track_ids, groups, seed=8)
+
+    assert _adjacent_same_artist(spread, groups) <= 3
+    assert _adjacent_same_artist(spread, groups) < _adjacent_same_artist(plain, groups)
+
+
+def test_spread_shuffle_never_puts_an_artist_next_to_itself_when_artists_can_alternate():
+    for sizes in ((4, 4), (4, 3), (5, 3, 2), (3, 1, 1, 1), (6, 2, 2, 2), (2, 2, 2)):
+        groups = {
+            f"a{artist}-t{track}": (f"Artist {artist}", f"Album {track % 2}")
+            for artist, size in enumerate(sizes)
+            for track in range(size)
+        }
+        for seed in range(50):
+            order = spread_shuffle(list(groups), groups, seed=seed)
+
+            assert sorted(order) == sorted(groups)
+            assert _adjacent_same_artist(order, groups) == 0, (sizes, seed)
+
+
+def test_spread_shuffle_keeps_an_artist_with_most_tracks_apart_where_it_can():
+    groups = {f"big-{track}": ("Big", "Album") for track in range(6)}
+    groups.update({f"small-{track}": ("Small", "Album") for track in range(2)})
+
+    order = spread_shuffle(list(groups), groups, seed=4)
+
+    # Six tracks against two leave room for only three separators.
+    assert _adjacent_same_artist(order, groups) == 3
+
+
+def test_spread_shuffle_alternates_albums_of_the_same_artist():
+    groups = {f"t{index}": ("Solo", f"Album {index % 2}") for index in range(10)}
+
+    order = spread_shuffle(list(groups), groups, seed=2)
+
+    adjacent_same_album = sum(1 for left, right in zip(order, order[1:]) if groups[left][1] == groups[right][1])
+    assert adjacent_same_album <= 2
+
+
+def test_tracks_without_groups_are_still_shuffled():
+    order = spread_shuffle(["t1", "t2", "t3"], {}, seed=1)
+
+    assert sorted(order) == ["t1", "t2", "t3"]
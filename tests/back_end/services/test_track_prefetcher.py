@@ -0,0 +1,106 @@
+from concurrent.futures import wait
+
+from app.back_end.services.rust_bridge import create_cancel_flag
+from app.back_end.services.track_prefetcher import TrackPrefetcher
+from app.back_end.utils.class_method_response_models import ErrorResponse, SuccessResponse
+from app.back_end.utils.error_messages import ErrorMessage
+from app.back_end.utils.success_messages import SuccessMessage
+
+
+class _CountingReaders:
+    def __init__(self) -> None:
+        self.metadata_calls: list[str] = []
+        self.artwork_calls: list[str] = []
+
+    def read_metadata(self, path: str):
+        self.metadata_calls.append(path)
+        if path.endswith("broken.mp3"):
+            return ErrorResponse(message=ErrorMessage.RUST_BACKEND_OPERATION_FAILED)
+        return SuccessResponse[dict[str, str]](
+            message=SuccessMessage.METADATA_READ_COMPLETED,
+            data={"title": path},
+        )
+
+    def read_artwork(self, path: str) -> bytes | None:
+        self.artwork_calls.append(path)
+        return b"cover" if path.endswith("a.mp3") else None
+
+
+def _prefetcher(readers: _CountingReaders, max_entries: int = 64) -> TrackPrefetcher:
+    return TrackPrefetcher(
+        metadata_reader=readers.read_metadata,
+        artwork_reader=readers.read_artwork,
+        max_entries=max_entries,
+    )
+
+
+def test_warm_fills_caches_so_later_reads_skip_the_readers(tmp_path):
+    track_path = tmp_path / "a.mp3"
+    track_path.write_bytes(b"\x00" * 1024)
+    readers = _CountingReaders()
+    prefetcher = _prefetcher(readers)
+
+    wait(prefetcher.warm([str(track_path)]))
+
+    assert prefetcher.is_warm(str(track_path))
+    assert prefetcher.metadata_for(str(track_path)).data == {"title": str(track_path)}
+    assert prefetcher.artwork_for(str(track_path)) == b"cover"
+    assert readers.metadata_calls == [str(track_path)]
+    assert readers.artwork_calls == [str(track_path)]
+    prefetcher.shutdown()
+
+
+def test_warm_skips_paths_that_are_already_cached(tmp_path):
+    readers = _CountingReaders()
+    prefetcher = _prefetcher(readers)
+    track_path = str(tmp_path / "missing.mp3")
+
+    wait(prefetcher.warm([track_path]))
+
+    assert prefetcher.warm([track_path]) == []
+    assert prefetcher.artwork_for(track_path) is None
+    assert readers.artwork_calls == [track_path]
+    prefetcher.shutdown()
+
+
+def test_failed_metadata_reads_are_not_cached():
+    readers = _CountingReaders()
+    prefetcher = _prefetcher(readers)
+
+    assert prefetcher.metadata_for("/music/broken.mp3").status is False
+    assert prefetcher.metadata_for("/music/broken.mp3").status is False
+    assert len(readers.metadata_calls) == 2
+    prefetcher.shutdown()
+
+
+def test_cache_evicts_least_recently_used_entries_and_invalidate_forces_reload():
+    readers = _CountingReaders()
+    prefetcher = _prefetcher(readers, max_entries=2)
+
+    prefetcher.metadata_for("/music/1.mp3")
+    prefetcher.metadata_for("/music/2.mp3")
+    prefetcher.metadata_for("/music/1.mp3")
+    prefetcher.metadata_for("/music/3.mp3")
+    prefetcher.metadata_for("/music/1.mp3")
+    prefetcher.metadata_for("/music/2.mp3")
+    assert readers.metadata_calls == ["/music/1.mp3", "/music/2.mp3", "/music/3.mp3", "/music/2.mp3"]
+
+    prefetcher.invalidate("/music/1.mp3")
+    prefetcher.metadata_for("/music/1.mp3")
+    assert readers.metadata_calls[-1] == "/music/1.mp3"
+    prefetcher.shutdown()
+
+
+def test_cancelled_artwork_reads_are_not_cached():
+    reads: list[str] = []
+
+    def _read_artwork(path, cancel_flag=None):
+        reads.append(path)
+        cancel_flag.cancel()
+        return None
+
+    prefetcher = TrackPrefetcher(metadata_reader=_CountingReaders().read_metadata, artwork_reader=_read_artwork)
+
+    assert prefetcher.artwork_for("/music/a.mp3", create_cancel_flag()) is None
+    assert not prefetcher.is_warm("/music/a.mp3")
+    prefetcher.shutdown()
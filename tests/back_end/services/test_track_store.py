@@ -0,0 +1,107 @@
+import pytest
+
+from app.back_end.services import python_backend
+from app.back_end.services.track_store import TrackFlag, TrackStore
+
+
+def _store() -> TrackStore:
+    store = TrackStore()
+    store.append("/m/c.flac", "Gamma", "beta", "Two", "Rock", 200_000)
+    store.append("/m/a.flac", "alpha", "Alpha", "One", "Jazz", 100_000)
+    store.append("/m/b.flac", "Beta", "alpha", "One", "Rock", 300_000)
+    store.append("/m/d.flac", "delta", "Beta", "Two", "", 150_000)
+    return store
+
+
+def test_rows_read_back_through_slotted_views():
+    store = _store()
+
+    row = store[2]
+    assert (row.path, row.title, row.artist, row.album, row.genre, row.duration_ms) == (
+        "/m/b.flac",
+        "Beta",
+        "alpha",
+        "One",
+        "Rock",
+        300_000,
+    )
+    assert not hasattr(row, "__dict__")
+    assert [track.path for track in store] == ["/m/c.flac", "/m/a.flac", "/m/b.flac", "/m/d.flac"]
+    assert store.row_of("/m/d.flac") == 3
+    assert "/m/x.flac" not in store
+    with pytest.raises(IndexError):
+        store[4]
+
+
+def test_repeated_strings_are_stored_once():
+    store = _store()
+
+    assert store.append("/m/a.flac", "ignored") == 1
+    assert len(store) == 4
+    assert store._strings["album"].values == ["", "Two", "One"]
+    assert list(store._strings["album"].codes) == [1, 2, 2, 1]
+
+
+def test_sort_orders_by_several_keys_case_insensitively():
+    store = _store()
+
+    assert list(store.sort(["artist"])) == [1, 2, 0, 3]
+    assert list(store.sort(["artist", "title"])) == [1, 2, 3, 0]
+    assert list(store.sort(["album", "-duration_ms"])) == [2, 1, 0, 3]
+    assert list(store.sort(["title"], rows=[3, 0])) == [3, 0]
+    with pytest.raises(ValueError):
+        store.sort(["bitrate"])
+
+
+def test_filter_combines_criteria_and_restricts_to_given_rows():
+    store = _store()
+    store.set_flag([0, 2], TrackFlag.FAVORITE)
+
+    assert list(store.filter(genre="Rock")) == [0, 2]
+    assert list(store.filter(album="One", min_duration_ms=200_000)) == [2]
+    assert list(store.filter(max_duration_ms=150_000)) == [1, 3]
+    assert list(store.filter(flags=TrackFlag.FAVORITE)) == [0, 2]
+    assert list(store.filter(rows=[2, 1, 0], genre="Rock")) == [2, 0]
+    assert list(store.filter(artist="Nobody")) == []
+    assert list(store.filter()) == [0, 1, 2, 3]
+
+    store.set_flag([0], TrackFlag.FAVORITE, enabled=False)
+    assert list(store.filter(flags=TrackFlag.FAVORITE)) == [2]
+
+
+def test_reorder_permutes_every_column():
+    store = _store()
+
+    store.reorder(store.sort(["path"]))
+
+    assert store.paths() == ["/m/a.flac", "/m/b.flac", "/m/c.flac", "/m/d.flac"]
+    assert [track.artist for track in store] == ["Alpha", "alpha", "beta", "Beta"]
+    assert store.row_of("/m/c.flac") == 2
+    with pytest.raises(ValueError):
+        store.reorder([0, 0, 1, 2])
+
+
+def test_update_reencodes_strings_and_rejects_unknown_columns():
+    store = _store()
+
+    store.update(3, artist="Alpha", duration_ms=1, title="Delta")
+
+    assert (store[3].artist, store[3].duration_ms, store[3].title) == ("Alpha", 1, "Delta")
+    assert list(store.filter(artist="Alpha")) == [1, 3]
+    with pytest.raises(ValueError):
+        store.update(0, bitrate=320)
+
+
+def test_extend_columns_loads_an_ingest_batch(tmp_path):
+    (tmp_path / "cover.jpg").write_bytes(b"cover")
+    track = tmp_path / "song.flac"
+    track.write_bytes(b"")
+    (tmp_path / "song.flac.musicmeta.json").write_text('{"artist": "Band", "duration_ms": "4000"}')
+
+    store = TrackStore()
+    store.extend_columns(python_backend.ingest([str(track), str(tmp_path / "gone.flac")]))
+
+    present, missing = store
+    assert (present.title, present.artist, present.duration_ms) == ("song", "Band", 4_000)
+    assert present.flags == TrackFlag.HAS_ARTWORK
+    assert missing.flags == TrackFlag.MISSING
@@ -0,0 +1,80 @@
+from app.back_end.services.trigram_index import TrigramIndex
+
+
+def _index(entries):
+    index = TrigramIndex()
+    for key, fields in entries.items():
+        index.add(key, fields)
+    return index
+
+
+def test_search_matches_word_prefixes_across_fields():
+    index = _index(
+        {
+            "a": ("Paranoid Android", "Radiohead", "OK Computer"),
+            "b": ("Karma Police", "Radiohead", "OK Computer"),
+            "c": ("Android Lust", "Someone Else", "Other"),
+        }
+    )
+
+    assert sorted(index.search("radio").keys()) == ["a", "b"]
+    assert sorted(index.search("andr radio").keys()) == ["a"]
+    assert sorted(index.search("ANDROID").keys()) == ["a", "c"]
+    assert "b" in index.search("karma")
+    assert "a" not in index.search("karma")
+
+
+def test_queries_without_a_trigram_do_not_filter():
+    index = _index({"a": ("Song",)})
+
+    assert index.search("") is None
+    assert index.search(" s ") is None
+    assert len(index.search("so")) == 1
+
+
+def test_a_typo_still_finds_the_track():
+    index = _index({"a": ("Bohemian Rhapsody", "Queen"), "b": ("Under Pressure", "Queen")})
+
+    assert index.search("bohemain rhapsody").keys() == ["a"]
+    assert index.search("bohemain rhapsody queen").keys() == ["a"]
+    assert len(index.search("zzzzzzzz")) == 0
+
+
+def test_re_adding_and_removing_keys_replaces_their_text():
+    index = _index({"a": ("old title",), "b": ("other",)})
+
+    index.add("a", ("new title",))
+    assert index.search("old").keys() == []
+    assert index.search("new").keys() == ["a"]
+
+    index.remove("a")
+    assert len(index) == 1
+    assert "a" not in index
+    assert index.search("title").keys() == []
+
+
+def test_common_trigrams_are_answered_from_bitmaps():
+    count = 3 * TrigramIndex.BITMAP_MIN_POSTINGS
+    index = _index({f"track-{key}": ("Common Words", "rare" if key % 3 == 0 else "plain") for key in range(count)})
+    index.remove("track-0")
+
+    match = index.search("common words")
+    rare = index.search("common rare")
+
+    assert len(match) == count - 1
+    assert "track-0" not in match
+    assert "track-1" in match
+    assert len(rare) == count // 3 - 1
+    assert sorted(rare.keys()) == sorted(f"track-{key}" for key in range(3, count, 3))
+
+
+def test_flags_mark_matched_keys_without_per_key_lookups():
+    count = 3 * TrigramIndex.BITMAP_MIN_POSTINGS
+    index = _index({f"track-{key}": ("Common Words", "rare" if key % 3 == 0 else "plain") for key in range(count)})
+    index.add("solo", ("Lonely Tune",))
+    dense = index.search("common rare")
+    sparse = index.search("lonely")
+    index.add("track-new", ("Common Words", "rare"))
+
+    assert list(dense.flags(["track-1", "track-3", "track-new", "missing"])) == [0, 1, 0, 0]
+    assert list(sparse.flags(["solo", "track-3", "track-new"])) == [1, 0, 0]
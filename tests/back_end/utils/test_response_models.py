@@ -5,8 +5,11 @@ from app.back_end.utils.class_method_request_models import (
     PlaylistReorderRequest,
     TrackPathRequest,
 )
+from app.back_end.utils import class_method_response_models
 from app.back_end.utils.class_method_response_models import (
     ErrorResponse,
+    FastErrorResponse,
+    FastSuccessResponse,
     MethodResponse,
     SuccessResponse,
 )
@@ -54,3 +57,39 @@ def test_method_response_union_parses_success_payload():
         }
     )
     assert isinstance(parsed, SuccessResponse)
+
+
+def test_trusted_success_response_matches_validated_response(monkeypatch):
+    monkeypatch.setattr(class_method_response_models, "VALIDATE_RESPONSES", False)
+    response = SuccessResponse[dict].trusted(message=SuccessMessage.GENERAL_SUCCESS, data={"id": 1})
+    assert isinstance(response, FastSuccessResponse)
+    assert response.status is True
+    assert response.message is SuccessMessage.GENERAL_SUCCESS
+    assert response.data == {"id": 1}
+    assert response == SuccessResponse[dict](message=SuccessMessage.GENERAL_SUCCESS, data={"id": 1})
+    assert response != SuccessResponse[dict](message=SuccessMessage.GENERAL_SUCCESS, data={"id": 2})
+
+
+def test_trusted_error_response_matches_validated_response(monkeypatch):
+    monkeypatch.setattr(class_method_response_models, "VALIDATE_RESPONSES", False)
+    response = ErrorResponse.trusted(message=ErrorMessage.UNKNOWN_ERROR)
+    assert isinstance(response, FastErrorResponse)
+    assert response.status is False
+    assert response.data is None
+    assert response == ErrorResponse(message=ErrorMessage.UNKNOWN_ERROR)
+
+
+def test_trusted_responses_validate_in_debug_mode(monkeypatch):
+    monkeypatch.setattr(class_method_response_models, "VALIDATE_RESPONSES", True)
+    response = SuccessResponse[dict[str, int]].trusted(message=SuccessMessage.GENERAL_SUCCESS, data={"id": 1})
+    assert isinstance(response, SuccessResponse)
+    assert isinstance(ErrorResponse.trusted(message=ErrorMessage.UNKNOWN_ERROR), ErrorResponse)
+    with pytest.raises(ValidationError):
+        SuccessResponse[dict[str, int]].trusted(message=SuccessMessage.GENERAL_SUCCESS, data={"id": "1"})
+
+
+def test_method_response_union_accepts_fast_responses(monkeypatch):
+    monkeypatch.setattr(class_method_response_models, "VALIDATE_RESPONSES", False)
+    adapter = TypeAdapter(MethodResponse[dict])
+    response = ErrorResponse.trusted(message=ErrorMessage.UNKNOWN_ERROR)
+    assert adapter.validate_python(response) is response
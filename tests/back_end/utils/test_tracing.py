@@ -0,0 +1,147 @@
+import json
+import threading
+
+import pytest
+
+from app.back_end.controllers.playlist_controller import PlaylistController
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.back_end.utils import tracing
+from app.back_end.utils.tracing import Tracer, traced, traced_methods, tracer
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracer():
+    tracer.disable()
+    tracer.clear()
+    yield
+    tracer.disable()
+    tracer.clear()
+
+
+def test_traced_function_records_nothing_while_disabled():
+    @traced("test")
+    def add(left, right):
+        return left + right
+
+    assert add(1, 2) == 3
+    assert tracer.spans() == []
+
+
+def test_nested_spans_record_thread_and_enclose_each_other():
+    @traced("test", detail=lambda value: f"value={value}")
+    def inner(value):
+        return value * 2
+
+    @traced("test")
+    def outer(value):
+        return inner(value) + 1
+
+    tracer.enable()
+    assert outer(4) == 9
+    worker = threading.Thread(target=inner, args=(1,), name="worker")
+    worker.start()
+    worker.join()
+
+    spans = {
+        (name.rsplit(".", 1)[-1], thread): (start, duration, detail)
+        for name, _, start, duration, thread, detail in tracer.spans()
+    }
+    main_id = threading.get_ident()
+    inner_start, inner_duration, inner_detail = spans[("inner", main_id)]
+    outer_start, outer_duration, _ = spans[("outer", main_id)]
+    assert outer_start <= inner_start
+    assert inner_start + inner_duration <= outer_start + outer_duration
+    assert inner_detail == "value=4"
+    assert spans[("inner", worker.ident)][2] == "value=1"
+
+
+def test_span_is_recorded_when_the_call_raises():
+    @traced("test")
+    def fail():
+        raise ValueError("boom")
+
+    tracer.enable()
+    with pytest.raises(ValueError):
+        fail()
+    assert len(tracer.spans()) == 1
+
+
+def test_chrome_trace_export_writes_complete_events(tmp_path):
+    local = Tracer()
+    local.enable()
+    with local.span("load", "sqlite", detail="SELECT 1"):
+        pass
+
+    path = local.export(tmp_path / "trace" / "out.json")
+
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    metadata = [event for event in events if event["ph"] == "M"]
+    complete = [event for event in events if event["ph"] == "X"]
+    assert metadata[0]["args"]["name"] == threading.current_thread().name
+    assert complete[0]["name"] == "load"
+    assert complete[0]["cat"] == "sqlite"
+    assert complete[0]["tid"] == threading.get_ident()
+    assert complete[0]["args"] == {"detail": "SELECT 1"}
+    assert complete[0]["dur"] >= 0
+
+
+def test_tracer_keeps_only_the_newest_spans():
+    local = Tracer(max_spans=2)
+    local.enable()
+    for name in ("first", "second", "third"):
+        with local.span(name):
+            pass
+
+    assert [span[0] for span in local.spans()] == ["second", "third"]
+
+
+def test_qt_slot_wrapper_drops_extra_signal_arguments():
+    @traced_methods("ui", qt_slots=True)
+    class Window:
+        def _on_clicked(self):
+            return "clicked"
+
+        @staticmethod
+        def _label(text):
+            return text
+
+    window = Window()
+    # QAction.triggered passes a `checked` bool the slot does not take.
+    assert window._on_clicked(False) == "clicked"
+    assert Window._label("a", True) == "a"
+
+    tracer.enable()
+    window._on_clicked()
+    assert tracer.spans()[0][0].endswith("Window._on_clicked")
+
+
+def test_start_from_environment_enables_tracing_and_exports_at_exit(monkeypatch, tmp_path):
+    registered = []
+    monkeypatch.setattr(tracing.atexit, "register", lambda function, *args: registered.append((function, args)))
+
+    monkeypatch.delenv(tracing.TRACE_ENV_VAR, raising=False)
+    assert tracing.start_from_environment() is None
+    assert tracer.enabled is False
+
+    monkeypatch.setenv(tracing.TRACE_ENV_VAR, "1")
+    assert tracing.start_from_environment() == tracing.DEFAULT_TRACE_PATH
+
+    target = tmp_path / "session.json"
+    monkeypatch.setenv(tracing.TRACE_ENV_VAR, str(target))
+    assert tracing.start_from_environment() == target
+    assert tracer.enabled is True
+    assert registered[-1] == (tracer.export, (target,))
+
+
+def test_controller_and_repository_calls_are_traced_with_queries(tmp_path):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    controller = PlaylistController(Repository(db_handler))
+
+    tracer.enable()
+    controller.create_playlist("Roadtrip")
+
+    spans = tracer.spans()
+    assert [span[0] for span in spans if span[1] == "controller"] == ["PlaylistController.create_playlist"]
+    assert any("INSERT INTO playlists" in span[5] for span in spans if span[1] == "sqlite")
@@ -0,0 +1,123 @@
+import threading
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt6.QtGui import QColor, QImage, QPixmap
+from PyQt6.QtTest import QSignalSpy
+
+from app.front_end.album_grid_view import AlbumGridView
+from app.front_end.thumbnail_loader import PixmapLruCache, ThumbnailLoader, decode_thumbnail
+
+
+def _jpeg(width, height):
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor("#336699"))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "JPEG")
+    return bytes(data)
+
+
+class _LibraryController:
+    def __init__(self, album_count):
+        self.album_count = album_count
+
+    def list_album_covers(self):
+        return [(f"Artist {index}", f"Album {index}", 10, f"/music/{index}/01.mp3") for index in range(self.album_count)]
+
+
+class _ArtworkReader:
+    def __init__(self, image_data=None):
+        self.image_data = image_data if image_data is not None else _jpeg(1200, 800)
+        self.paths = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, path, cancel_flag=None):
+        self.release.wait(5)
+        self.paths.append(path)
+        return None if path.endswith("missing.mp3") else self.image_data
+
+
+def test_decode_thumbnail_scales_and_crops_to_a_square():
+    image = decode_thumbnail(_jpeg(1200, 800), 160)
+
+    assert image.width() == image.height() == 160
+    assert decode_thumbnail(b"not an image", 160) is None
+
+
+def test_pixmap_cache_evicts_least_recently_used_by_bytes(qtbot):
+    pixmap = QPixmap(32, 32)
+    entry_bytes = 32 * 32 * pixmap.depth() // 8 + PixmapLruCache.ENTRY_OVERHEAD_BYTES
+    cache = PixmapLruCache(max_bytes=3 * entry_bytes)
+
+    for key in "abc":
+        cache.put(key, pixmap)
+    cache.get("a")
+    cache.put("d", pixmap)
+    cache.put("none", None)
+
+    assert "a" in cache and "d" in cache and "none" in cache
+    assert "b" not in cache
+    assert cache.total_bytes <= 3 * entry_bytes
+
+
+def test_loader_decodes_off_thread_and_remembers_missing_artwork(qtbot):
+    reader = _ArtworkReader()
+    loader = ThumbnailLoader(reader, 64, max_bytes=1024 * 1024)
+    spy = QSignalSpy(loader.thumbnail_ready)
+
+    assert loader.thumbnail("/music/a.mp3") is None
+    assert loader.thumbnail("/music/missing.mp3") is None
+    assert loader.thumbnail("/music/a.mp3") is None
+    qtbot.waitUntil(lambda: len(spy) == 2, timeout=2_000)
+
+    assert loader.thumbnail("/music/a.mp3").width() == 64
+    assert loader.thumbnail("/music/missing.mp3") is None
+    assert sorted(reader.paths) == ["/music/a.mp3", "/music/missing.mp3"]
+    loader.shutdown()
+
+
+def test_grid_only_loads_artwork_for_visible_albums(qtbot):
+    reader = _ArtworkReader()
+    view = AlbumGridView(_LibraryController(5_000), reader)
+    qtbot.addWidget(view)
+    view.resize(800, 600)
+    view.show()
+    view.reload()
+    qtbot.waitExposed(view)
+
+    visible = view.visible_rows()
+    qtbot.waitUntil(lambda: view.thumbnail_loader.pending_count() == 0, timeout=5_000)
+
+    assert 0 < len(visible) < 100
+    assert visible.start == 0
+    assert len(reader.paths) <= len(visible) + 10
+    decoration = view.model.data(view.model.index(0), Qt.ItemDataRole.DecorationRole)
+    assert decoration.width() == AlbumGridView.THUMBNAIL_SIZE
+
+
+def test_grid_cancels_loads_for_albums_scrolled_out_of_view(qtbot):
+    reader = _ArtworkReader()
+    reader.release.clear()
+    view = AlbumGridView(_LibraryController(5_000), reader)
+    qtbot.addWidget(view)
+    view.resize(800, 600)
+    view.show()
+    view.reload()
+    qtbot.waitExposed(view)
+    qtbot.waitUntil(lambda: view.thumbnail_loader.pending_count() > 0, timeout=2_000)
+
+    scroll_bar = view.list_view.verticalScrollBar()
+    scroll_bar.setValue(scroll_bar.maximum())
+    qtbot.waitUntil(lambda: view.visible_rows().stop == 5_000, timeout=2_000)
+    qtbot.waitUntil(lambda: view.thumbnail_loader.pending_count() <= len(view.visible_rows()), timeout=2_000)
+    reader.release.set()
+    qtbot.waitUntil(lambda: view.thumbnail_loader.pending_count() == 0, timeout=5_000)
+
+    # Only the two reads already running when the first screen was scrolled
+    # away complete; every other load from it was cancelled.
+    first_screen = {f"/music/{row}/01.mp3" for row in range(100)}
+    assert len(first_screen.intersection(reader.paths)) <= 2
+    assert "/music/4999/01.mp3" in reader.paths
+    view.thumbnail_loader.shutdown()
@@ -0,0 +1,150 @@
+import pytest
+from PyQt6.QtCore import QObject, QUrl, pyqtSignal
+from PyQt6.QtTest import QSignalSpy
+
+QtMultimedia = pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)
+QMediaPlayer = QtMultimedia.QMediaPlayer
+
+from app.front_end.gapless_player import GapMeter, GaplessPlayer
+
+
+class _FakeOutput(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.volume = 1.0
+
+    def setVolume(self, volume):
+        self.volume = volume
+
+
+class _FakePlayer(QObject):
+    positionChanged = pyqtSignal(int)
+    durationChanged = pyqtSignal(int)
+    playbackStateChanged = pyqtSignal(QMediaPlayer.PlaybackState)
+    mediaStatusChanged = pyqtSignal(QMediaPlayer.MediaStatus)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.calls = []
+        self._source = QUrl()
+        self._state = QMediaPlayer.PlaybackState.StoppedState
+
+    def setAudioOutput(self, output):
+        self.output = output
+
+    def setSource(self, source):
+        self.calls.append("setSource")
+        self._source = source
+
+    def source(self):
+        return self._source
+
+    def play(self):
+        self.calls.append("play")
+        self._state = QMediaPlayer.PlaybackState.PlayingState
+
+    def stop(self):
+        self.calls.append("stop")
+        self._state = QMediaPlayer.PlaybackState.StoppedState
+
+    def playbackState(self):
+        return self._state
+
+    def duration(self):
+        return 180_000
+
+
+def _player():
+    return GaplessPlayer(player_factory=_FakePlayer, output_factory=_FakeOutput)
+
+
+def test_end_of_media_swaps_to_prepared_track(qtbot):
+    player = _player()
+    first = player._active
+    advanced_spy = QSignalSpy(player.advanced)
+    status_spy = QSignalSpy(player.mediaStatusChanged)
+
+    player.setSource(QUrl.fromLocalFile("/music/a.mp3"))
+    player.play()
+    player.prepare_next(QUrl.fromLocalFile("/music/b.mp3"))
+    first.mediaStatusChanged.emit(QMediaPlayer.MediaStatus.EndOfMedia)
+
+    assert player.source().toLocalFile() == "/music/b.mp3"
+    assert player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+    assert first.calls[-1] == "stop"
+    assert len(advanced_spy) == 1
+    assert advanced_spy[0][0] == "/music/b.mp3"
+    assert len(status_spy) == 0
+
+
+def test_end_of_media_without_prepared_track_is_forwarded(qtbot):
+    player = _player()
+    status_spy = QSignalSpy(player.mediaStatusChanged)
+
+    player._active.mediaStatusChanged.emit(QMediaPlayer.MediaStatus.EndOfMedia)
+
+    assert len(status_spy) == 1
+
+
+def test_standby_player_signals_are_not_forwarded(qtbot):
+    player = _player()
+    position_spy = QSignalSpy(player.positionChanged)
+
+    player._standby.positionChanged.emit(1_000)
+    player._active.positionChanged.emit(2_000)
+
+    assert len(position_spy) == 1
+    assert position_spy[0][0] == 2_000
+
+
+def test_prepare_next_skips_reloading_same_source(qtbot):
+    player = _player()
+    standby = player._standby
+
+    player.prepare_next(QUrl.fromLocalFile("/music/b.mp3"))
+    player.prepare_next(QUrl.fromLocalFile("/music/b.mp3"))
+
+    assert standby.calls.count("setSource") == 1
+
+
+def test_disabling_gapless_clears_prepared_track(qtbot):
+    player = _player()
+    status_spy = QSignalSpy(player.mediaStatusChanged)
+
+    player.prepare_next(QUrl.fromLocalFile("/music/b.mp3"))
+    player.set_gapless_enabled(False)
+    player.prepare_next(QUrl.fromLocalFile("/music/c.mp3"))
+    player._active.mediaStatusChanged.emit(QMediaPlayer.MediaStatus.EndOfMedia)
+
+    assert player._standby.source().isEmpty()
+    assert len(status_spy) == 1
+
+
+def test_gap_is_measured_until_next_track_reports_position(qtbot):
+    player = _player()
+    gap_spy = QSignalSpy(player.gap_measured)
+
+    player.prepare_next(QUrl.fromLocalFile("/music/b.mp3"))
+    player._active.mediaStatusChanged.emit(QMediaPlayer.MediaStatus.EndOfMedia)
+    player._active.positionChanged.emit(0)
+    assert len(gap_spy) == 0
+
+    player._active.positionChanged.emit(25)
+
+    assert len(gap_spy) == 1
+    assert player.gap_statistics()["count"] == 1
+
+
+def test_gap_meter_discards_idle_periods(monkeypatch):
+    meter = GapMeter()
+    clock = iter([10.0, 10.004, 20.0, 30.0])
+    monkeypatch.setattr("app.front_end.gapless_player.time.perf_counter", lambda: next(clock))
+
+    meter.start()
+    assert meter.stop() == pytest.approx(4.0)
+    meter.start()
+    assert meter.stop() is None
+
+    statistics = meter.statistics()
+    assert statistics["count"] == 1
+    assert statistics["max_ms"] == pytest.approx(4.0)
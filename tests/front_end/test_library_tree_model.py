@@ -0,0 +1,104 @@
+from PyQt6.QtCore import QModelIndex
+from PyQt6.QtTest import QSignalSpy
+
+from app.back_end.controllers.library_controller import LibraryController
+from app.back_end.data.database_handler.database import DatabaseHandler
+from app.back_end.data.repositories.repository import Repository
+from app.front_end.library_tree_model import LibraryTreeModel
+from app.front_end.library_view import LibraryView
+
+
+class _CountingController(LibraryController):
+    def __init__(self, repository):
+        super().__init__(repository)
+        self.calls = []
+
+    def list_artists(self, after=None, limit=500):
+        self.calls.append(("artists", after))
+        return super().list_artists(after=after, limit=limit)
+
+    def list_albums(self, artist):
+        self.calls.append(("albums", artist))
+        return super().list_albums(artist)
+
+    def list_album_tracks(self, artist, album):
+        self.calls.append(("tracks", artist, album))
+        return super().list_album_tracks(artist, album)
+
+
+def _controller(tmp_path, artist_count):
+    db_handler = DatabaseHandler(db_path=tmp_path / "app.db")
+    db_handler.initialize_schema()
+    connection = db_handler.connect()
+    connection.executemany(
+        "INSERT INTO tracks (path, title, artist, album, duration_ms) VALUES (?, ?, ?, ?, ?)",
+        [
+            (f"/music/{artist}/{album}/{track}.mp3", f"Track {track}", f"Artist {artist:05d}", f"Album {album}", 61_000)
+            for artist in range(artist_count)
+            for album in range(2)
+            for track in range(2)
+        ],
+    )
+    connection.commit()
+    return _CountingController(Repository(db_handler))
+
+
+def test_artists_are_paged_in_as_the_view_asks_for_more(qtbot, tmp_path):
+    controller = _controller(tmp_path, 10_000)
+    model = LibraryTreeModel(controller)
+
+    assert model.rowCount() == 0
+    assert model.canFetchMore(QModelIndex())
+
+    model.fetchMore(QModelIndex())
+    model.fetchMore(QModelIndex())
+
+    assert model.rowCount() == 2 * LibraryTreeModel.ARTIST_BATCH_SIZE
+    assert controller.calls == [("artists", None), ("artists", "Artist 00199")]
+    assert model.data(model.index(200, 0)) == "Artist 00200"
+    assert model.data(model.index(0, 1)) == "2"
+    assert model.data(model.index(0, 2)) == "4"
+    assert model.data(model.index(0, 3)) == "4:04"
+
+
+def test_children_are_queried_only_when_a_node_is_expanded(qtbot, tmp_path):
+    controller = _controller(tmp_path, 3)
+    model = LibraryTreeModel(controller)
+    model.fetchMore(QModelIndex())
+    artist = model.index(1, 0)
+
+    assert model.hasChildren(artist)
+    assert model.rowCount(artist) == 0
+    assert controller.calls == [("artists", None)]
+
+    model.fetchMore(artist)
+    album = model.index(1, 0, artist)
+    model.fetchMore(album)
+    track = model.index(0, 0, album)
+
+    assert controller.calls[1:] == [("albums", "Artist 00001"), ("tracks", "Artist 00001", "Album 1")]
+    assert model.data(album) == "Album 1"
+    assert model.data(album.siblingAtColumn(2)) == "2"
+    assert model.data(track) == "Track 0"
+    assert model.data(track, LibraryTreeModel.PATH_ROLE) == "/music/1/1/0.mp3"
+    assert model.parent(track) == album
+    assert model.parent(album) == artist
+    assert not model.hasChildren(track)
+    assert not model.canFetchMore(artist)
+
+
+def test_library_view_emits_path_for_activated_tracks_only(qtbot, tmp_path):
+    view = LibraryView(_controller(tmp_path, 1))
+    qtbot.addWidget(view)
+    spy = QSignalSpy(view.track_activated)
+    model = view.model
+    model.fetchMore(QModelIndex())
+    artist = model.index(0, 0)
+    model.fetchMore(artist)
+    album = model.index(0, 0, artist)
+    model.fetchMore(album)
+
+    view.tree_view.doubleClicked.emit(artist)
+    view.tree_view.doubleClicked.emit(model.index(1, 0, album))
+
+    assert [args[0] for args in spy] == ["/music/0/0/1.mp3"]
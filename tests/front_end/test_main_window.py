@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)
+
+from app.front_end.main_window import MainWindow  # noqa: E402
+
+
+@pytest.fixture
+def window(qtbot, tmp_path, monkeypatch):
+    monkeypatch.setenv("MUSIC_PLAYER_DB_PATH", str(tmp_path / "app.db"))
+    main_window = MainWindow()
+    qtbot.addWidget(main_window)
+    return main_window
+
+
+def _tracks(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"{index}.wav"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    return paths
+
+
+def test_dragging_a_row_changes_the_playback_order(window, tmp_path):
+    first, second, third, fourth = _tracks(tmp_path, 4)
+    window._play_library_tracks([first, second, third, fourth])
+
+    assert window.playlist_view.model.move_rows([3], 1)
+
+    assert window._tracks.paths() == [first, fourth, second, third]
+    assert window._queue_service.next_track(first).data == {"track_id": fourth}
+    assert window._queue_service.next_track(fourth).data == {"track_id": second}
+    restored = window._session_controller.restore().data
+    assert restored.track_paths == [first, fourth, second, third]
+
+
+def test_track_details_are_kept_in_the_queue_store(window, tmp_path):
+    first, second = _tracks(tmp_path, 2)
+    window._play_library_tracks([first, second])
+
+    window._apply_track_details(({second: ("Song", "Artist", 61_000)}, {second: "Album"}))
+
+    track = window._tracks[1]
+    assert (track.title, track.artist, track.album, track.duration_ms) == ("Song", "Artist", "Album", 61_000)
+    model = window.playlist_view.model
+    assert model.data(model.index(1, 1)) == "Artist"
+
+
+def test_shuffle_spreads_artists_using_groups_from_the_library(window, qtbot, tmp_path):
+    paths = _tracks(tmp_path, 8)
+    connection = window._db_handler.connect()
+    connection.executemany(
+        "INSERT INTO tracks (path, title, artist, album) VALUES (?, 'Title', ?, 'Album')",
+        [(path, "First" if index < 4 else "Second") for index, path in enumerate(paths)],
+    )
+    connection.commit()
+    window._play_library_tracks(paths)
+    qtbot.waitUntil(lambda: len(window._track_groups) == len(paths), timeout=2_000)
+
+    window._set_shuffle_enabled(True)
+
+    order = window._queue_service.track_ids()
+    artists = [window._track_groups[path][0] for path in order]
+    assert sorted(order) == sorted(paths)
+    assert all(left != right for left, right in zip(artists, artists[1:]))
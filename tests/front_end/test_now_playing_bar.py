@@ -56,3 +56,19 @@ def test_speed_selection_emits_float_rate(qtbot):
 
     assert len(spy) == 1
     assert float(spy[0][0]) == 1.25
+
+
+def test_position_updates_within_same_second_skip_label_redraw(qtbot):
+    widget = NowPlayingBar()
+    qtbot.addWidget(widget)
+    widget.set_track_duration_ms(180_000)
+    widget.set_playback_position_ms(61_000)
+    label_changes = []
+    widget.current_time_label.setText = label_changes.append
+
+    widget.set_playback_position_ms(61_400)
+    widget.set_playback_position_ms(61_900)
+    assert label_changes == []
+
+    widget.set_playback_position_ms(62_000)
+    assert label_changes == ["01:02"]
@@ -0,0 +1,39 @@
+from app.front_end.position_coalescer import PositionUpdateCoalescer
+
+
+def test_bursts_are_folded_into_one_trailing_update(qtbot):
+    delivered = []
+    coalescer = PositionUpdateCoalescer(delivered.append, max_rate_hz=20)
+
+    coalescer.submit(100)
+    for position_ms in range(110, 200, 10):
+        coalescer.submit(position_ms)
+
+    assert delivered == [100]
+    qtbot.waitUntil(lambda: delivered == [100, 190], timeout=1_000)
+
+
+def test_unchanged_positions_are_not_redelivered(qtbot):
+    delivered = []
+    coalescer = PositionUpdateCoalescer(delivered.append)
+
+    coalescer.submit(500)
+    coalescer.flush()
+    coalescer.submit(500)
+    coalescer.flush()
+
+    assert delivered == [500]
+
+
+def test_suspended_coalescer_delivers_latest_position_on_resume(qtbot):
+    delivered = []
+    coalescer = PositionUpdateCoalescer(delivered.append)
+
+    coalescer.set_suspended(True)
+    coalescer.submit(1_000)
+    coalescer.submit(2_000)
+    qtbot.wait(150)
+    assert delivered == []
+
+    coalescer.set_suspended(False)
+    assert delivered == [2_000]
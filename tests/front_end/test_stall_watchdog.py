@@ -0,0 +1,111 @@
+import time
+
+from app.front_end.stall_stats_dialog import StallStatsDialog
+from app.front_end.stall_watchdog import (
+    STALL_THRESHOLD_ENV_VAR,
+    UNKNOWN_LOCATION,
+    StallWatchdog,
+    stall_threshold_ms,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _blocking_handler(watchdog: StallWatchdog, clock: FakeClock) -> None:
+    clock.now += 0.5
+    watchdog._check()
+
+
+def test_stall_is_recorded_with_the_stack_captured_during_it(qtbot):
+    clock = FakeClock()
+    watchdog = StallWatchdog(threshold_ms=200, heartbeat_interval_ms=50, clock=clock)
+    detected = []
+    watchdog.stall_detected.connect(detected.append)
+
+    _blocking_handler(watchdog, clock)
+    watchdog._heartbeat()
+
+    assert len(detected) == 1
+    stall = detected[0]
+    assert stall.duration_ms == 450
+    assert "in _check" in stall.location
+    assert "_blocking_handler" in stall.stack
+    site = watchdog.sites()[0]
+    assert (site.count, site.total_ms, site.max_ms) == (1, 450, 450)
+
+
+def test_late_heartbeat_below_threshold_is_not_a_stall(qtbot):
+    clock = FakeClock()
+    watchdog = StallWatchdog(threshold_ms=200, heartbeat_interval_ms=50, clock=clock)
+
+    clock.now += 0.2
+    watchdog._check()
+    watchdog._heartbeat()
+
+    assert watchdog.recent_stalls() == []
+
+
+def test_stall_without_a_captured_stack_is_still_counted(qtbot):
+    clock = FakeClock()
+    watchdog = StallWatchdog(threshold_ms=200, heartbeat_interval_ms=50, clock=clock)
+
+    clock.now += 1.0
+    watchdog._heartbeat()
+    clock.now += 0.3
+    watchdog._heartbeat()
+
+    assert [stall.location for stall in watchdog.recent_stalls()] == [UNKNOWN_LOCATION, UNKNOWN_LOCATION]
+    assert watchdog.sites()[0].count == 2
+    watchdog.reset()
+    assert watchdog.sites() == []
+
+
+def test_watchdog_thread_catches_a_blocked_event_loop(qtbot):
+    watchdog = StallWatchdog(threshold_ms=100, heartbeat_interval_ms=20)
+    watchdog.start()
+    try:
+        qtbot.wait(60)
+        with qtbot.waitSignal(watchdog.stall_detected, timeout=2_000) as blocker:
+            time.sleep(0.4)
+    finally:
+        watchdog.stop()
+
+    stall = blocker.args[0]
+    assert stall.duration_ms >= 100
+    assert "test_watchdog_thread_catches_a_blocked_event_loop" in stall.stack
+    assert not watchdog.is_running()
+
+
+def test_threshold_comes_from_the_environment(monkeypatch):
+    monkeypatch.delenv(STALL_THRESHOLD_ENV_VAR, raising=False)
+    assert stall_threshold_ms() == StallWatchdog.DEFAULT_THRESHOLD_MS
+    monkeypatch.setenv(STALL_THRESHOLD_ENV_VAR, "500")
+    assert stall_threshold_ms() == 500
+    monkeypatch.setenv(STALL_THRESHOLD_ENV_VAR, "0")
+    assert stall_threshold_ms() == 0
+
+
+def test_stats_dialog_lists_sites_and_shows_their_stack(qtbot):
+    clock = FakeClock()
+    watchdog = StallWatchdog(threshold_ms=200, heartbeat_interval_ms=50, clock=clock)
+    dialog = StallStatsDialog(watchdog)
+    qtbot.addWidget(dialog)
+    assert dialog.table.rowCount() == 0
+
+    _blocking_handler(watchdog, clock)
+    watchdog._heartbeat()
+
+    assert dialog.table.rowCount() == 1
+    assert dialog.table.item(0, 1).text() == "1"
+    assert dialog.table.item(0, 3).text() == "450"
+    assert "_blocking_handler" in dialog.stack_view.toPlainText()
+
+    dialog._reset()
+    assert dialog.table.rowCount() == 0
+    assert dialog.stack_view.toPlainText() == ""
@@ -0,0 +1,50 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)
+
+MAIN = Path(__file__).resolve().parents[2] / "src" / "main.py"
+FIRST_WINDOW_BUDGET_MS = 3_000.0
+PHASE_PATTERN = re.compile(r"^(?P<phase>[A-Za-z ]+?)\s+(?P<duration>[\d.]+) ms\s+(?P<elapsed>[\d.]+) ms$")
+
+
+def _profile_startup(tmp_path):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", MUSIC_PLAYER_DB_PATH=str(tmp_path / "app.db"))
+    completed = subprocess.run(
+        [sys.executable, str(MAIN), "--profile-startup"],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert completed.returncode == 0, completed.stderr
+
+    elapsed = {}
+    loaded = None
+    for line in completed.stderr.splitlines():
+        match = PHASE_PATTERN.match(line.strip())
+        if match is not None:
+            elapsed[match["phase"]] = float(match["elapsed"])
+        elif line.startswith("deferred modules loaded before first paint:"):
+            loaded = line.split(":", 1)[1].strip()
+    return elapsed, loaded
+
+
+def test_first_window_is_painted_before_deferred_subsystems_load(tmp_path):
+    elapsed, loaded = _profile_startup(tmp_path)
+
+    assert loaded == "none"
+    assert list(elapsed) == [
+        "import Qt widgets",
+        "create application",
+        "import main window",
+        "construct main window",
+        "first paint",
+        "playback ready",
+    ]
+    assert elapsed["first paint"] < FIRST_WINDOW_BUDGET_MS
@@ -0,0 +1,103 @@
+import threading
+import time
+
+from app.front_end.task_runner import TaskRunner
+
+
+def test_results_are_delivered_on_the_owning_thread(qtbot):
+    runner = TaskRunner()
+    delivered = []
+
+    def _work(value):
+        return value * 2, threading.current_thread()
+
+    runner.submit(_work, 21, on_result=lambda result: delivered.append((result, threading.current_thread())))
+    qtbot.waitUntil(lambda: len(delivered) == 1, timeout=2_000)
+
+    (value, worker_thread), callback_thread = delivered[0]
+    assert value == 42
+    assert worker_thread is not threading.main_thread()
+    assert callback_thread is threading.main_thread()
+    runner.shutdown()
+
+
+def test_errors_are_routed_to_the_error_callback(qtbot):
+    runner = TaskRunner()
+    errors = []
+    results = []
+
+    def _fail():
+        raise OSError("disk went away")
+
+    runner.submit(_fail, on_result=results.append, on_error=errors.append)
+    qtbot.waitUntil(lambda: len(errors) == 1, timeout=2_000)
+
+    assert isinstance(errors[0], OSError)
+    assert results == []
+    runner.shutdown()
+
+
+def test_slow_task_does_not_block_the_caller(qtbot):
+    runner = TaskRunner()
+    release = threading.Event()
+    delivered = []
+
+    runner.submit(release.wait, on_result=delivered.append)
+    assert delivered == []
+
+    release.set()
+    qtbot.waitUntil(lambda: delivered == [True], timeout=2_000)
+    runner.shutdown()
+
+
+def test_submit_latest_drops_superseded_results(qtbot):
+    runner = TaskRunner()
+    release = threading.Event()
+    delivered = []
+    flags = []
+
+    def _read(path, cancel_flag):
+        flags.append(cancel_flag)
+        release.wait()
+        return path
+
+    runner.submit_latest("metadata", _read, "a.mp3", on_result=delivered.append)
+    runner.submit_latest("metadata", _read, "b.mp3", on_result=delivered.append)
+    release.set()
+    qtbot.waitUntil(lambda: runner.in_flight_count() == 0, timeout=2_000)
+    qtbot.wait(20)
+
+    assert delivered == ["b.mp3"]
+    assert flags[0].is_cancelled()
+    assert not flags[-1].is_cancelled()
+    runner.shutdown()
+
+
+def test_rapid_skipping_keeps_latency_and_queue_depth_bounded(qtbot):
+    runner = TaskRunner()
+    delivered = []
+    max_depth = 0
+
+    def _slow_read(path, cancel_flag):
+        # Behaves like the Rust readers: checks the flag between I/O steps.
+        for _ in range(12):
+            if cancel_flag.is_cancelled():
+                return None
+            time.sleep(0.005)
+        return path
+
+    skips_per_second = 50
+    for index in range(skips_per_second):
+        runner.submit_latest("metadata", _slow_read, f"track-{index}.mp3", on_result=delivered.append)
+        max_depth = max(max_depth, runner.in_flight_count())
+        qtbot.wait(1_000 // skips_per_second)
+    last_submitted_at = time.perf_counter()
+
+    qtbot.waitUntil(lambda: len(delivered) == 1, timeout=2_000)
+    latency_ms = (time.perf_counter() - last_submitted_at) * 1000
+
+    assert delivered == [f"track-{skips_per_second - 1}.mp3"]
+    assert max_depth <= 4
+    assert latency_ms < 500
+    qtbot.waitUntil(lambda: runner.in_flight_count() == 0, timeout=2_000)
+    runner.shutdown()
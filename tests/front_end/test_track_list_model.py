@@ -0,0 +1,221 @@
+import time
+from pathlib import PurePath
+
+from PyQt6.QtCore import QModelIndex, Qt
+from PyQt6.QtTest import QSignalSpy
+
+from app.back_end.services.track_store import TrackFlag, TrackStore
+from app.back_end.services.trigram_index import TrigramIndex
+from app.front_end.playlist_view import PlaylistView
+from app.front_end.track_list_model import TrackListModel
+
+
+def _paths(count):
+    return [f"/music/track-{index:06d}.mp3" for index in range(count)]
+
+
+def test_rows_are_exposed_in_batches(qtbot):
+    model = TrackListModel()
+    model.set_tracks(_paths(100_000))
+
+    assert model.rowCount() == TrackListModel.FETCH_BATCH_SIZE
+    assert model.canFetchMore(QModelIndex())
+
+    model.fetchMore(QModelIndex())
+
+    assert model.rowCount() == 2 * TrackListModel.FETCH_BATCH_SIZE
+    assert model.track_count() == 100_000
+
+
+def test_details_are_requested_only_for_painted_rows(qtbot):
+    model = TrackListModel()
+    model.set_tracks(_paths(1_000))
+    spy = QSignalSpy(model.details_requested)
+
+    assert model.data(model.index(3, 0)) == "track-000003.mp3"
+    assert model.data(model.index(3, 1)) == ""
+    model.data(model.index(4, 0))
+    qtbot.waitUntil(lambda: len(spy) == 1, timeout=1_000)
+
+    assert spy[0][0] == ["/music/track-000003.mp3", "/music/track-000004.mp3"]
+
+    model.set_track_details({"/music/track-000003.mp3": ("Song", "Artist", 185_000)})
+
+    assert model.data(model.index(3, 0)) == "Song"
+    assert model.data(model.index(3, 1)) == "Artist"
+    assert model.data(model.index(3, 2)) == "3:05"
+
+
+def test_details_are_written_to_the_shared_track_store(qtbot):
+    tracks = TrackStore(["/music/a.mp3", "/music/b.mp3"])
+    model = TrackListModel(tracks=tracks)
+    model.set_tracks(tracks.paths())
+
+    model.set_track_details({"/music/b.mp3": ("Song", "Artist", 61_000)}, {"/music/b.mp3": "Album"})
+
+    track = tracks[1]
+    assert (track.title, track.artist, track.album, track.duration_ms) == ("Song", "Artist", "Album", 61_000)
+    assert track.flags & TrackFlag.TAGS_READ
+    assert not tracks[0].flags & TrackFlag.TAGS_READ
+    assert model.data(model.index(1, 0)) == "Song"
+    assert model.data(model.index(1, 2)) == "1:01"
+
+    tracks.reorder([1, 0])
+    model.set_tracks(tracks.paths())
+
+    assert model.data(model.index(0, 1)) == "Artist"
+    assert model.data(model.index(1, 0)) == "a.mp3"
+
+
+def test_append_inserts_rows_without_resetting(qtbot):
+    model = TrackListModel()
+    model.set_tracks(_paths(3))
+    reset_spy = QSignalSpy(model.modelReset)
+    insert_spy = QSignalSpy(model.rowsInserted)
+
+    model.append_tracks(["/music/new.mp3"])
+
+    assert model.rowCount() == 4
+    assert len(reset_spy) == 0
+    assert len(insert_spy) == 1
+    assert model.data(model.index(3, 0), Qt.ItemDataRole.UserRole) == "/music/new.mp3"
+
+
+def test_move_rows_reorders_tracks(qtbot):
+    model = TrackListModel()
+    model.set_tracks(["a", "b", "c", "d"])
+
+    assert model.move_rows([0, 1], 4)
+    assert [model.track_path(row) for row in range(4)] == ["c", "d", "a", "b"]
+
+    assert model.move_rows([0, 2], 1)
+    assert [model.track_path(row) for row in range(4)] == ["c", "a", "d", "b"]
+
+
+def test_move_rows_reports_moved_tracks_and_their_new_position(qtbot):
+    model = TrackListModel()
+    model.set_tracks(["a", "b", "c", "d", "e"])
+    spy = QSignalSpy(model.rows_moved)
+
+    assert model.move_rows([0, 2], 4)
+
+    assert list(spy[0]) == [["a", "c"], 2]
+    assert model.track_path(2) == "a"
+
+
+def test_drop_past_the_last_row_moves_tracks_to_the_end_of_the_whole_list(qtbot):
+    model = TrackListModel()
+    paths = _paths(TrackListModel.FETCH_BATCH_SIZE * 2)
+    model.set_tracks(paths)
+    assert model.rowCount() < len(paths)
+
+    data = model.mimeData([model.index(0, 0), model.index(1, 0)])
+    assert model.dropMimeData(data, Qt.DropAction.MoveAction, -1, -1, QModelIndex())
+
+    assert model.rowCount() == TrackListModel.FETCH_BATCH_SIZE
+    assert model.track_path(0) == paths[2]
+    assert model.track_path(len(paths) - 2) == paths[0]
+    assert model.track_path(len(paths) - 1) == paths[1]
+
+
+def test_playlist_view_handles_large_lists_quickly(qtbot):
+    view = PlaylistView()
+    qtbot.addWidget(view)
+    view.resize(600, 400)
+    view.show()
+
+    started = time.perf_counter()
+    view.set_tracks(_paths(100_000))
+    view.set_current_index(75_000)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert view.current_index() == 75_000
+    assert view.model.rowCount() < 100_000
+
+
+def _index(paths):
+    index = TrigramIndex()
+    for path in paths:
+        index.add(path, (PurePath(path).stem,))
+    return index
+
+
+def test_sparse_filter_keeps_queue_order(qtbot):
+    paths = [f"/music/{'live' if index % 100 == 0 else 'studio'}-{index:04d}.mp3" for index in range(1_000)][::-1]
+    live_rows = [row for row, path in enumerate(paths) if "live" in path]
+    model = TrackListModel()
+    model.set_tracks(paths)
+
+    model.set_filter(_index(paths).search("live"))
+
+    assert model.rowCount() == 10
+    assert [model.source_row(row) for row in range(10)] == live_rows
+    assert model.track_path(0) == "/music/live-0900.mp3"
+    assert model.row_for_source(live_rows[3]) == 3
+    assert model.row_for_source(0) == -1
+    assert not model.flags(model.index(0, 0)) & Qt.ItemFlag.ItemIsDragEnabled
+    assert not model.move_rows([0], 2)
+
+    model.set_filter(None)
+
+    assert model.rowCount() == TrackListModel.FETCH_BATCH_SIZE
+    assert model.track_path(0) == paths[0]
+
+
+def test_dense_filter_scans_the_queue_lazily(qtbot):
+    paths = _paths(100_000)
+    model = TrackListModel()
+    model.set_tracks(paths)
+
+    model.set_filter(_index(paths).search("track"))
+
+    assert model.rowCount() == TrackListModel.FETCH_BATCH_SIZE
+    assert model.canFetchMore(QModelIndex())
+    assert model.row_for_source(75_000) == 75_000
+    assert model.track_path(75_000) == paths[75_000]
+
+
+def test_large_sparse_filter_is_walked_instead_of_sorted(qtbot):
+    paths = [f"/music/{'live' if index % 10 == 0 else 'studio'}-{index:05d}.mp3" for index in range(30_000)]
+    model = TrackListModel()
+    model.set_tracks(paths)
+
+    model.set_filter(_index(paths).search("live"))
+
+    assert model.canFetchMore(QModelIndex())
+    assert [model.track_path(row) for row in range(3)] == paths[0:30:10]
+    assert model.row_for_source(29_990) == 2_999
+
+
+def test_playlist_view_filters_by_path_then_by_tags(qtbot):
+    view = PlaylistView()
+    qtbot.addWidget(view)
+    view.set_tracks(["/music/Radiohead/OK Computer/01.mp3", "/music/Queen/Innuendo/01.mp3"])
+
+    qtbot.keyClicks(view.filter_edit, "radiohed")
+    qtbot.waitUntil(lambda: view.model.is_filtered(), timeout=1_000)
+
+    assert view.model.rowCount() == 1
+    assert view.model.track_path(0) == "/music/Radiohead/OK Computer/01.mp3"
+
+    view.set_track_details({"/music/Queen/Innuendo/01.mp3": ("The Show Must Go On", "Queen", 263_000)}, {})
+    view.filter_edit.setText("show must")
+    qtbot.waitUntil(lambda: view.model.track_path(0) == "/music/Queen/Innuendo/01.mp3", timeout=1_000)
+    view.set_current_index(1)
+
+    assert view.current_index() == 1
+
+
+def test_active_filter_is_reapplied_when_tags_arrive(qtbot):
+    view = PlaylistView()
+    qtbot.addWidget(view)
+    view.set_tracks(["/music/Radiohead/OK Computer/01.mp3", "/music/Queen/Innuendo/01.mp3"])
+    qtbot.keyClicks(view.filter_edit, "show must")
+    qtbot.waitUntil(lambda: view.model.is_filtered() and not view._filter_timer.isActive(), timeout=1_000)
+    assert view.model.rowCount() == 0
+
+    view.set_track_details({"/music/Queen/Innuendo/01.mp3": ("The Show Must Go On", "Queen", 263_000)}, {})
+
+    qtbot.waitUntil(lambda: view.model.rowCount() == 1, timeout=1_000)
+    assert view.model.track_path(0) == "/music/Queen/Innuendo/01.mp3"